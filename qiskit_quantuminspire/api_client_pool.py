@@ -0,0 +1,222 @@
+import asyncio
+import threading
+import weakref
+from contextlib import asynccontextmanager
+from types import TracebackType
+from typing import Any, AsyncContextManager, AsyncGenerator, AsyncIterator, Coroutine, Optional, Type, TypeVar, cast
+
+import aiohttp
+from compute_api_client import ApiClient, Configuration
+from qi2_shared.client import config
+from qi2_shared.utils import run_async
+
+T = TypeVar("T")
+
+# Enough connections for the default submission concurrency of several jobs at once
+DEFAULT_POOL_SIZE = 64
+# Idle connections are kept open long enough to span the interval between status polls
+DEFAULT_KEEPALIVE_TIMEOUT = 60.0
+
+
+class ApiClientPool:
+    """Long-lived API clients that keep their connections to the platform open between requests.
+
+    An aiohttp client is bound to the event loop it was created on, so the pool keeps one client per loop. Calls made
+    from synchronous code are run on an event loop owned by the pool, in a background thread, so they all share the
+    same client and its connections.
+
+    A client created on another event loop, e.g. by ``asyncio.run``, is closed when that loop shuts down its async
+    generators, which ``asyncio.run`` does before closing the loop.
+
+    A pool is created by :class:`QIProvider` and shared by its backends and their jobs. Close it with :meth:`close`,
+    or use it as a context manager, when it is no longer needed; a pool that is garbage collected, or still open when
+    the interpreter exits, stops its background thread.
+
+    Args:
+        configuration: The API configuration, the configuration of the CLI login when not given.
+        pool_size: Maximum number of simultaneous connections per client.
+        keepalive_timeout: Number of seconds an idle connection is kept open.
+    """
+
+    def __init__(
+        self,
+        configuration: Optional[Configuration] = None,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        keepalive_timeout: float = DEFAULT_KEEPALIVE_TIMEOUT,
+    ) -> None:
+        if pool_size < 1:
+            raise ValueError("pool_size must be at least 1")
+        self._configuration = configuration
+        self.pool_size = pool_size
+        self.keepalive_timeout = keepalive_timeout
+        self._clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, ApiClient] = weakref.WeakKeyDictionary()
+        # Close the clients of other event loops when those loops shut down
+        self._closers: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncGenerator[None, None]] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._loop_finalizer: Optional["weakref.finalize[..., ApiClientPool]"] = None
+        self._closed = False
+
+    def __enter__(self) -> "ApiClientPool":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    @property
+    def configuration(self) -> Configuration:
+        if self._configuration is None:
+            self._configuration = config()
+        return self._configuration
+
+    def _create_client(self) -> ApiClient:
+        api_client = ApiClient(self.configuration)
+        rest_client = api_client.rest_client
+        # Replace the session the REST client would create on first use with one that is sized and kept alive as
+        # configured, using the same TLS settings
+        rest_client.pool_manager = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=self.pool_size, keepalive_timeout=self.keepalive_timeout, ssl=rest_client.ssl_context
+            ),
+            trust_env=True,
+        )
+        return api_client
+
+    @asynccontextmanager
+    async def client(self) -> AsyncIterator[ApiClient]:
+        """Yield the client of the running event loop, creating it on first use.
+
+        Unlike a plain ``async with ApiClient(...)`` the client is not closed on exit, but kept for the next request.
+        """
+        if self._closed:
+            raise RuntimeError("ApiClientPool is closed")
+        loop = asyncio.get_running_loop()
+        closer = None
+        with self._lock:
+            api_client = self._clients.get(loop)
+            if api_client is None:
+                api_client = self._clients[loop] = self._create_client()
+                if loop is not self._loop:
+                    closer = self._closers[loop] = _close_on_shutdown(api_client)
+        if closer is not None:
+            # the first iteration registers the generator with the loop, which closes it on shutdown
+            await closer.__anext__()
+        yield api_client
+
+    def run(self, coroutine: Coroutine[Any, Any, T]) -> T:
+        """Run `coroutine` on the event loop of the pool and return its result, blocking until it is done."""
+        if self._closed:
+            coroutine.close()
+            raise RuntimeError("ApiClientPool is closed")
+        loop = self._background_loop()
+        if _running_loop() is loop:
+            coroutine.close()
+            raise RuntimeError("Can't block the event loop of the ApiClientPool, await the coroutine instead")
+        return asyncio.run_coroutine_threadsafe(coroutine, loop).result()
+
+    def _background_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=loop.run_forever, name="qiskit-quantuminspire-api-client", daemon=True
+                )
+                self._thread.start()
+                self._loop = loop
+                self._loop_finalizer = weakref.finalize(self, _stop_loop, loop, self._thread, self._clients)
+            return self._loop
+
+    def close(self) -> None:
+        """Close all clients and stop the event loop of the pool."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            clients = list(self._clients.items())
+            closers = dict(self._closers.items())
+            self._clients.clear()
+            self._closers.clear()
+            loop_finalizer = self._loop_finalizer
+            self._loop = self._thread = self._loop_finalizer = None
+
+        for client_loop, api_client in clients:
+            if client_loop.is_closed():
+                # closed on shutdown of the loop, or not closable anymore
+                continue
+            closer = closers.get(client_loop)
+            closing = closer.aclose() if closer is not None else api_client.close()
+            if client_loop.is_running():
+                future = asyncio.run_coroutine_threadsafe(closing, client_loop)
+                if client_loop is not _running_loop():
+                    future.result()
+            else:
+                client_loop.run_until_complete(closing)
+
+        if loop_finalizer is not None:
+            loop_finalizer()
+
+    async def aclose(self) -> None:
+        """Close all clients like :meth:`close`, without blocking the running event loop."""
+        # The client of the running loop is closed from the worker thread while this loop keeps running
+        await asyncio.to_thread(self.close)
+
+
+def open_pool(pool: Any) -> Optional[ApiClientPool]:
+    """Return `pool` if it is an :class:`ApiClientPool` that is still open, ``None`` otherwise."""
+    return pool if isinstance(pool, ApiClientPool) and not pool.closed else None
+
+
+def pooled_api_client(pool: Optional[ApiClientPool]) -> AsyncContextManager[ApiClient]:
+    """Return the client of `pool`, or else a new client that is closed after use."""
+    pool = open_pool(pool)
+    return pool.client() if pool is not None else ApiClient(config())
+
+
+def run_pooled(pool: Optional[ApiClientPool], coroutine: Coroutine[Any, Any, T]) -> T:
+    """Run `coroutine` to completion, on the event loop of `pool` if it is open."""
+    pool = open_pool(pool)
+    return pool.run(coroutine) if pool is not None else cast(T, run_async(coroutine))
+
+
+async def _close_on_shutdown(api_client: ApiClient) -> AsyncGenerator[None, None]:
+    """Close `api_client` when the generator is closed, by the pool or by the shutdown of its event loop."""
+    try:
+        yield
+    finally:
+        await api_client.close()
+
+
+def _stop_loop(
+    loop: asyncio.AbstractEventLoop,
+    thread: threading.Thread,
+    clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, ApiClient]",
+) -> None:
+    """Close the client of the background `loop` of a pool, if it is still open, and stop the loop and its thread."""
+    if loop.is_closed():
+        return
+    api_client = clients.pop(loop, None)
+    if api_client is not None:
+        asyncio.run_coroutine_threadsafe(api_client.close(), loop).result()
+    loop.call_soon_threadsafe(loop.stop)
+    if thread is not threading.current_thread():
+        thread.join()
+        loop.close()
+
+
+def _running_loop() -> Optional[asyncio.AbstractEventLoop]:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
@@ -0,0 +1,124 @@
+from typing import Dict, List, Mapping, Optional, Sequence
+
+import numpy as np
+from qiskit.primitives import BitArray
+
+# Bitstrings up to this width are packed into unsigned 64-bit integers, wider ones are kept as Python integers.
+MAX_PACKED_WIDTH = 64
+
+
+def _bit_matrix(bitstrings: Sequence[str]) -> Optional[np.ndarray]:
+    """Return the bits of equally wide bitstrings as a (bitstrings, width) uint8 matrix, or None for mixed widths."""
+    widths = set(map(len, bitstrings))
+    if len(widths) != 1:
+        return None
+    width = widths.pop()
+    try:
+        characters = np.frombuffer("".join(bitstrings).encode("ascii"), dtype=np.uint8)
+    except UnicodeEncodeError as exc:
+        raise ValueError("Bitstrings may only contain '0' and '1'") from exc
+    bits = characters.reshape(len(bitstrings), width) - np.uint8(ord("0"))
+    if bits.size and bits.max() > 1:
+        raise ValueError("Bitstrings may only contain '0' and '1'")
+    return bits
+
+
+def _pack_rows(bits: np.ndarray, num_bytes: int) -> np.ndarray:
+    """Pack every row of a bit matrix into `num_bytes` big-endian bytes, left-padding it with zeros."""
+    padded = np.zeros((bits.shape[0], 8 * num_bytes), dtype=np.uint8)
+    padded[:, 8 * num_bytes - bits.shape[1] :] = bits
+    # Rows are whole bytes, so packing the flattened array is equivalent to packing per row, and much faster
+    return np.packbits(padded.ravel()).reshape(bits.shape[0], num_bytes)
+
+
+def bitstrings_to_ints(bitstrings: Sequence[str]) -> np.ndarray:
+    """Convert bitstrings, most significant bit first, to an array of integers.
+
+    Bitstrings of equal width are converted in bulk, as is the case for all measurements of a circuit.
+
+    Args:
+        bitstrings: Strings of ``"0"`` and ``"1"`` characters.
+
+    Returns:
+        An array of ``uint64`` when the bitstrings have the same width of at most 64 bits, an array of Python
+        integers otherwise.
+
+    Raises:
+        ValueError: If a bitstring contains characters other than ``"0"`` and ``"1"``.
+    """
+    if len(bitstrings) == 0:
+        return np.zeros(0, dtype=np.uint64)
+    bits = _bit_matrix(bitstrings)
+    if bits is None or bits.shape[1] == 0 or bits.shape[1] > MAX_PACKED_WIDTH:
+        result = np.empty(len(bitstrings), dtype=object)
+        result[:] = [int(bitstring, 2) for bitstring in bitstrings]
+        return result
+
+    # Pack to the smallest integer size that fits, so the bytes of a row read as one big-endian unsigned integer
+    num_bytes = next(size for size in (1, 2, 4, 8) if 8 * size >= bits.shape[1])
+    return _pack_rows(bits, num_bytes).view(f">u{num_bytes}").ravel().astype(np.uint64)
+
+
+def bitstrings_to_bits(bitstrings: Sequence[str]) -> np.ndarray:
+    """Return the bits of equally wide bitstrings as a (bitstrings, width) ``uint8`` matrix.
+
+    Column ``i`` holds bit ``i``, the ``i``-th character from the right, like the classical bits of a circuit.
+
+    Raises:
+        ValueError: If the bitstrings are not equally wide or contain characters other than ``"0"`` and ``"1"``.
+    """
+    if len(bitstrings) == 0:
+        return np.zeros((0, 0), dtype=np.uint8)
+    bits = _bit_matrix(bitstrings)
+    if bits is None:
+        raise ValueError("Bitstrings must all have the same width")
+    return bits[:, ::-1]
+
+
+def bitstrings_to_bit_array(bitstrings: Sequence[str], num_bits: Optional[int] = None) -> BitArray:
+    """Pack bitstrings of equal width into a :class:`~qiskit.primitives.BitArray`, one shot per bitstring.
+
+    Every shot takes ``ceil(num_bits / 8)`` bytes, instead of a Python string per shot.
+
+    Args:
+        bitstrings: Strings of ``"0"`` and ``"1"`` characters, all of the same width.
+        num_bits: Number of bits per shot, the width of the bitstrings when not given. Bitstrings narrower than
+            this are padded with zeros.
+
+    Raises:
+        ValueError: If the bitstrings are not equally wide, are wider than `num_bits` or contain characters other
+            than ``"0"`` and ``"1"``.
+    """
+    if len(bitstrings) == 0:
+        num_bits = num_bits or 0
+        return BitArray(np.zeros((0, (num_bits + 7) // 8), dtype=np.uint8), num_bits)
+    bits = _bit_matrix(bitstrings)
+    if bits is None:
+        raise ValueError("Bitstrings must all have the same width")
+    num_bits = bits.shape[1] if num_bits is None else num_bits
+    if bits.shape[1] > num_bits:
+        raise ValueError(f"Bitstrings of width {bits.shape[1]} don't fit in {num_bits} bits")
+    return BitArray(_pack_rows(bits, (num_bits + 7) // 8), num_bits)
+
+
+def ints_to_hex(values: np.ndarray) -> List[str]:
+    """Format integers as ``"0x..."`` strings, like :func:`hex`.
+
+    Every distinct value is formatted once, which makes this fast for shot data, where the number of distinct
+    outcomes is typically far below the number of shots.
+    """
+    if len(values) == 0:
+        return []
+    unique_values, inverse = np.unique(values, return_inverse=True)
+    unique_hex = np.array([hex(int(value)) for value in unique_values], dtype=object)
+    return list(unique_hex[inverse.ravel()].tolist())
+
+
+def bitstrings_to_hex(bitstrings: Sequence[str]) -> List[str]:
+    """Convert bitstrings to ``"0x..."`` strings, like ``hex(int(bitstring, 2))`` for every bitstring."""
+    return ints_to_hex(bitstrings_to_ints(bitstrings))
+
+
+def counts_to_hex(counts: Mapping[str, int]) -> Dict[str, int]:
+    """Convert the bitstring keys of `counts` to ``"0x..."`` keys, like ``hex(int(key, 2))`` for every key."""
+    return dict(zip(bitstrings_to_hex(list(counts)), counts.values()))
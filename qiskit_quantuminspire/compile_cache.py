@@ -0,0 +1,300 @@
+import hashlib
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union, cast
+
+import numpy as np
+import qiskit
+from qiskit import qpy, transpile
+from qiskit.circuit import ControlFlowOp, Instruction, ParameterExpression, QuantumCircuit
+from qiskit.circuit.library import UnitaryGate, get_standard_gate_name_mapping
+from qiskit.exceptions import QiskitError
+from qiskit.providers.backend import BackendV2
+from qiskit.transpiler import Target
+
+from qiskit_quantuminspire import cqasm
+
+DEFAULT_MAX_ENTRIES = 1024
+
+# The transpiled circuit (if cached) and the cQASM text of a cache entry
+_Entry = Tuple[Optional[QuantumCircuit], str]
+
+
+def _package_version() -> str:
+    try:
+        return version("qiskit-quantuminspire")
+    except PackageNotFoundError:  # pragma: no cover
+        return "unknown"
+
+
+# Compiled output depends on the versions of both the transpiler and the cQASM writer, so they are part of every key.
+_VERSION_SALT = f"qiskit={qiskit.__version__};qiskit-quantuminspire={_package_version()}"
+
+
+# Operations that are fully identified by their name and parameters
+_STANDARD_OPERATIONS = {name: type(operation) for name, operation in get_standard_gate_name_mapping().items()}
+
+
+def _format_param(param: Any) -> str:
+    if isinstance(param, QuantumCircuit):
+        # control flow operations carry their bodies as parameters
+        return circuit_fingerprint(param)
+    if isinstance(param, ParameterExpression):
+        return f"expr:{param}"
+    if hasattr(param, "dtype"):
+        array = np.asarray(param)
+        if array.ndim == 0:
+            return repr(array.item())
+        # e.g. the matrix of a UnitaryGate
+        content = hashlib.sha256(np.ascontiguousarray(array).tobytes()).hexdigest()
+        return f"array:{array.shape}:{array.dtype}:{content}"
+    return repr(param)
+
+
+def _has_own_definition(operation: Instruction) -> bool:
+    """Whether `operation` is identified by its definition, e.g. a gate made with ``QuantumCircuit.to_gate()``."""
+    if _STANDARD_OPERATIONS.get(operation.name) is type(operation):
+        return False
+    # the bodies of control flow operations and the matrix of a unitary are already part of their parameters
+    return not isinstance(operation, (ControlFlowOp, UnitaryGate)) and operation.definition is not None
+
+
+def circuit_fingerprint(circuit: QuantumCircuit) -> str:
+    """Return a hash of the structure of `circuit`.
+
+    Two circuits have the same fingerprint when they have the same registers and the same sequence of operations,
+    applied to the same qubit and bit indices with the same parameters. The name and metadata of the circuit are not
+    part of the fingerprint.
+    """
+    digest = hashlib.sha256()
+
+    def update(*parts: str) -> None:
+        for part in parts:
+            digest.update(part.encode())
+            digest.update(b"\0")
+
+    update(str(circuit.num_qubits), str(circuit.num_clbits), _format_param(circuit.global_phase))
+    for register in circuit.qregs:
+        update("q", register.name, str(register.size))
+    for register in circuit.cregs:
+        update("c", register.name, str(register.size))
+
+    qubit_indices = {qubit: index for index, qubit in enumerate(circuit.qubits)}
+    clbit_indices = {clbit: index for index, clbit in enumerate(circuit.clbits)}
+    for instruction in circuit.data:
+        operation = instruction.operation
+        update(
+            operation.name,
+            ",".join(str(qubit_indices[qubit]) for qubit in instruction.qubits),
+            ",".join(str(clbit_indices[clbit]) for clbit in instruction.clbits),
+            *(_format_param(param) for param in operation.params),
+        )
+        unit = getattr(operation, "unit", None)
+        if unit is not None:
+            update(unit)
+        # custom gates with the same name can have different bodies
+        if _has_own_definition(operation):
+            update("definition", circuit_fingerprint(operation.definition))
+    return digest.hexdigest()
+
+
+def target_fingerprint(target: Target) -> str:
+    """Return a hash of the instructions and connectivity of `target`."""
+    digest = hashlib.sha256()
+    digest.update(f"{target.num_qubits}\0".encode())
+    for name in sorted(target.operation_names):
+        qargs = target.qargs_for_operation_name(name)
+        digest.update(f"{name}:{sorted(qargs) if qargs is not None else None}\0".encode())
+    return digest.hexdigest()
+
+
+@dataclass(frozen=True)
+class CompiledCircuit:
+    """A transpiled circuit and its cQASM text."""
+
+    circuit: QuantumCircuit
+    cqasm: str
+
+
+@dataclass(frozen=True)
+class CompileCacheStats:
+    hits: int
+    misses: int
+    disk_hits: int
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class CompileCache:
+    """Two-level cache of compiled circuits, keyed on a structural fingerprint of the circuit.
+
+    :meth:`compile` maps a circuit and a backend to the transpiled circuit and its cQASM text; :meth:`dumps_many`
+    caches only the cQASM text of circuits that are already transpiled. Entries are kept in memory, evicted in
+    least-recently-used order once `max_entries` is exceeded. When `path` is given, every entry is also written to
+    that directory, so later processes can skip compilation as well.
+
+    Pass the cache to a backend with ``backend.set_options(compile_cache=cache)`` to reuse the cQASM of circuits
+    compiled before when submitting them.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, path: Optional[Union[str, Path]] = None) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self.path = Path(path).expanduser() if path is not None else None
+        self._circuits: OrderedDict[str, Optional[QuantumCircuit]] = OrderedDict()
+        self._cqasm: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._disk_hits = 0
+
+    @property
+    def stats(self) -> CompileCacheStats:
+        with self._lock:
+            return CompileCacheStats(hits=self._hits, misses=self._misses, disk_hits=self._disk_hits)
+
+    def __len__(self) -> int:
+        return len(self._cqasm)
+
+    @staticmethod
+    def _key(*parts: str) -> str:
+        digest = hashlib.sha256(_VERSION_SALT.encode())
+        for part in parts:
+            digest.update(b"\0")
+            digest.update(part.encode())
+        return digest.hexdigest()
+
+    def compile(self, circuit: QuantumCircuit, backend: BackendV2, **transpile_options: Any) -> CompiledCircuit:
+        """Transpile `circuit` for `backend` and convert it to cQASM, unless it was compiled before.
+
+        Args:
+            circuit: The circuit to compile.
+            backend: The backend to compile for.
+            transpile_options: Passed on to :func:`qiskit.transpile`, and part of the cache key.
+
+        Returns:
+            The transpiled circuit, named after `circuit` and carrying its metadata, and its cQASM text.
+        """
+        options = ",".join(f"{name}={transpile_options[name]!r}" for name in sorted(transpile_options))
+        key = self._key("compile", circuit_fingerprint(circuit), target_fingerprint(backend.target), options)
+        entry = self._get(key, with_circuit=True)
+        if entry is None:
+            transpiled = transpile(circuit, backend=backend, **transpile_options)
+            content = cqasm.dumps(transpiled)
+            self._put(key, content, transpiled)
+            # the transpiled circuit is what ends up being submitted, so its cQASM is cached on its own as well
+            self._put(self._key("cqasm", circuit_fingerprint(transpiled)), content)
+        else:
+            # entries looked up with_circuit always have one
+            transpiled, content = cast(Tuple[QuantumCircuit, str], entry)
+
+        result = transpiled.copy(name=circuit.name)
+        result.metadata = dict(circuit.metadata or {})
+        return CompiledCircuit(result, content)
+
+    def dumps_many(self, circuits: Iterable[QuantumCircuit], workers: Optional[int] = None) -> List[str]:
+        """Convert `circuits` to cQASM like :func:`cqasm.dumps_many`, only converting circuits not seen before."""
+        circuits = list(circuits)
+        keys = [self._key("cqasm", circuit_fingerprint(circuit)) for circuit in circuits]
+        found: Dict[str, str] = {}
+        # identical circuits in the batch are converted only once
+        missing: Dict[str, QuantumCircuit] = {}
+        for key, circuit in zip(keys, circuits):
+            if key in found or key in missing:
+                with self._lock:
+                    self._hits += 1
+                continue
+            entry = self._get(key, with_circuit=False)
+            if entry is None:
+                missing[key] = circuit
+            else:
+                found[key] = entry[1]
+
+        for key, content in zip(missing, cqasm.dumps_many(list(missing.values()), workers)):
+            self._put(key, content)
+            found[key] = content
+        return [found[key] for key in keys]
+
+    def clear(self) -> None:
+        """Remove all entries, including the ones stored on disk, and reset the statistics."""
+        with self._lock:
+            self._circuits.clear()
+            self._cqasm.clear()
+            self._hits = self._misses = self._disk_hits = 0
+        if self.path is not None and self.path.is_dir():
+            for entry in self.path.iterdir():
+                if entry.suffix in (".qpy", ".cqasm"):
+                    entry.unlink(missing_ok=True)
+
+    def _get(self, key: str, with_circuit: bool) -> Optional[_Entry]:
+        with self._lock:
+            content = self._cqasm.get(key)
+            circuit = self._circuits.get(key)
+            if content is not None and (circuit is not None or not with_circuit):
+                self._circuits.move_to_end(key)
+                self._hits += 1
+                return circuit, content
+
+        loaded = self._load(key, with_circuit)
+        with self._lock:
+            if loaded is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+            self._disk_hits += 1
+        self._put(key, loaded[1], loaded[0], persist=False)
+        return loaded
+
+    def _put(self, key: str, content: str, circuit: Optional[QuantumCircuit] = None, persist: bool = True) -> None:
+        with self._lock:
+            self._cqasm[key] = content
+            if circuit is not None or key not in self._circuits:
+                self._circuits[key] = circuit
+            self._circuits.move_to_end(key)
+            while len(self._circuits) > self.max_entries:
+                evicted, _ = self._circuits.popitem(last=False)
+                del self._cqasm[evicted]
+        if persist and self.path is not None:
+            self._store(key, content, circuit)
+
+    def _load(self, key: str, with_circuit: bool) -> Optional[_Entry]:
+        if self.path is None:
+            return None
+        try:
+            content = (self.path / f"{key}.cqasm").read_text()
+            circuit: Optional[QuantumCircuit] = None
+            if with_circuit:
+                with open(self.path / f"{key}.qpy", "rb") as file:
+                    circuit = qpy.load(file)[0]
+        except (OSError, ValueError, QiskitError):
+            # A missing or corrupt entry only costs a recompilation
+            return None
+        return circuit, content
+
+    def _store(self, key: str, content: str, circuit: Optional[QuantumCircuit]) -> None:
+        assert self.path is not None
+        self.path.mkdir(parents=True, exist_ok=True)
+        # The circuit is written before the cQASM, so an entry is only visible to readers once it is complete
+        if circuit is not None:
+            self._write_atomic(self.path / f"{key}.qpy", lambda file: qpy.dump(circuit, file))
+        self._write_atomic(self.path / f"{key}.cqasm", lambda file: file.write(content.encode()))
+
+    @staticmethod
+    def _write_atomic(path: Path, write: Callable[[Any], Any]) -> None:
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                write(file)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
@@ -1,15 +1,130 @@
-from typing import Any
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from math import tau
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
 
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
 from opensquirrel import CircuitBuilder
+from opensquirrel.common import ATOL, normalize_angle
+from opensquirrel.default_instructions import default_bsr_with_angle_param_set, default_bsr_without_params_set
 from opensquirrel.ir import Bit, Qubit
 from opensquirrel.writer import writer
 from qiskit import QuantumCircuit
-from qiskit.circuit import CircuitInstruction
+from qiskit.circuit import CircuitInstruction, Parameter, ParameterExpression
 
 from qiskit_quantuminspire.mapping.instruction_mapping import InstructionMapping
 
 _INSTRUCTION_MAPPING = InstructionMapping()
 
+# Writes a single Qiskit instruction as one or more lines of cQASM
+_NativeWriter = Callable[[CircuitInstruction], str]
+# Writes a single Qiskit instruction with one angle parameter as the cQASM text before and after the angle
+_AngleTemplateWriter = Callable[[CircuitInstruction], Tuple[str, str]]
+
+
+def _format_angle(angle: Any) -> str:
+    # Same normalization and precision as the opensquirrel IR and writer
+    return f"{normalize_angle(angle):.8}"
+
+
+def _bsr_no_params_writer(name: str) -> _NativeWriter:
+    return lambda instruction: f"{name} q[{instruction.qubits[0]._index}]\n"
+
+
+def _bsr_angle_param_template(name: str) -> _AngleTemplateWriter:
+    return lambda instruction: (f"{name}(", f") q[{instruction.qubits[0]._index}]\n")
+
+
+def _template_cr(instruction: CircuitInstruction) -> Tuple[str, str]:
+    return "CR(", f") q[{instruction.qubits[0]._index}], q[{instruction.qubits[1]._index}]\n"
+
+
+def _angle_param_writer(template: _AngleTemplateWriter) -> _NativeWriter:
+    def write(instruction: CircuitInstruction) -> str:
+        prefix, suffix = template(instruction)
+        return f"{prefix}{_format_angle(instruction.operation.params[0])}{suffix}"
+
+    return write
+
+
+def _two_qubit_gate_writer(name: str) -> _NativeWriter:
+    return lambda instruction: f"{name} q[{instruction.qubits[0]._index}], q[{instruction.qubits[1]._index}]\n"
+
+
+def _write_measure(instruction: CircuitInstruction) -> str:
+    return f"b[{instruction.clbits[0]._index}] = measure q[{instruction.qubits[0]._index}]\n"
+
+
+def _write_reset(instruction: CircuitInstruction) -> str:
+    return f"reset q[{instruction.qubits[0]._index}]\n"
+
+
+def _write_barrier(instruction: CircuitInstruction) -> str:
+    # Opensquirrel does not support multi-qubit barriers.
+    return "".join(f"barrier q[{qubit._index}]\n" for qubit in instruction.qubits)
+
+
+def _write_wait(instruction: CircuitInstruction) -> str:
+    if instruction.operation.unit != "dt":
+        # Let the opensquirrel path report the unsupported unit
+        raise ValueError(instruction.operation.unit)
+    return f"wait({int(instruction.operation.params[0])}) q[{instruction.qubits[0]._index}]\n"
+
+
+def _write_asm(instruction: CircuitInstruction) -> str:
+    backend_name, backend_code = instruction.operation.params
+    return f"asm({backend_name}) '''{backend_code}'''\n"
+
+
+def _build_angle_templates(mapping: InstructionMapping) -> Dict[str, _AngleTemplateWriter]:
+    """Build the table dispatching Qiskit instruction names with a single angle parameter to template writers."""
+    templates_by_opensquirrel_name: Dict[str, _AngleTemplateWriter] = {"CR": _template_cr}
+    for name, angle_param_gate in default_bsr_with_angle_param_set.items():
+        templates_by_opensquirrel_name[name] = _bsr_angle_param_template(angle_param_gate(0, 0.0).name)
+
+    templates: Dict[str, _AngleTemplateWriter] = {}
+    for qiskit_name in mapping.supported_qiskit_instructions():
+        opensquirrel_name = mapping.qiskit_to_opensquirrel(qiskit_name)
+        if opensquirrel_name in templates_by_opensquirrel_name:
+            templates[qiskit_name] = templates_by_opensquirrel_name[opensquirrel_name]
+    return templates
+
+
+def _build_native_writers(
+    mapping: InstructionMapping, angle_templates: Dict[str, _AngleTemplateWriter]
+) -> Dict[str, _NativeWriter]:
+    """Build the table dispatching Qiskit instruction names to native writers.
+
+    Instructions that are mapped to an opensquirrel instruction without a native writer are left out, so they take
+    the opensquirrel path.
+    """
+    writers_by_opensquirrel_name: Dict[str, _NativeWriter] = {
+        "CNOT": _two_qubit_gate_writer("CNOT"),
+        "CZ": _two_qubit_gate_writer("CZ"),
+        "SWAP": _two_qubit_gate_writer("SWAP"),
+        "measure": _write_measure,
+        "reset": _write_reset,
+        "barrier": _write_barrier,
+        "wait": _write_wait,
+    }
+    for name, no_params_gate in default_bsr_without_params_set.items():
+        writers_by_opensquirrel_name[name] = _bsr_no_params_writer(no_params_gate(0).name)
+
+    writers: Dict[str, _NativeWriter] = {"asm": _write_asm}
+    for qiskit_name in mapping.supported_qiskit_instructions():
+        opensquirrel_name = mapping.qiskit_to_opensquirrel(qiskit_name)
+        if opensquirrel_name in writers_by_opensquirrel_name:
+            writers[qiskit_name] = writers_by_opensquirrel_name[opensquirrel_name]
+    for qiskit_name, template in angle_templates.items():
+        writers[qiskit_name] = _angle_param_writer(template)
+    return writers
+
+
+_ANGLE_TEMPLATES = _build_angle_templates(_INSTRUCTION_MAPPING)
+_NATIVE_WRITERS = _build_native_writers(_INSTRUCTION_MAPPING, _ANGLE_TEMPLATES)
+
 
 def _add_instruction(builder: CircuitBuilder, circuit_instruction: Any) -> None:
     operation = circuit_instruction.operation
@@ -30,8 +145,46 @@ def _add_instruction(builder: CircuitBuilder, circuit_instruction: Any) -> None:
         )
 
 
-def dumps(circuit: QuantumCircuit) -> str:
-    """Return the cQASM representation of the circuit."""
+def _header_lines(circuit: QuantumCircuit) -> List[str]:
+    num_qubits = circuit.num_qubits
+    num_clbits = circuit.num_clbits
+    lines = ["version 3.0"]
+    if num_qubits > 0 or num_clbits > 0:
+        lines.append("\n\n")
+    if num_qubits > 0:
+        lines.append(f"qubit[{num_qubits}] q")
+    if num_qubits > 0 and num_clbits > 0:
+        lines.append("\n")
+    if num_clbits > 0:
+        lines.append(f"bit[{num_clbits}] b")
+    lines.append("\n\n")
+    return lines
+
+
+def _dumps_native(circuit: QuantumCircuit) -> Optional[str]:
+    """Return the cQASM representation of the circuit, written directly from the Qiskit instructions.
+
+    Produces the same text as :func:`_dumps_opensquirrel` without building the opensquirrel IR. Returns ``None`` when
+    the circuit contains anything the native writers do not handle, such as unsupported instructions or unbound
+    parameters.
+    """
+    lines = _header_lines(circuit)
+    writers = _NATIVE_WRITERS
+    try:
+        for circuit_instruction in circuit.data:
+            native_writer = writers.get(circuit_instruction.operation.name)
+            if native_writer is None:
+                return None
+            lines.append(native_writer(circuit_instruction))
+    except (TypeError, ValueError):
+        return None
+
+    # Remove all trailing lines and leave only one, like the opensquirrel writer
+    return "".join(lines).rstrip() + "\n"
+
+
+def _dumps_opensquirrel(circuit: QuantumCircuit) -> str:
+    """Return the cQASM representation of the circuit, built through the opensquirrel IR."""
     builder = CircuitBuilder(circuit.num_qubits, circuit.num_clbits)
     for circuit_instruction in circuit.data:
         operation = circuit_instruction.operation
@@ -56,3 +209,166 @@ def dumps(circuit: QuantumCircuit) -> str:
     cqasm: str = writer.circuit_to_string(builder.to_circuit())
 
     return cqasm
+
+
+def dumps(circuit: QuantumCircuit) -> str:
+    """Return the cQASM representation of the circuit."""
+    cqasm = _dumps_native(circuit)
+    if cqasm is None:
+        # The opensquirrel path either handles the circuit, or raises a descriptive error
+        cqasm = _dumps_opensquirrel(circuit)
+    return cqasm
+
+
+def dumps_many(circuits: Sequence[QuantumCircuit], workers: Optional[int] = None) -> List[str]:
+    """Return the cQASM representation of each circuit, converting them in parallel in a pool of worker processes.
+
+    Starting worker processes takes some time, so this only pays off for large batches or deep circuits.
+
+    Args:
+        circuits: The circuits to convert.
+        workers: Number of worker processes, ``None`` for one per CPU. With a single worker the circuits are converted
+            in the calling process.
+
+    Returns:
+        The cQASM strings, in the order of `circuits`.
+    """
+    workers = min(workers if workers is not None else (os.cpu_count() or 1), len(circuits))
+    if workers <= 1:
+        return [dumps(circuit) for circuit in circuits]
+
+    # A few chunks per worker amortizes the pickling overhead while keeping the workers evenly loaded
+    chunksize = max(1, len(circuits) // (workers * 4))
+    # Circuits are converted from a worker thread while other threads, e.g. the event loop of a client pool, hold
+    # locks; forking then could copy a held lock into a worker, so the workers are started as fresh processes
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as executor:
+        return list(executor.map(dumps, circuits, chunksize=chunksize))
+
+
+def _normalize_angles(angles: NDArray[np.float64]) -> NDArray[np.float64]:
+    """Vectorized :func:`normalize_angle`, giving the same result for every element."""
+    normalized = angles - tau * (np.floor_divide(angles, tau) + 1)
+    normalized = np.where(
+        normalized < -tau / 2 + ATOL,
+        normalized + tau,
+        np.where(normalized > tau / 2, normalized - tau, normalized),
+    )
+    return normalized
+
+
+class CqasmTemplate:
+    """The cQASM representation of a parameterized circuit, with slots for the values of its parameters.
+
+    Create templates with :func:`compile_template`. Binding values only evaluates and formats the angles in the
+    slots, the rest of the cQASM text is written once. The result is identical to calling :func:`dumps` on the
+    circuit with the parameters assigned.
+    """
+
+    def __init__(
+        self, circuit: QuantumCircuit, segments: Optional[List[str]], slots: List[ParameterExpression]
+    ) -> None:
+        self.circuit = circuit
+        self.parameters: Tuple[Parameter, ...] = tuple(circuit.parameters)
+        self._slots = slots
+        # Circuits the native writers can't handle have no segments, they are bound and converted one by one
+        self._format = (
+            None
+            if segments is None
+            else "{}".join(segment.replace("{", "{{").replace("}", "}}") for segment in segments)
+        )
+
+    def bind(self, values: Mapping[Parameter, float]) -> str:
+        """Return the cQASM representation of the circuit with the given value for each parameter."""
+        return self.bind_many({parameter: [value] for parameter, value in values.items()})[0]
+
+    def bind_many(self, values: Mapping[Parameter, ArrayLike]) -> List[str]:
+        """Return the cQASM representation of the circuit for each set of parameter values.
+
+        Args:
+            values: The values of each parameter, all sequences having the same length.
+
+        Returns:
+            The cQASM strings, one for every index in the sequences of values.
+        """
+        columns = self._columns(values)
+        num_bindings = len(next(iter(columns.values()))) if columns else 1
+
+        if self._format is None:
+            return [
+                dumps(
+                    self.circuit.assign_parameters({parameter: column[index] for parameter, column in columns.items()})
+                )
+                for index in range(num_bindings)
+            ]
+
+        formatted_slots = [
+            [f"{angle:.8}" for angle in _normalize_angles(self._evaluate(slot, columns, num_bindings)).tolist()]
+            for slot in self._slots
+        ]
+        template = self._format
+        return (
+            [template.format(*angles) for angles in zip(*formatted_slots)]
+            if formatted_slots
+            else [template] * num_bindings
+        )
+
+    def _columns(self, values: Mapping[Parameter, ArrayLike]) -> Dict[Parameter, NDArray[np.float64]]:
+        unknown = set(values) - set(self.parameters)
+        if unknown:
+            raise ValueError(f"Circuit has no parameters {sorted(parameter.name for parameter in unknown)}")
+        missing = set(self.parameters) - set(values)
+        if missing:
+            raise ValueError(f"No values for parameters {sorted(parameter.name for parameter in missing)}")
+
+        columns = {
+            parameter: np.atleast_1d(np.asarray(values[parameter], dtype=float)) for parameter in self.parameters
+        }
+        if len({column.shape for column in columns.values()}) > 1 or any(
+            column.ndim != 1 for column in columns.values()
+        ):
+            raise ValueError("All parameters must have the same number of values")
+        return columns
+
+    @staticmethod
+    def _evaluate(
+        slot: ParameterExpression,
+        columns: Dict[Parameter, NDArray[np.float64]],
+        num_bindings: int,
+    ) -> NDArray[np.float64]:
+        if isinstance(slot, Parameter):
+            return columns[slot]
+        # Expressions are evaluated by Qiskit, like when assigning the parameters to the circuit
+        return np.array(
+            [
+                float(slot.bind({parameter: columns[parameter][index] for parameter in slot.parameters}).numeric())
+                for index in range(num_bindings)
+            ]
+        )
+
+
+def compile_template(circuit: QuantumCircuit) -> CqasmTemplate:
+    """Return a cQASM template for `circuit`, with a slot for every angle that depends on a parameter."""
+    segments: List[str] = []
+    slots: List[ParameterExpression] = []
+    lines = _header_lines(circuit)
+    try:
+        for circuit_instruction in circuit.data:
+            name = circuit_instruction.operation.name
+            params = circuit_instruction.operation.params
+            if name in _ANGLE_TEMPLATES and isinstance(params[0], ParameterExpression) and params[0].parameters:
+                prefix, suffix = _ANGLE_TEMPLATES[name](circuit_instruction)
+                lines.append(prefix)
+                segments.append("".join(lines))
+                slots.append(params[0])
+                lines = [suffix]
+                continue
+
+            native_writer = _NATIVE_WRITERS.get(name)
+            if native_writer is None:
+                return CqasmTemplate(circuit, None, [])
+            lines.append(native_writer(circuit_instruction))
+    except (TypeError, ValueError):
+        return CqasmTemplate(circuit, None, [])
+
+    segments.append("".join(lines).rstrip() + "\n")
+    return CqasmTemplate(circuit, segments, slots)
@@ -1,5 +1,4 @@
 from datetime import datetime
-from functools import cache
 from typing import Any, List, Union, cast
 
 from compute_api_client import Result as RawJobResult
@@ -56,6 +55,8 @@ class QIHybridJob(QIBaseJob):
                 raw_data=result.raw_data,
             )
 
-    @cache
     def result(self) -> Result:
-        return self._process_results()
+        with self._result_lock:
+            if self._final_result is None:
+                self._final_result = self._process_results()
+            return self._final_result
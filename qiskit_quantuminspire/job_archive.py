@@ -0,0 +1,190 @@
+import io
+import json
+import zipfile
+from dataclasses import dataclass
+from pathlib import Path
+from types import TracebackType
+from typing import Iterable, Iterator, List, Optional, Tuple, Type, Union, cast
+
+import numpy as np
+from compute_api_client import Result as RawJobResult
+from qiskit import qpy
+from qiskit.circuit import QuantumCircuit
+
+from qiskit_quantuminspire.result_cache import CachedResult
+
+# Stands in for ids that were not assigned, e.g. of jobs that were never submitted
+_NO_ID = -1
+
+
+@dataclass(frozen=True)
+class ArchivedJob:
+    """The circuits, platform ids and (optionally) results of a job, as stored in a job archive."""
+
+    backend_name: str
+    backend_id: int
+    batch_job_id: Optional[int]
+    circuits: List[QuantumCircuit]
+    job_ids: List[Optional[int]]
+    results: Optional[List[CachedResult]] = None
+
+
+def write_job_archive(file_path: Union[str, Path], jobs: Iterable[ArchivedJob]) -> None:
+    """Write `jobs` to a single compressed archive, which :class:`JobArchive` reads back one job at a time.
+
+    The archive is a zip file holding the QPY circuits of every job, its results as JSON when present, and a columnar
+    index of the backends, batch job ids and job ids of all jobs, so the ids can be read without loading any circuit.
+
+    Args:
+        file_path: The archive to write, replacing an existing file.
+        jobs: The jobs to store.
+    """
+    backends: List[Tuple[str, int]] = []
+    backend_indices: List[int] = []
+    batch_job_ids: List[int] = []
+    job_ids: List[int] = []
+    circuit_offsets = [0]
+    has_results: List[bool] = []
+
+    with zipfile.ZipFile(file_path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for index, job in enumerate(jobs):
+            if len(job.circuits) == 0:
+                raise ValueError("No circuits to serialize")
+            backend = (job.backend_name, job.backend_id)
+            if backend not in backends:
+                backends.append(backend)
+            backend_indices.append(backends.index(backend))
+            batch_job_ids.append(_NO_ID if job.batch_job_id is None else job.batch_job_id)
+            job_ids.extend(_NO_ID if job_id is None else job_id for job_id in job.job_ids)
+            circuit_offsets.append(len(job_ids))
+            has_results.append(job.results is not None)
+
+            with archive.open(f"circuits/{index}.qpy", "w") as file:
+                qpy.dump(job.circuits, file)
+            if job.results is not None:
+                results = [
+                    {
+                        "result": outcome.result.model_dump(mode="json") if outcome.result is not None else None,
+                        "system_message": outcome.system_message,
+                    }
+                    for outcome in job.results
+                ]
+                archive.writestr(f"results/{index}.json", json.dumps(results))
+
+        archive.writestr("index.json", json.dumps({"version": JobArchive.FORMAT_VERSION, "backends": backends}))
+        for name, values, dtype in (
+            ("backend_index", backend_indices, np.int32),
+            ("batch_job_id", batch_job_ids, np.int64),
+            ("job_id", job_ids, np.int64),
+            ("circuit_offsets", circuit_offsets, np.int64),
+            ("has_results", has_results, np.bool_),
+        ):
+            with archive.open(f"index/{name}.npy", "w") as file:
+                np.save(file, np.asarray(values, dtype=dtype))
+
+
+class JobArchive:
+    """Read access to an archive written by :func:`write_job_archive`.
+
+    Opening an archive only reads its index; the circuits and results of a job are loaded when that job is read.
+
+    Args:
+        file_path: The archive to read.
+
+    Raises:
+        ValueError: If the file is not a job archive.
+    """
+
+    FORMAT_VERSION = 1
+
+    def __init__(self, file_path: Union[str, Path]) -> None:
+        self.file_path = file_path
+        try:
+            self._archive = zipfile.ZipFile(file_path)
+        except zipfile.BadZipFile as exc:
+            raise ValueError(f"Invalid job archive: {file_path}") from exc
+        try:
+            index = json.loads(self._archive.read("index.json"))
+            if index.get("version") != self.FORMAT_VERSION:
+                raise ValueError(f"Unsupported job archive version {index.get('version')}: {file_path}")
+            self._backends = [(str(name), int(id_)) for name, id_ in index["backends"]]
+            self._backend_index = self._load_column("backend_index")
+            self._batch_job_ids = self._load_column("batch_job_id")
+            self._job_ids = self._load_column("job_id")
+            self._circuit_offsets = self._load_column("circuit_offsets")
+            self._has_results = self._load_column("has_results")
+        except (KeyError, TypeError, ValueError) as exc:
+            self._archive.close()
+            raise ValueError(f"Invalid job archive: {file_path}") from exc
+
+    def __enter__(self) -> "JobArchive":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._archive.close()
+
+    def __len__(self) -> int:
+        return len(self._batch_job_ids)
+
+    def __iter__(self) -> Iterator[ArchivedJob]:
+        for index in range(len(self)):
+            yield self.read(index)
+
+    @property
+    def batch_job_ids(self) -> np.ndarray:
+        """The batch job id of every job, ``-1`` for jobs that were not submitted."""
+        return self._batch_job_ids.copy()
+
+    def job_ids(self, index: int) -> np.ndarray:
+        """The job ids of the circuits of job `index`, ``-1`` for circuits without a job."""
+        return self._job_ids[self._circuit_offsets[index] : self._circuit_offsets[index + 1]].copy()
+
+    def find(self, batch_job_id: int) -> int:
+        """Return the index of the job of batch job `batch_job_id`.
+
+        Raises:
+            KeyError: If the archive holds no job of that batch job.
+        """
+        matches = np.flatnonzero(self._batch_job_ids == batch_job_id)
+        if len(matches) == 0:
+            raise KeyError(batch_job_id)
+        return int(matches[0])
+
+    def read(self, index: int) -> ArchivedJob:
+        """Load the circuits, ids and results of job `index`."""
+        if not 0 <= index < len(self):
+            raise IndexError(f"Job archive has {len(self)} jobs, no job {index}")
+        with self._archive.open(f"circuits/{index}.qpy") as file:
+            circuits = qpy.load(file)
+
+        results = None
+        if self._has_results[index]:
+            results = [
+                CachedResult(
+                    result=RawJobResult.model_validate(outcome["result"]) if outcome["result"] is not None else None,
+                    system_message=outcome["system_message"],
+                )
+                for outcome in json.loads(self._archive.read(f"results/{index}.json"))
+            ]
+
+        backend_name, backend_id = self._backends[self._backend_index[index]]
+        batch_job_id = int(self._batch_job_ids[index])
+        return ArchivedJob(
+            backend_name=backend_name,
+            backend_id=backend_id,
+            batch_job_id=None if batch_job_id == _NO_ID else batch_job_id,
+            circuits=list(circuits),
+            job_ids=[None if job_id == _NO_ID else int(job_id) for job_id in self.job_ids(index)],
+            results=results,
+        )
+
+    def _load_column(self, name: str) -> np.ndarray:
+        return cast(np.ndarray, np.load(io.BytesIO(self._archive.read(f"index/{name}.npy"))))
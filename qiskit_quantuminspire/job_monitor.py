@@ -0,0 +1,225 @@
+import asyncio
+import time
+from typing import (
+    Any,
+    AsyncContextManager,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Coroutine,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    ParamSpec,
+    TypeVar,
+)
+
+from compute_api_client import ApiClient, BatchJob, BatchJobsApi, BatchJobStatus, PageBatchJob
+from qi2_shared.pagination import PageReader
+from qiskit.providers.exceptions import JobTimeoutError
+from qiskit.providers.jobstatus import JOB_FINAL_STATES, JobStatus
+
+from qiskit_quantuminspire.api_client_pool import ApiClientPool, open_pool, pooled_api_client, run_pooled
+from qiskit_quantuminspire.qi_jobs import DEFAULT_POLL_BACKOFF, QIBaseJob
+from qiskit_quantuminspire.retry import DEFAULT_RETRY_POLICY
+from qiskit_quantuminspire.utils import Backoff
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+# The largest page size the platform accepts
+DEFAULT_PAGE_SIZE = 100
+
+
+class JobMonitor:
+    """Tracks the status of many submitted jobs, refreshing them together with a few paginated list requests.
+
+    Polling every job with its own ``status()`` costs a request per batch job. The monitor instead lists the batch
+    jobs of the user, newest first, until it has seen all tracked batch jobs, so the number of requests grows with the
+    number of pages rather than the number of jobs. Batch jobs that are not found in the listing, e.g. because many
+    newer batch jobs were created since, are fetched one by one.
+
+    Use :meth:`as_completed` (or :meth:`as_completed_async`) to handle jobs as they finish; their results are fetched
+    as soon as they are done, so ``job.result()`` returns without further requests.
+
+    Args:
+        jobs: The submitted jobs to track.
+        api_client_pool: Client pool for the requests, the pool of the backend of the first job when not given.
+            The requests are retried with the ``retry_policy`` option of the backend of the first job.
+        poll_backoff: The growing interval between refreshes in :meth:`as_completed`.
+        fetch_results: Whether to fetch the results of every job once it finishes.
+        page_size: The number of batch jobs per list request.
+    """
+
+    def __init__(
+        self,
+        jobs: Iterable[QIBaseJob] = (),
+        api_client_pool: Optional[ApiClientPool] = None,
+        poll_backoff: Backoff = DEFAULT_POLL_BACKOFF,
+        fetch_results: bool = True,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> None:
+        if not 1 <= page_size <= DEFAULT_PAGE_SIZE:
+            raise ValueError(f"page_size must be between 1 and {DEFAULT_PAGE_SIZE}")
+        self._api_client_pool = api_client_pool
+        self.poll_backoff = poll_backoff
+        self.fetch_results = fetch_results
+        self.page_size = page_size
+        self._jobs: List[QIBaseJob] = []
+        self._statuses: Dict[QIBaseJob, JobStatus] = {}
+        for job in jobs:
+            self.add(job)
+
+    @property
+    def jobs(self) -> List[QIBaseJob]:
+        return list(self._jobs)
+
+    def __len__(self) -> int:
+        return len(self._jobs)
+
+    def add(self, job: QIBaseJob) -> None:
+        """Start tracking `job`, which must have been submitted."""
+        if not job._batch_job_ids():
+            raise ValueError("Only submitted jobs can be monitored")
+        if job not in self._statuses:
+            self._jobs.append(job)
+            self._statuses[job] = JobStatus.INITIALIZING
+
+    def statuses(self) -> Dict[QIBaseJob, JobStatus]:
+        """Return the status of every job as of the last refresh, without making requests."""
+        return dict(self._statuses)
+
+    def refresh(self) -> Dict[QIBaseJob, JobStatus]:
+        """Fetch the status of all unfinished jobs and return the status of every job."""
+        self._run_sync(self._refresh_async(self._unfinished_jobs()))
+        return self.statuses()
+
+    async def refresh_async(self) -> Dict[QIBaseJob, JobStatus]:
+        """Fetch the status of all unfinished jobs like :meth:`refresh`, on the running event loop."""
+        await self._refresh_async(self._unfinished_jobs())
+        return self.statuses()
+
+    def as_completed(self, timeout: Optional[float] = None) -> Iterator[QIBaseJob]:
+        """Yield the jobs in the order in which they finish, with their results fetched.
+
+        Args:
+            timeout: Seconds to wait for all jobs, ``None`` to wait indefinitely.
+
+        Raises:
+            JobTimeoutError: If not all jobs reach a final state before the timeout.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        delays = self.poll_backoff.delays()
+        pending = list(self._jobs)
+        while pending:
+            finished = self._run_sync(self._refresh_async(pending))
+            yield from finished
+            pending = [job for job in pending if job not in finished]
+            if finished:
+                delays = self.poll_backoff.delays()
+            if pending:
+                time.sleep(self._next_delay(delays, deadline, pending))
+
+    async def as_completed_async(self, timeout: Optional[float] = None) -> AsyncIterator[QIBaseJob]:
+        """Yield the jobs in the order in which they finish like :meth:`as_completed`, on the running event loop."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        delays = self.poll_backoff.delays()
+        pending = list(self._jobs)
+        while pending:
+            finished = await self._refresh_async(pending)
+            for job in finished:
+                yield job
+            pending = [job for job in pending if job not in finished]
+            if finished:
+                delays = self.poll_backoff.delays()
+            if pending:
+                await asyncio.sleep(self._next_delay(delays, deadline, pending))
+
+    def _unfinished_jobs(self) -> List[QIBaseJob]:
+        return [job for job in self._jobs if self._statuses[job] not in JOB_FINAL_STATES]
+
+    @staticmethod
+    def _next_delay(delays: Iterator[float], deadline: Optional[float], pending: List[QIBaseJob]) -> float:
+        delay = next(delays)
+        if deadline is None:
+            return delay
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise JobTimeoutError(f"Timeout while waiting for {len(pending)} job(s).")
+        return min(delay, remaining)
+
+    async def _refresh_async(self, jobs: List[QIBaseJob]) -> List[QIBaseJob]:
+        """Update the status of `jobs` and return the ones that reached a final state."""
+        batch_job_ids = {batch_job_id for job in jobs for batch_job_id in job._batch_job_ids()}
+        batch_job_statuses = await self._fetch_batch_job_statuses(batch_job_ids)
+
+        finished = []
+        for job in jobs:
+            status = await job._status_from_batch_jobs(batch_job_statuses)
+            self._statuses[job] = status
+            if status in JOB_FINAL_STATES:
+                finished.append(job)
+
+        if self.fetch_results:
+            await asyncio.gather(*(job._collect_result_async() for job in finished if job._final_result is None))
+        return finished
+
+    async def _fetch_batch_job_statuses(self, batch_job_ids: Iterable[int]) -> Dict[int, BatchJobStatus]:
+        missing = set(batch_job_ids)
+        if not missing:
+            return {}
+        oldest_id = min(missing)
+        statuses: Dict[int, BatchJobStatus] = {}
+
+        async with self._api_client() as api_client:
+            api_instance = BatchJobsApi(api_client)
+            page = 1
+            # Listing only pays off while it takes fewer requests than fetching the missing batch jobs one by one
+            while missing and page <= len(missing):
+                response = await self._retrying(api_instance.read_batch_jobs_batch_jobs_get)(
+                    sort_by="-created_on", page=page, size=self.page_size
+                )
+                for batch_job in response.items:
+                    if batch_job.id in missing:
+                        statuses[batch_job.id] = batch_job.status
+                        missing.discard(batch_job.id)
+                last_page = response.pages is None or page >= response.pages
+                if last_page or not response.items or response.items[-1].id <= oldest_id:
+                    break
+                page += 1
+
+            if missing:
+                batch_jobs = await asyncio.gather(
+                    *(self._fetch_batch_job(api_instance, batch_job_id) for batch_job_id in missing)
+                )
+                statuses.update((batch_job.id, batch_job.status) for batch_job in batch_jobs)
+        return statuses
+
+    async def _fetch_batch_job(self, api_instance: BatchJobsApi, batch_job_id: int) -> BatchJob:
+        page_reader = PageReader[PageBatchJob, BatchJob]()
+        batch_job = await page_reader.get_single(
+            self._retrying(api_instance.read_batch_jobs_batch_jobs_get), id=batch_job_id
+        )
+        if batch_job is None:
+            raise RuntimeError(f"No (batch)job with id {batch_job_id}")
+        return batch_job
+
+    def _retrying(self, api_method: Callable[P, Awaitable[T]]) -> Callable[P, Awaitable[T]]:
+        """Return `api_method` with the retries of the retry policy of the backend of the first job."""
+        if not self._jobs:
+            return DEFAULT_RETRY_POLICY.wrap(api_method)
+        return self._jobs[0]._retrying(api_method)
+
+    def _pool(self) -> Optional[ApiClientPool]:
+        pool = self._api_client_pool
+        if pool is None and self._jobs:
+            pool = self._jobs[0]._api_client_pool
+        return open_pool(pool)
+
+    def _api_client(self) -> AsyncContextManager[ApiClient]:
+        return pooled_api_client(self._pool())
+
+    def _run_sync(self, coroutine: Coroutine[Any, Any, T]) -> T:
+        return run_pooled(self._pool(), coroutine)
@@ -0,0 +1,80 @@
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple, Union, cast
+
+from compute_api_client import Language
+from qi2_shared.settings import ApiSettings
+
+# Platform metadata changes on the scale of releases, not jobs; ten minutes keeps a long-running process reasonably
+# up to date while removing the lookups from the submission path.
+DEFAULT_METADATA_TTL = 600.0
+
+
+class MetadataCache:
+    """Process-wide cache for platform metadata that rarely changes during the lifetime of a process.
+
+    Covers the parsed API settings (and the team member ids derived from them) and the language lookups needed to
+    submit jobs. Entries expire after ``ttl`` seconds and can be dropped at any time with :meth:`invalidate`.
+    """
+
+    def __init__(self, ttl: float = DEFAULT_METADATA_TTL) -> None:
+        self.ttl = ttl
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def _get(self, key: Hashable) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, value = entry
+            if time.monotonic() - stored_at > self.ttl:
+                del self._entries[key]
+                return None
+            return value
+
+    def _set(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+
+    def invalidate(self) -> None:
+        """Drop all cached metadata, e.g. after logging in again with the CLI."""
+        with self._lock:
+            self._entries.clear()
+
+    def api_settings(self) -> ApiSettings:
+        """Return the API settings, reading the configuration file only when the cached copy has expired."""
+        settings = self._get("api_settings")
+        if settings is None:
+            settings = ApiSettings.from_config_file()
+            self._set("api_settings", settings)
+        return cast(ApiSettings, settings)
+
+    def team_member_id(self, host: Optional[str] = None) -> int:
+        """Return the team member id for `host`, or for the default host if not specified."""
+        settings = self.api_settings()
+        team_member_id = settings.auths[host or settings.default_host].team_member_id
+        assert isinstance(team_member_id, int)
+        return team_member_id
+
+    async def language(
+        self,
+        host: str,
+        name: str,
+        version: str,
+        fetch: Callable[[], Awaitable[Union[Language, None]]],
+    ) -> Union[Language, None]:
+        """Return the language `name` `version` of `host`, calling `fetch` when it is not cached.
+
+        Unknown languages are not cached, so a language that is added to the platform is picked up by the next call.
+        """
+        key = ("language", host, name.lower(), version)
+        language = self._get(key)
+        if language is None:
+            language = await fetch()
+            if language is not None:
+                self._set(key, language)
+        return cast(Union[Language, None], language)
+
+
+METADATA_CACHE = MetadataCache()
@@ -0,0 +1,211 @@
+import math
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple, cast
+
+import numpy as np
+from qiskit.circuit import ClassicalRegister, QuantumCircuit
+from qiskit.primitives import BaseEstimatorV2, DataBin, EstimatorPubLike, PrimitiveResult, PubResult
+from qiskit.primitives.containers.estimator_pub import EstimatorPub
+from qiskit.primitives.primitive_job import PrimitiveJob
+from qiskit.quantum_info import PauliList
+
+from qiskit_quantuminspire.bitstrings import bitstrings_to_bits
+from qiskit_quantuminspire.primitives.utils import check_succeeded, parameter_binds, run_with_options
+from qiskit_quantuminspire.qi_backend import QIBackend
+from qiskit_quantuminspire.qi_jobs import CircuitExecutionData
+
+# The default precision of Qiskit's BackendEstimatorV2, 4096 shots
+DEFAULT_PRECISION = 0.015625
+
+
+@dataclass
+class _MeasurementCircuit:
+    """A circuit measuring a group of qubit-wise commuting Pauli terms, run for some of the parameter values."""
+
+    circuit: QuantumCircuit
+    labels: List[str]
+    # The classical bits of every term: the parity of these bits is the outcome of the term, (terms, clbits)
+    masks: np.ndarray
+    param_indices: List[int]
+
+
+@dataclass
+class _PreprocessedPub:
+    measurement_circuits: List[_MeasurementCircuit]
+    # The flat index into the parameter values and the observable of every element of the PUB
+    param_indices: np.ndarray
+    observables: np.ndarray
+
+    @property
+    def num_circuits(self) -> int:
+        return sum(len(measurement.param_indices) for measurement in self.measurement_circuits)
+
+
+class QIEstimatorV2(BaseEstimatorV2):  # type: ignore[misc]
+    """Estimator primitive that runs all PUBs on a Quantum Inspire backend in a single (sharded) batch job.
+
+    The Pauli terms of the observables of a PUB are divided into groups of qubit-wise commuting terms, which are
+    measured together by one circuit. Every measurement circuit is run for each set of parameter values that needs
+    one of its terms, with its cQASM written from a template (see ``parameter_binds`` of :meth:`QIBackend.run`).
+    Expectation values are computed from the counts, evaluating the parity of all terms of a group over all outcomes
+    at once.
+
+    As for Qiskit's ``BackendEstimatorV2``, the circuits must already be transpiled for the backend and the observables
+    laid out accordingly; the standard errors neglect the covariance between terms.
+
+    Args:
+        backend: The backend to run on.
+        default_precision: The precision of PUBs that don't specify it, determining the number of shots as
+            ``ceil(1 / precision ** 2)``.
+        run_options: Further options for :meth:`QIBackend.run`, e.g. ``submission_mode``.
+    """
+
+    def __init__(
+        self,
+        backend: QIBackend,
+        *,
+        default_precision: float = DEFAULT_PRECISION,
+        run_options: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        self._backend = backend
+        self.default_precision = default_precision
+        self.run_options = dict(run_options or {})
+
+    @property
+    def backend(self) -> QIBackend:
+        return self._backend
+
+    def run(
+        self, pubs: Iterable[EstimatorPubLike], *, precision: Optional[float] = None
+    ) -> PrimitiveJob[PrimitiveResult[PubResult]]:
+        if precision is None:
+            precision = self.default_precision
+        coerced_pubs = [EstimatorPub.coerce(pub, precision) for pub in pubs]
+        for pub in coerced_pubs:
+            if pub.precision <= 0:
+                raise ValueError(f"Precision must be larger than 0, got {pub.precision}")
+        job = PrimitiveJob(self._run, coerced_pubs)
+        job._submit()
+        return job
+
+    def _run(self, pubs: List[EstimatorPub]) -> PrimitiveResult[PubResult]:
+        # PUBs with the same number of shots share a batch job; all batch jobs are submitted before waiting for any
+        pubs_by_shots: Dict[int, List[int]] = defaultdict(list)
+        for index, pub in enumerate(pubs):
+            pubs_by_shots[math.ceil(1.0 / pub.precision**2)].append(index)
+
+        preprocessed = [_preprocess_pub(pub) for pub in pubs]
+        jobs = {}
+        for shots, indices in pubs_by_shots.items():
+            measurements = [
+                measurement for index in indices for measurement in preprocessed[index].measurement_circuits
+            ]
+            if not measurements:
+                continue
+            jobs[shots] = run_with_options(
+                self._backend,
+                [measurement.circuit for measurement in measurements],
+                [
+                    parameter_binds(measurement.circuit, pubs[index].parameter_values, measurement.param_indices)
+                    for index in indices
+                    for measurement in preprocessed[index].measurement_circuits
+                ],
+                **{**self.run_options, "shots": shots, "memory": False},
+            )
+
+        results: List[Optional[PubResult]] = [None] * len(pubs)
+        for shots, indices in pubs_by_shots.items():
+            circuits_data = jobs[shots].raw_results() if shots in jobs else []
+            start = 0
+            for index in indices:
+                end = start + preprocessed[index].num_circuits
+                results[index] = _postprocess_pub(pubs[index], preprocessed[index], circuits_data[start:end], shots)
+                start = end
+        return PrimitiveResult(results, metadata={"version": 2})
+
+
+def _preprocess_pub(pub: EstimatorPub) -> _PreprocessedPub:
+    param_indices = np.arange(pub.parameter_values.size).reshape(pub.parameter_values.shape)
+    bc_param_indices, bc_observables = np.broadcast_arrays(param_indices, pub.observables)
+
+    # The Pauli terms needed for every set of parameter values; the identity needs no measurement
+    identity = "I" * pub.circuit.num_qubits
+    terms_by_param: Dict[int, Set[str]] = defaultdict(set)
+    for index in np.ndindex(bc_param_indices.shape):
+        observable = cast(Dict[str, float], bc_observables[index])
+        terms_by_param[int(bc_param_indices[index])].update(observable.keys() - {identity})
+
+    terms = sorted(set().union(*terms_by_param.values()))
+    measurement_circuits = []
+    if terms:
+        for group in PauliList(terms).group_qubit_wise_commuting():
+            labels = group.to_labels()
+            group_params = [param for param, needed in sorted(terms_by_param.items()) if not needed.isdisjoint(labels)]
+            measurement_circuits.append(_measurement_circuit(pub.circuit, group, group_params))
+    return _PreprocessedPub(measurement_circuits, bc_param_indices, bc_observables)
+
+
+def _measurement_circuit(circuit: QuantumCircuit, group: PauliList, param_indices: List[int]) -> _MeasurementCircuit:
+    """Append the basis changes and measurements of the qubit-wise commuting terms of `group` to `circuit`."""
+    support = group.z | group.x
+    z_basis = np.logical_or.reduce(group.z)
+    x_basis = np.logical_or.reduce(group.x)
+    measured = np.flatnonzero(np.logical_or.reduce(support))
+
+    measurement = circuit.copy()
+    creg = ClassicalRegister(len(measured), "meas")
+    measurement.add_register(creg)
+    for qubit in measured:
+        if x_basis[qubit] and z_basis[qubit]:
+            measurement.sdg(int(qubit))
+        if x_basis[qubit]:
+            measurement.h(int(qubit))
+    measurement.measure([int(qubit) for qubit in measured], creg)
+
+    masks = np.zeros((len(group), measurement.num_clbits), dtype=np.int64)
+    masks[:, [measurement.find_bit(clbit).index for clbit in creg]] = support[:, measured]
+    return _MeasurementCircuit(measurement, group.to_labels(), masks, param_indices)
+
+
+def _expectation_values(circuit_data: CircuitExecutionData, masks: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Return the expectation value and variance of every term of `masks` from the counts of `circuit_data`."""
+    check_succeeded(circuit_data)
+    assert circuit_data.results is not None
+    counts = circuit_data.results.results
+    bits = bitstrings_to_bits(list(counts)).astype(np.int64)
+    frequencies = np.fromiter(counts.values(), dtype=float, count=len(counts))
+    if frequencies.sum() == 0:
+        raise RuntimeError(f"Circuit {circuit_data.circuit.name} returned no shots")
+    # +1 for outcomes of even parity, -1 for odd parity, for all outcomes and terms at once
+    signs = 1 - 2 * ((bits @ masks.T) & 1)
+    expectation_values = frequencies @ signs / frequencies.sum()
+    return expectation_values, 1 - expectation_values**2
+
+
+def _postprocess_pub(
+    pub: EstimatorPub, preprocessed: _PreprocessedPub, circuits_data: Sequence[CircuitExecutionData], shots: int
+) -> PubResult:
+    expectation_values: Dict[Tuple[int, str], Tuple[float, float]] = {}
+    circuits = iter(circuits_data)
+    for measurement in preprocessed.measurement_circuits:
+        for param_index in measurement.param_indices:
+            values, variances = _expectation_values(next(circuits), measurement.masks)
+            for label, value, variance in zip(measurement.labels, values, variances):
+                expectation_values[param_index, label] = (value, variance)
+
+    identity = "I" * pub.circuit.num_qubits
+    evs = np.zeros(preprocessed.param_indices.shape, dtype=float)
+    stds = np.zeros(preprocessed.param_indices.shape, dtype=float)
+    for index in np.ndindex(evs.shape):
+        param_index = int(preprocessed.param_indices[index])
+        observable = cast(Dict[str, float], preprocessed.observables[index])
+        for label, coeff in observable.items():
+            value, variance = (1.0, 0.0) if label == identity else expectation_values[param_index, label]
+            evs[index] += coeff * value
+            stds[index] += abs(coeff) * math.sqrt(variance)
+
+    return PubResult(
+        DataBin(evs=evs, stds=stds / math.sqrt(shots), shape=evs.shape),
+        metadata={"target_precision": pub.precision, "shots": shots, "circuit_metadata": pub.circuit.metadata},
+    )
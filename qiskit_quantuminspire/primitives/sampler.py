@@ -0,0 +1,102 @@
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+from qiskit.primitives import BaseSamplerV2, BitArray, DataBin, PrimitiveResult, SamplerPubLike, SamplerPubResult
+from qiskit.primitives.containers.sampler_pub import SamplerPub
+from qiskit.primitives.primitive_job import PrimitiveJob
+
+from qiskit_quantuminspire.bitstrings import bitstrings_to_bit_array
+from qiskit_quantuminspire.primitives.utils import check_succeeded, parameter_binds, run_with_options
+from qiskit_quantuminspire.qi_backend import QIBackend
+from qiskit_quantuminspire.qi_jobs import CircuitExecutionData
+
+DEFAULT_SHOTS = 1024
+
+
+class QISamplerV2(BaseSamplerV2):  # type: ignore[misc]
+    """Sampler primitive that runs all PUBs on a Quantum Inspire backend in a single (sharded) batch job.
+
+    Every PUB is expanded into one circuit per set of parameter values, whose cQASM is written from a template of the
+    PUB's circuit (see ``parameter_binds`` of :meth:`QIBackend.run`), and run with the number of shots of the PUB.
+    The shots of each circuit are packed into a :class:`~qiskit.primitives.BitArray` straight from the bitstrings
+    returned by the platform, or from the counts on backends without raw data support.
+
+    Like Qiskit's ``BackendSamplerV2``, the circuits must already be transpiled for the backend.
+
+    Args:
+        backend: The backend to run on.
+        default_shots: The number of shots of PUBs that don't specify it, the number of shots of the backend options
+            when not given.
+        run_options: Further options for :meth:`QIBackend.run`, e.g. ``submission_mode``.
+    """
+
+    def __init__(
+        self,
+        backend: QIBackend,
+        *,
+        default_shots: Optional[int] = None,
+        run_options: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        self._backend = backend
+        self.default_shots = default_shots
+        self.run_options = dict(run_options or {})
+
+    @property
+    def backend(self) -> QIBackend:
+        return self._backend
+
+    def run(
+        self, pubs: Iterable[SamplerPubLike], *, shots: Optional[int] = None
+    ) -> PrimitiveJob[PrimitiveResult[SamplerPubResult]]:
+        if shots is None:
+            shots = self.default_shots or self._backend.options.get("shots", DEFAULT_SHOTS)
+        coerced_pubs = [SamplerPub.coerce(pub, shots) for pub in pubs]
+        job = PrimitiveJob(self._run, coerced_pubs)
+        job._submit()
+        return job
+
+    def _run(self, pubs: List[SamplerPub]) -> PrimitiveResult[SamplerPubResult]:
+        supports_raw_data = self._backend.get_backend_type().supports_raw_data
+        job = run_with_options(
+            self._backend,
+            [pub.circuit for pub in pubs],
+            [parameter_binds(pub.circuit, pub.parameter_values) for pub in pubs],
+            circuit_shots=[pub.shots for pub in pubs],
+            **{**self.run_options, "memory": supports_raw_data},
+        )
+
+        circuits_data = job.raw_results()
+        results: List[SamplerPubResult] = []
+        start = 0
+        for pub in pubs:
+            results.append(self._postprocess_pub(pub, circuits_data[start : start + pub.size]))
+            start += pub.size
+        return PrimitiveResult(results, metadata={"version": 2})
+
+    @staticmethod
+    def _postprocess_pub(pub: SamplerPub, circuits_data: Sequence[CircuitExecutionData]) -> SamplerPubResult:
+        circuit = pub.circuit
+        meas: Dict[str, BitArray] = {}
+        if circuit.cregs:
+            for circuit_data in circuits_data:
+                check_succeeded(circuit_data)
+            shots = [_shots_bit_array(circuit_data, circuit.num_clbits) for circuit_data in circuits_data]
+            samples = BitArray(
+                np.stack([bit_array.array for bit_array in shots]).reshape(pub.shape + shots[0].array.shape),
+                circuit.num_clbits,
+            )
+            for creg in circuit.cregs:
+                meas[creg.name] = samples.slice_bits([circuit.find_bit(clbit).index for clbit in creg])
+
+        return SamplerPubResult(
+            DataBin(**meas, shape=pub.shape),
+            metadata={"shots": pub.shots, "circuit_metadata": circuit.metadata},
+        )
+
+
+def _shots_bit_array(circuit_data: CircuitExecutionData, num_bits: int) -> BitArray:
+    assert circuit_data.results is not None
+    if circuit_data.results.raw_data:
+        return bitstrings_to_bit_array(circuit_data.results.raw_data, num_bits)
+    # Backends without raw data support only return counts, the order of the shots is lost
+    return BitArray.from_counts(circuit_data.results.results, num_bits)
@@ -0,0 +1,52 @@
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Union
+
+from numpy.typing import ArrayLike
+from qiskit.circuit import Parameter, QuantumCircuit
+from qiskit.primitives.containers.bindings_array import BindingsArray
+
+from qiskit_quantuminspire.qi_backend import QIBackend
+from qiskit_quantuminspire.qi_jobs import CircuitExecutionData, QIJob, QIShardedJob
+
+
+def parameter_binds(
+    circuit: QuantumCircuit, parameter_values: BindingsArray, indices: Optional[Sequence[int]] = None
+) -> Dict[Parameter, ArrayLike]:
+    """Return `parameter_values` in the form of ``parameter_binds`` of :meth:`QIBackend.run`, flattened in C order.
+
+    Args:
+        circuit: The circuit the values are for.
+        parameter_values: The values of the parameters of `circuit`.
+        indices: The flat indices of the sets of values to keep, all of them when not given.
+    """
+    parameters = list(circuit.parameters)
+    if not parameters:
+        return {}
+    values = parameter_values.as_array(parameters).reshape(-1, len(parameters))
+    if indices is not None:
+        values = values[list(indices)]
+    return {parameter: values[:, index] for index, parameter in enumerate(parameters)}
+
+
+def run_with_options(
+    backend: QIBackend,
+    circuits: List[QuantumCircuit],
+    parameter_binds: List[Mapping[Parameter, ArrayLike]],
+    circuit_shots: Optional[Sequence[int]] = None,
+    **options: Any,
+) -> Union[QIJob, QIShardedJob]:
+    """Run `circuits` on `backend` with `options`, restoring the options of the backend afterwards.
+
+    ``QIBackend.run`` keeps the options it is given, which would otherwise leak from a primitive into later runs.
+    """
+    previous_options = {name: backend.options.get(name) for name in options if hasattr(backend.options, name)}
+    try:
+        return backend.run(circuits, parameter_binds=parameter_binds, circuit_shots=circuit_shots, **options)
+    finally:
+        backend.set_options(**previous_options)
+
+
+def check_succeeded(circuit_data: CircuitExecutionData) -> None:
+    """Raise a RuntimeError if the circuit of `circuit_data` did not produce results."""
+    if circuit_data.results is None:
+        message = (circuit_data.system_message or {}).get("message", "No Results")
+        raise RuntimeError(f"Circuit {circuit_data.circuit.name} failed: {message}")
@@ -1,19 +1,38 @@
+import threading
+import time
 from pprint import PrettyPrinter
-from typing import Any, List, Union
+from typing import Any, AsyncContextManager, Coroutine, List, Mapping, Optional, Sequence, Tuple, TypeVar, Union, cast
 
 from compute_api_client import ApiClient, BackendStatus, BackendType, BackendTypesApi
-from qi2_shared.client import config
-from qi2_shared.utils import run_async
-from qiskit.circuit import QuantumCircuit
+from numpy.typing import ArrayLike
+from qiskit.circuit import Parameter, QuantumCircuit
 from qiskit.providers import BackendV2 as Backend
 from qiskit.providers.options import Options
 from qiskit.transpiler import CouplingMap, Target
 
+from qiskit_quantuminspire import cqasm
+from qiskit_quantuminspire.api_client_pool import ApiClientPool, pooled_api_client, run_pooled
 from qiskit_quantuminspire.mapping.instruction_mapping import InstructionMapping
 from qiskit_quantuminspire.qi_instructions import Asm
-from qiskit_quantuminspire.qi_jobs import QIJob
+from qiskit_quantuminspire.qi_jobs import (
+    DEFAULT_CQASM_WORKERS,
+    DEFAULT_SUBMIT_CONCURRENCY,
+    MAX_SUBMIT_CONCURRENCY,
+    MemoryFormat,
+    QIJob,
+    QIShardedJob,
+    SubmissionMode,
+)
+from qiskit_quantuminspire.qi_session import QISession
+from qiskit_quantuminspire.retry import DEFAULT_RETRY_POLICY, RetryPolicy
 from qiskit_quantuminspire.utils import is_coupling_map_complete
 
+T = TypeVar("T")
+
+# Backend status and messages change on the scale of minutes; a short TTL keeps them current enough for the checks
+# before submission without a request for each of them.
+DEFAULT_BACKEND_TYPE_TTL = 30.0
+
 _IGNORED_GATES: set[str] = {
     # Prep not viewed as separate gates in Qiskit
     "prep_x",
@@ -92,8 +111,18 @@ class QIBaseBackend(Backend):  # type: ignore[misc]
         """Only options defined here are supported by the backend.
 
         shots: int: Number of shots for the job.
+        result_cache: Optional ResultCache, used to load the results of finished jobs from disk instead of fetching
+            them again.
+        retry_policy: Optional RetryPolicy, retrying the requests to the platform that failed for a passing reason;
+            ``None`` makes every request once.
         """
-        options = Options(shots=1024, seed_simulator=None, memory=False)
+        options = Options(
+            shots=1024,
+            seed_simulator=None,
+            memory=False,
+            result_cache=None,
+            retry_policy=DEFAULT_RETRY_POLICY,
+        )
 
         # Seed_simulator is included in options to enable use of BackendEstimatorV2 in Qiskit,
         # but is not actually supported by the backend so any other value than none raises an error.
@@ -122,7 +151,84 @@ class QIBaseBackend(Backend):  # type: ignore[misc]
 
 
 class QIBackend(QIBaseBackend):
-    """A wrapper class for QuantumInspire backendtypes to integrate with Qiskit's Backend interface."""
+    """A wrapper class for QuantumInspire backendtypes to integrate with Qiskit's Backend interface.
+
+    The backend keeps a snapshot of its backend type, which is fetched again once it is older than
+    `backend_type_ttl` seconds, or explicitly with :meth:`refresh`. Requests to the platform, including those of the
+    jobs of the backend, use the connections of `api_client_pool` when it is given and open.
+    """
+
+    def __init__(
+        self,
+        backend_type: BackendType,
+        mapping: InstructionMapping = InstructionMapping(),
+        backend_type_ttl: float = DEFAULT_BACKEND_TYPE_TTL,
+        api_client_pool: Optional[ApiClientPool] = None,
+        **kwargs: Any,
+    ):
+        super().__init__(backend_type, mapping, **kwargs)
+        self._session: Optional[QISession] = None
+        self.api_client_pool = api_client_pool
+        self.backend_type_ttl = backend_type_ttl
+        self._backend_type_lock = threading.Lock()
+        self._update_backend_type(backend_type)
+
+    @classmethod
+    def _default_options(cls) -> Options:
+        """The options of :class:`QIBaseBackend`, and those of submitting circuits to the platform.
+
+        submit_concurrency: int: Maximum number of circuits that are uploaded to the platform concurrently.
+        submit_progress_callback: Called as ``callback(uploaded, total)`` after each uploaded circuit.
+        submission_mode: str: "per_circuit" creates an algorithm and commit for every circuit, "per_batch" attaches
+            the files of all circuits to a single algorithm and commit.
+        upload_cache: Optional UploadCache, used to submit circuits that were uploaded before without uploading them
+            again.
+        cqasm_workers: Optional[int]: Number of processes converting circuits to cQASM, ``None`` for one per CPU.
+        compile_cache: Optional CompileCache, used to reuse the cQASM of circuits that were converted before.
+        memory_format: str: How the shots are stored in the result with ``memory=True``: "hex" strings or
+            "bitstring" strings in ``data.memory``, or "packed" into a BitArray in ``data.bit_array``.
+        submission_journal: Optional SubmissionJournal, recording the platform objects created while submitting, so
+            an interrupted submission can be finished without creating them again.
+        """
+        options = super()._default_options()
+        options.update_options(
+            submit_concurrency=DEFAULT_SUBMIT_CONCURRENCY,
+            submit_progress_callback=None,
+            submission_mode=SubmissionMode.PER_CIRCUIT.value,
+            upload_cache=None,
+            cqasm_workers=DEFAULT_CQASM_WORKERS,
+            compile_cache=None,
+            memory_format=MemoryFormat.HEX.value,
+            submission_journal=None,
+        )
+
+        options.set_validator("submit_concurrency", (1, MAX_SUBMIT_CONCURRENCY))
+        options.set_validator("submission_mode", [mode.value for mode in SubmissionMode])
+        options.set_validator("memory_format", [memory_format.value for memory_format in MemoryFormat])
+
+        return options
+
+    def session(self, reuse_algorithm: bool = False) -> QISession:
+        """Create a session that reuses the platform project (and optionally algorithm) of this backend across runs.
+
+        Args:
+            reuse_algorithm: Also reuse a single algorithm for all runs in the session.
+        """
+        return QISession(self, reuse_algorithm=reuse_algorithm)
+
+    @property
+    def active_session(self) -> Optional[QISession]:
+        """The session used by ``run``, if any."""
+        return self._session
+
+    def _activate_session(self, session: QISession) -> None:
+        if self._session is not None:
+            raise RuntimeError(f"A session is already active on backend {self.name}")
+        self._session = session
+
+    def _deactivate_session(self, session: QISession) -> None:
+        if self._session is session:
+            self._session = None
 
     @property
     def status(self) -> BackendStatus:
@@ -137,33 +243,167 @@ class QIBackend(QIBaseBackend):
             messages += f"{backend_name}: {backend_type.messages[backend_name].content}\n"
         return messages.rstrip("\n")
 
+    def _api_client(self) -> AsyncContextManager[ApiClient]:
+        """Return the pooled client, or else a new client that is closed after use."""
+        return pooled_api_client(self.api_client_pool)
+
+    def _run_sync(self, coroutine: Coroutine[Any, Any, T]) -> T:
+        """Run `coroutine` to completion, on the event loop of the client pool if there is one."""
+        return run_pooled(self.api_client_pool, coroutine)
+
     async def _get_backend_type(self) -> BackendType:
         """Asynchronously fetch the backend type for this backend ID."""
-        async with ApiClient(config()) as client:
+        async with self._api_client() as client:
             backend_types_api = BackendTypesApi(client)
-            return await backend_types_api.read_backend_type_backend_types_id_get(self._id)
+            read_backend_type = backend_types_api.read_backend_type_backend_types_id_get
+            policy = cast(Optional[RetryPolicy], self.options.get("retry_policy", DEFAULT_RETRY_POLICY))
+            if policy is not None:
+                read_backend_type = policy.wrap(read_backend_type)
+            return await read_backend_type(self._id)
+
+    def _update_backend_type(self, backend_type: BackendType) -> None:
+        with self._backend_type_lock:
+            self._backend_type = backend_type
+            self._backend_type_updated_at = time.monotonic()
+
+    def _fresh_backend_type(self) -> Optional[BackendType]:
+        with self._backend_type_lock:
+            if time.monotonic() - self._backend_type_updated_at <= self.backend_type_ttl:
+                return self._backend_type
+            return None
+
+    def refresh(self) -> BackendType:
+        """Fetch the backend type from the platform, replacing the cached snapshot."""
+        backend_type = self._run_sync(self._get_backend_type())
+        self._update_backend_type(backend_type)
+        return backend_type
+
+    async def refresh_async(self) -> BackendType:
+        """Fetch the backend type like :meth:`refresh`, on the running event loop."""
+        backend_type = await self._get_backend_type()
+        self._update_backend_type(backend_type)
+        return backend_type
 
     def get_backend_type(self) -> BackendType:
-        """Synchronous wrapper for backend type fetch."""
-        return run_async(self._get_backend_type())
+        """Return the snapshot of the backend type, fetching it again when it is older than `backend_type_ttl`."""
+        backend_type = self._fresh_backend_type()
+        return backend_type if backend_type is not None else self.refresh()
+
+    async def get_backend_type_async(self) -> BackendType:
+        """Return the snapshot of the backend type like :meth:`get_backend_type`, on the running event loop."""
+        backend_type = self._fresh_backend_type()
+        return backend_type if backend_type is not None else await self.refresh_async()
 
     @property
     def available(self) -> bool:
         return bool(self.status != BackendStatus.OFFLINE)
 
-    def run(self, run_input: Union[QuantumCircuit, List[QuantumCircuit]], **options: Any) -> QIJob:
+    def run(
+        self,
+        run_input: Union[QuantumCircuit, List[QuantumCircuit]],
+        parameter_binds: Optional[List[Mapping[Parameter, ArrayLike]]] = None,
+        circuit_shots: Optional[Sequence[int]] = None,
+        **options: Any,
+    ) -> Union[QIJob, QIShardedJob]:
         """Create and run a (batch)job on an QuantumInspire Backend.
 
+        Runs with more circuits than fit in a single batch job of this backend are split over several batch jobs,
+        which are presented as a single job. Inside a session (see :meth:`session`) the platform objects of the
+        session are reused.
+
         Args:
             run_input: A single or list of Qiskit QuantumCircuit objects or hybrid algorithms.
+            parameter_binds: For each circuit, the values of its parameters, all sequences of a circuit having the same
+                length. Every circuit is run once for each set of values, in order; the experiments in the result keep
+                the name of the parameterized circuit.
+            circuit_shots: For each circuit, the number of shots to run it with instead of the ``shots`` option, for
+                all sets of values of its parameters. Circuits with different numbers of shots share a batch job.
             **options: Execution options (shots, memory, etc.)
 
         Returns:
-            QIJob: A reference to the batch job that was submitted.
+            A reference to the (batch)job(s) that were submitted.
         """
         if not self.available:
             raise RuntimeError(f"{self.name} is {self.status.value}, jobs can't be submitted")
         self.set_options(**options)
-        job = QIJob(run_input=run_input, backend=self)
+
+        job = self._create_job(run_input, parameter_binds, self.get_backend_type(), circuit_shots)
         job.submit()
         return job
+
+    async def run_async(
+        self,
+        run_input: Union[QuantumCircuit, List[QuantumCircuit]],
+        parameter_binds: Optional[List[Mapping[Parameter, ArrayLike]]] = None,
+        circuit_shots: Optional[Sequence[int]] = None,
+        **options: Any,
+    ) -> Union[QIJob, QIShardedJob]:
+        """Create and run a (batch)job like :meth:`run`, on the running event loop.
+
+        The returned job has awaitable counterparts of its methods as well, such as ``status_async`` and
+        ``result_async``.
+        """
+        backend_type = await self.get_backend_type_async()
+        if backend_type.status == BackendStatus.OFFLINE:
+            raise RuntimeError(f"{self.name} is {backend_type.status.value}, jobs can't be submitted")
+        self.set_options(**options)
+
+        job = self._create_job(run_input, parameter_binds, backend_type, circuit_shots)
+        await job.submit_async()
+        return job
+
+    def _create_job(
+        self,
+        run_input: Union[QuantumCircuit, List[QuantumCircuit]],
+        parameter_binds: Optional[List[Mapping[Parameter, ArrayLike]]],
+        backend_type: BackendType,
+        circuit_shots: Optional[Sequence[int]] = None,
+    ) -> Union[QIJob, QIShardedJob]:
+        num_input_circuits = 1 if isinstance(run_input, QuantumCircuit) else len(run_input)
+        if circuit_shots is not None and len(circuit_shots) != num_input_circuits:
+            raise ValueError(f"Got shots for {len(circuit_shots)} circuits, but {num_input_circuits} circuits to run")
+        contents: Optional[List[str]] = None
+        if parameter_binds is not None:
+            run_input, contents, repeats = self._bind_parameters(run_input, parameter_binds)
+            if circuit_shots is not None:
+                circuit_shots = [shots for shots, repeat in zip(circuit_shots, repeats) for _ in range(repeat)]
+
+        num_circuits = 1 if isinstance(run_input, QuantumCircuit) else len(run_input)
+        job: Union[QIJob, QIShardedJob]
+        if num_circuits > backend_type.max_jobs_per_batch_job:
+            job = QIShardedJob(run_input=run_input, backend=self, session=self._session)
+        else:
+            job = QIJob(run_input=run_input, backend=self, session=self._session)
+        if contents is not None:
+            for circuit_data, content in zip(job.circuits_run_data, contents):
+                circuit_data.cqasm = content
+        if circuit_shots is not None:
+            for circuit_data, shots in zip(job.circuits_run_data, circuit_shots):
+                circuit_data.number_of_shots = shots
+        return job
+
+    @staticmethod
+    def _bind_parameters(
+        run_input: Union[QuantumCircuit, List[QuantumCircuit]],
+        parameter_binds: List[Mapping[Parameter, ArrayLike]],
+    ) -> Tuple[List[QuantumCircuit], List[str], List[int]]:
+        """Expand every circuit into one entry per set of parameter values, with its cQASM written from a template.
+
+        Returns:
+            The expanded circuits, their cQASM, and the number of entries of each circuit.
+        """
+        circuits = [run_input] if isinstance(run_input, QuantumCircuit) else run_input
+        if len(parameter_binds) != len(circuits):
+            raise ValueError(
+                f"Got parameter binds for {len(parameter_binds)} circuits, but {len(circuits)} circuits to run"
+            )
+
+        expanded_circuits: List[QuantumCircuit] = []
+        contents: List[str] = []
+        repeats: List[int] = []
+        for circuit, binds in zip(circuits, parameter_binds):
+            bound_contents = cqasm.compile_template(circuit).bind_many(binds)
+            expanded_circuits.extend([circuit] * len(bound_contents))
+            contents.extend(bound_contents)
+            repeats.append(len(bound_contents))
+        return expanded_circuits, contents, repeats
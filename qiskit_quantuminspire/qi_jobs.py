@@ -1,9 +1,37 @@
 import asyncio
+import dataclasses
+import itertools
+import logging
+import threading
+import time
 import warnings
+import weakref
+import zipfile
+from contextlib import asynccontextmanager, suppress
 from dataclasses import dataclass
-from functools import cache
+from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union, cast
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncContextManager,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Coroutine,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    ParamSpec,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+    cast,
+)
 
 from colorama import Fore, Style
 from compute_api_client import (
@@ -31,6 +59,7 @@ from compute_api_client import (
     Language,
     LanguagesApi,
     PageBatchJob,
+    PageJob,
     PageResult,
     Project,
     ProjectIn,
@@ -39,20 +68,85 @@ from compute_api_client import (
     ResultsApi,
     ShareType,
 )
+from compute_api_client.exceptions import ApiException
 from qi2_shared.client import config
 from qi2_shared.pagination import PageReader
-from qi2_shared.settings import ApiSettings
-from qi2_shared.utils import run_async
 from qiskit import qpy
 from qiskit.circuit import QuantumCircuit
 from qiskit.providers import JobV1
 from qiskit.providers.backend import BackendV2
-from qiskit.providers.jobstatus import JobStatus
+from qiskit.providers.exceptions import JobTimeoutError
+from qiskit.providers.jobstatus import JOB_FINAL_STATES, JobStatus
 from qiskit.result.models import ExperimentResult, ExperimentResultData
 from qiskit.result.result import Result
 
 from qiskit_quantuminspire import cqasm
+from qiskit_quantuminspire.api_client_pool import ApiClientPool, open_pool, pooled_api_client, run_pooled
 from qiskit_quantuminspire.base_provider import BaseProvider
+from qiskit_quantuminspire.bitstrings import bitstrings_to_bit_array, bitstrings_to_hex, counts_to_hex
+from qiskit_quantuminspire.compile_cache import CompileCache
+from qiskit_quantuminspire.job_archive import ArchivedJob, JobArchive, write_job_archive
+from qiskit_quantuminspire.metadata_cache import METADATA_CACHE
+from qiskit_quantuminspire.result_cache import CachedResult, ResultCache
+from qiskit_quantuminspire.retry import DEFAULT_RETRY_POLICY, RetryPolicy
+from qiskit_quantuminspire.submission_journal import JournaledCircuit, Submission, SubmissionJournal
+from qiskit_quantuminspire.upload_cache import UploadCache
+from qiskit_quantuminspire.utils import Backoff
+
+if TYPE_CHECKING:
+    from qiskit_quantuminspire.qi_session import QISession
+
+logger = logging.getLogger(__name__)
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+# Number of circuits uploaded concurrently when the backend does not specify otherwise. Large enough to keep the
+# connection busy, small enough to stay clear of the platform's rate limiting.
+DEFAULT_SUBMIT_CONCURRENCY = 16
+MAX_SUBMIT_CONCURRENCY = 256
+# Circuits are converted to cQASM in the submitting process unless more workers are requested: starting a process
+# pool only pays off for large batches.
+DEFAULT_CQASM_WORKERS = 1
+# Status polls start fast, so short jobs are picked up promptly, and slow down while a job waits in the queue.
+DEFAULT_POLL_BACKOFF = Backoff(initial=0.5, maximum=30.0)
+
+# Progress callback of wait_for_final_state, called with the job id, the status and the job
+StatusCallback = Callable[[str, JobStatus, "QIBaseJob"], None]
+
+
+class SubmissionMode(str, Enum):
+    """How the circuits of a batch are organised in algorithms and commits on the platform."""
+
+    # Every circuit gets its own algorithm and commit (4 requests per circuit)
+    PER_CIRCUIT = "per_circuit"
+    # All circuits share one algorithm and commit (2 requests per circuit, plus 2 per batch)
+    PER_BATCH = "per_batch"
+
+
+class MemoryFormat(str, Enum):
+    """How the measurements of the individual shots are stored in an experiment result, with ``memory=True``."""
+
+    # data.memory holds a "0x..." string per shot, like other Qiskit backends
+    HEX = "hex"
+    # data.memory holds the bitstrings as returned by the platform, without conversion
+    BITSTRING = "bitstring"
+    # data.bit_array holds a BitArray, the shots packed into bytes
+    PACKED = "packed"
+
+
+# mapping of QI BatchJobStatus to Qiskit JobStatus
+_BATCH_JOB_STATUS_MAP = {
+    BatchJobStatus.QUEUED: JobStatus.QUEUED,
+    BatchJobStatus.RESERVED: JobStatus.QUEUED,
+    BatchJobStatus.PLANNED: JobStatus.QUEUED,
+    BatchJobStatus.RUNNING: JobStatus.RUNNING,
+    BatchJobStatus.FINISHED: JobStatus.DONE,
+}
+
+
+# Statuses of QI jobs that will not change anymore
+_FINAL_JOB_STATUSES = (QIJobStatus.COMPLETED, QIJobStatus.FAILED, QIJobStatus.CANCELLED)
 
 
 class ExperimentFailedWarning(UserWarning):
@@ -61,12 +155,76 @@ class ExperimentFailedWarning(UserWarning):
 
 @dataclass
 class CircuitExecutionData:
-    """Class for book-keeping of individual jobs."""
+    """Class for book-keeping of individual jobs.
+
+    `number_of_shots` is the number of shots of the circuit, the ``shots`` option of the backend when not given.
+    """
 
     circuit: QuantumCircuit
+    cqasm: Optional[str] = None
     job_id: Optional[int] = None
     results: Optional[RawJobResult] = None
     system_message: Optional[Dict[str, str]] = None
+    number_of_shots: Optional[int] = None
+
+    @property
+    def finished(self) -> bool:
+        """Whether the results of the circuit, or the reason why there are none, have been fetched."""
+        return self.results is not None or self.system_message is not None
+
+
+@dataclass
+class _SubmissionRecorder:
+    """Records the platform objects created for `submission` in `journal`, without blocking the event loop.
+
+    Nothing is recorded for a job without a journal.
+    """
+
+    journal: Optional[SubmissionJournal] = None
+    submission: Optional[Submission] = None
+
+    def circuit(self, circuit_index: int) -> JournaledCircuit:
+        """Return the objects recorded for circuit `circuit_index`, none for a circuit without any."""
+        if self.submission is None:
+            return JournaledCircuit()
+        return self.submission.circuits.get(circuit_index, JournaledCircuit())
+
+    async def record(self, **ids: int) -> None:
+        """Record the ids of objects shared by all circuits, see :meth:`SubmissionJournal.record`."""
+        if self.journal is not None and self.submission is not None:
+            await asyncio.to_thread(self.journal.record, self.submission.submission_id, **ids)
+
+    async def record_circuit(self, circuit_index: int, **ids: int) -> None:
+        """Record the ids of objects of circuit `circuit_index`, see :meth:`SubmissionJournal.record_circuit`."""
+        if self.journal is not None and self.submission is not None:
+            await asyncio.to_thread(self.journal.record_circuit, self.submission.submission_id, circuit_index, **ids)
+
+    async def finish(self) -> None:
+        """Record that the batch job was enqueued."""
+        if self.journal is not None and self.submission is not None:
+            await asyncio.to_thread(self.journal.finish, self.submission.submission_id)
+
+
+def _rejects_cached_file(exc: ApiException) -> bool:
+    """Return whether creating a job on a cached file failed because of the file, so it should be uploaded again.
+
+    Any client error but rate limiting counts, as the platform reports a file that is gone or that may not be used
+    anymore in different ways.
+    """
+    return exc.status is not None and 400 <= exc.status < 500 and exc.status != 429
+
+
+@asynccontextmanager
+async def _in_background(coroutine: Coroutine[Any, Any, T]) -> AsyncIterator["asyncio.Future[T]"]:
+    """Run `coroutine` in a task while the block runs, cancelling the task when the block leaves it unfinished."""
+    task = asyncio.ensure_future(coroutine)
+    try:
+        yield task
+    finally:
+        task.cancel()
+        # the error of the block, if any, is the one to raise
+        with suppress(asyncio.CancelledError, Exception):
+            await task
 
 
 # Ignore type checking for QIBaseJob due to missing Qiskit type stubs,
@@ -93,6 +251,339 @@ class QIBaseJob(JobV1):  # type: ignore[misc]
         self._add_circuits(run_input)
         self.program_name = self.circuits_run_data[0].circuit.name if self.circuits_run_data else "Default program"
         self.batch_job_id: Union[int, None] = None
+        self.poll_backoff = DEFAULT_POLL_BACKOFF
+        # Set once the results of the finished job are fetched, by result() or ahead of it, e.g. by a JobMonitor
+        self._final_result: Optional[Result] = None
+        # Threads asking for the result at the same time wait for the one fetching it, instead of fetching it again
+        self._result_lock = threading.Lock()
+        # The fetch in flight on each event loop, shared by concurrent result_async() calls
+        self._result_tasks: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Task[Result]] = (
+            weakref.WeakKeyDictionary()
+        )
+
+    @property
+    def _api_client_pool(self) -> Optional[ApiClientPool]:
+        """The client pool of the backend's provider, if it has one that is still open."""
+        return open_pool(getattr(self._backend, "api_client_pool", None))
+
+    def _api_client(self) -> AsyncContextManager[ApiClient]:
+        """Return the pooled client of the backend's provider, or else a new client that is closed after use."""
+        return pooled_api_client(self._api_client_pool)
+
+    def _run_sync(self, coroutine: Coroutine[Any, Any, T]) -> T:
+        """Run `coroutine` to completion, on the event loop of the client pool if there is one."""
+        return run_pooled(self._api_client_pool, coroutine)
+
+    def _host(self) -> str:
+        pool = self._api_client_pool
+        return str(pool.configuration.host if pool is not None else config().host)
+
+    def _result_cache(self) -> Optional[ResultCache]:
+        if self._backend is None:
+            return None
+        return cast(Optional[ResultCache], self._backend.options.get("result_cache"))
+
+    def _retrying(self, api_method: Callable[P, Awaitable[T]]) -> Callable[P, Awaitable[T]]:
+        """Return `api_method` with the retries of the backend's retry policy."""
+        if self._backend is None:
+            policy: Optional[RetryPolicy] = DEFAULT_RETRY_POLICY
+        else:
+            policy = cast(Optional[RetryPolicy], self._backend.options.get("retry_policy", DEFAULT_RETRY_POLICY))
+        return api_method if policy is None else policy.wrap(api_method)
+
+    def _load_cached_results(self) -> bool:
+        """Fill in the circuits whose results are in the result cache, and return whether all circuits are finished."""
+        return False
+
+    def _store_cached_results(self, circuits: List[CircuitExecutionData]) -> None:
+        """Store the results of the finished `circuits` in the result cache, if the job has one."""
+
+    async def status_async(self) -> JobStatus:
+        """Return the status of the job, without blocking the running event loop.
+
+        Jobs whose status is known without asking the platform return :meth:`status`.
+        """
+        return cast(JobStatus, self.status())
+
+    def _batch_job_ids(self) -> List[int]:
+        """Return the ids of the submitted batch jobs that make up this job, none for jobs that don't run as one."""
+        return []
+
+    async def _status_from_batch_jobs(self, batch_job_statuses: Mapping[int, BatchJobStatus]) -> JobStatus:
+        """Return the status of the job given the statuses of its batch jobs, as fetched by the caller."""
+        return await self.status_async()
+
+    def wait_for_final_state(
+        self, timeout: Optional[float] = None, wait: Optional[float] = None, callback: Optional[StatusCallback] = None
+    ) -> None:
+        """Poll the status of the job until it reaches a final state.
+
+        Unless a fixed `wait` is given, the interval between polls grows from ``poll_backoff.initial`` to
+        ``poll_backoff.maximum`` seconds, and starts over whenever the status changes, e.g. when the job leaves the
+        queue. The interval is also kept well below the execution time limit of the backend, since no job on it takes
+        longer than that.
+
+        Args:
+            timeout: Seconds to wait for the job, ``None`` to wait indefinitely.
+            wait: Fixed number of seconds between status polls, instead of the adaptive interval.
+            callback: Called after every poll that finds the job unfinished, with the job id, the status and the job,
+                e.g. to report progress.
+
+        Raises:
+            JobTimeoutError: If the job does not reach a final state before the timeout.
+        """
+        # only platform backends know their backend type, hybrid backends don't
+        get_backend_type = getattr(self._backend, "get_backend_type", None)
+        backend_type = get_backend_type() if wait is None and get_backend_type is not None else None
+        deadline = None if timeout is None else time.monotonic() + timeout
+        delays = self._poll_delays(wait, backend_type)
+        status = self.status()
+        while status not in JOB_FINAL_STATES:
+            if callback is not None:
+                callback(self.job_id(), status, self)
+            time.sleep(self._next_poll_delay(delays, deadline))
+            previous_status, status = status, self.status()
+            if status != previous_status:
+                delays = self._poll_delays(wait, backend_type)
+
+    async def wait_for_final_state_async(
+        self, timeout: Optional[float] = None, wait: Optional[float] = None, callback: Optional[StatusCallback] = None
+    ) -> None:
+        """Wait until the job reaches a final state like :meth:`wait_for_final_state`, without blocking the event loop.
+
+        Args:
+            timeout: Seconds to wait for the job, ``None`` to wait indefinitely.
+            wait: Fixed number of seconds between status polls, instead of the adaptive interval.
+            callback: Called after every poll that finds the job unfinished, with the job id, the status and the job.
+
+        Raises:
+            JobTimeoutError: If the job does not reach a final state before the timeout.
+        """
+        get_backend_type = getattr(self._backend, "get_backend_type_async", None)
+        backend_type = await get_backend_type() if wait is None and get_backend_type is not None else None
+        deadline = None if timeout is None else time.monotonic() + timeout
+        delays = self._poll_delays(wait, backend_type)
+        status = await self.status_async()
+        while status not in JOB_FINAL_STATES:
+            if callback is not None:
+                callback(self.job_id(), status, self)
+            await asyncio.sleep(self._next_poll_delay(delays, deadline))
+            previous_status, status = status, await self.status_async()
+            if status != previous_status:
+                delays = self._poll_delays(wait, backend_type)
+
+    def _poll_delays(self, wait: Optional[float], backend_type: Optional[BackendType]) -> Iterator[float]:
+        if wait is not None:
+            return itertools.repeat(wait)
+        backoff = self.poll_backoff
+        time_limit = getattr(backend_type, "job_execution_time_limit", None)
+        if isinstance(time_limit, (int, float)) and time_limit > 0:
+            maximum = max(backoff.initial, min(backoff.maximum, time_limit / 10))
+            backoff = dataclasses.replace(backoff, maximum=maximum)
+        return backoff.delays()
+
+    def _next_poll_delay(self, delays: Iterator[float], deadline: Optional[float]) -> float:
+        """Return the time until the next status poll, which is never later than the deadline."""
+        delay = next(delays)
+        if deadline is None:
+            return delay
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise JobTimeoutError(f"Timeout while waiting for job {self.job_id()}.")
+        return min(delay, remaining)
+
+    async def _fetch_job_results(self) -> None:
+        """Fetch the results of the circuits that have none yet; jobs that hold their results already have none."""
+
+    async def _collect_result_async(self) -> Result:
+        """Fetch and process the results of the finished job, and keep them for :meth:`result`."""
+        await self._fetch_job_results()
+        self._final_result = self._process_results()
+        return self._final_result
+
+    def raw_results(self, timeout: Optional[float] = None) -> List[CircuitExecutionData]:
+        """Wait for the job to finish and return the execution data of its circuits, holding the raw platform results.
+
+        Unlike :meth:`result`, the counts and shots are not converted to a Qiskit ``Result``, which saves the work for
+        callers that build their own output from the bitstrings, like the primitives.
+
+        Args:
+            timeout: Seconds to wait for the job, ``None`` to wait indefinitely.
+        """
+        if not self._load_cached_results():
+            self.wait_for_final_state(timeout=timeout)
+        self._run_sync(self._fetch_job_results())
+        return self.circuits_run_data
+
+    def iter_results(self, timeout: Optional[float] = None) -> Iterator[Tuple[int, ExperimentResult]]:
+        """Yield the result of every circuit as soon as its job has finished, without waiting for the whole batch.
+
+        The status of the individual jobs is polled with the growing interval of ``poll_backoff``.
+
+        Args:
+            timeout: Seconds to wait for all circuits, ``None`` to wait indefinitely.
+
+        Yields:
+            The index of the circuit in the job, and its experiment result.
+
+        Raises:
+            JobTimeoutError: If not all circuits finish before the timeout.
+        """
+        self._check_submitted()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        delays = self.poll_backoff.delays()
+        yielded: Set[int] = set()
+        while True:
+            self._run_sync(self._fetch_finished_experiments())
+            finished = self._finished_experiments(yielded)
+            yield from finished
+            yielded.update(idx for idx, _ in finished)
+            if len(yielded) == len(self.circuits_run_data):
+                return
+            if finished:
+                delays = self.poll_backoff.delays()
+            time.sleep(self._next_poll_delay(delays, deadline))
+
+    async def iter_results_async(self, timeout: Optional[float] = None) -> AsyncIterator[Tuple[int, ExperimentResult]]:
+        """Yield the result of every circuit as soon as its job has finished like :meth:`iter_results`."""
+        self._check_submitted()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        delays = self.poll_backoff.delays()
+        yielded: Set[int] = set()
+        while True:
+            await self._fetch_finished_experiments()
+            finished = self._finished_experiments(yielded)
+            for experiment in finished:
+                yield experiment
+            yielded.update(idx for idx, _ in finished)
+            if len(yielded) == len(self.circuits_run_data):
+                return
+            if finished:
+                delays = self.poll_backoff.delays()
+            await asyncio.sleep(self._next_poll_delay(delays, deadline))
+
+    def partial_result(self) -> Result:
+        """Return a result holding the experiments of the circuits that have finished so far, in circuit order.
+
+        Until all circuits have finished, the result is not successful and its status tells how many experiments it
+        holds. Experiments are identified by the name in their header.
+        """
+        self._check_submitted()
+        self._run_sync(self._fetch_finished_experiments())
+        return self._partial_result()
+
+    async def partial_result_async(self) -> Result:
+        """Return the experiments of the circuits that have finished so far like :meth:`partial_result`."""
+        self._check_submitted()
+        await self._fetch_finished_experiments()
+        return self._partial_result()
+
+    def _partial_result(self) -> Result:
+        indices = [idx for idx, circuit_data in enumerate(self.circuits_run_data) if circuit_data.finished]
+        return self._build_result(indices, partial=len(indices) < len(self.circuits_run_data))
+
+    def _finished_experiments(self, skip: Set[int]) -> List[Tuple[int, ExperimentResult]]:
+        return [
+            (idx, self._experiment_result(circuit_data))
+            for idx, circuit_data in enumerate(self.circuits_run_data)
+            if circuit_data.finished and idx not in skip
+        ]
+
+    def _check_submitted(self) -> None:
+        # jobs that don't run as batch jobs, like hybrid jobs, have their results once they are submitted
+        finished = bool(self.circuits_run_data) and all(
+            circuit_data.finished for circuit_data in self.circuits_run_data
+        )
+        if not self._batch_job_ids() and not finished:
+            raise RuntimeError("The job has not been submitted yet.")
+
+    async def _fetch_finished_experiments(self) -> None:
+        """Fetch the results of the circuits whose job finished since the last call, using the status of each job."""
+        pending = {
+            circuit_data.job_id: circuit_data
+            for circuit_data in self.circuits_run_data
+            if circuit_data.job_id is not None and not circuit_data.finished
+        }
+        if not pending:
+            return
+
+        async with self._api_client() as client:
+            jobs_api = JobsApi(client)
+            job_reader = PageReader[PageJob, Job]()
+            batch_jobs = await asyncio.gather(
+                *(
+                    job_reader.get_all(self._retrying(jobs_api.read_jobs_jobs_get), batch_job_id=batch_job_id)
+                    for batch_job_id in self._batch_job_ids()
+                )
+            )
+            finished_jobs = [
+                job for jobs in batch_jobs for job in jobs if job.id in pending and job.status in _FINAL_JOB_STATUSES
+            ]
+
+            results_api = ResultsApi(client)
+            result_reader = PageReader[PageResult, RawJobResult]()
+            read_results = self._retrying(results_api.read_results_by_job_id_results_job_job_id_get)
+            result_items = await asyncio.gather(
+                *(result_reader.get_all(read_results, job_id=job.id) for job in finished_jobs)
+            )
+
+        for job, result_item in zip(finished_jobs, result_items):
+            circuit_data = pending[job.id]
+            if result_item:
+                circuit_data.results = result_item[0]
+            else:
+                circuit_data.system_message = {
+                    "message": job.message if job.status == QIJobStatus.FAILED else "No Results",
+                    "trace_id": job.trace_id,
+                }
+        self._store_cached_results([pending[job.id] for job in finished_jobs])
+
+    def _result(self, wait_for_results: bool, timeout: Optional[float]) -> Result:
+        """Return the result of the job, fetching it once; concurrent callers share the fetch in flight."""
+        if self._final_result is not None:
+            return self._final_result
+        # waiting for another caller's fetch counts towards the timeout as well
+        deadline = None if timeout is None else time.monotonic() + timeout
+        if not self._result_lock.acquire(timeout=-1 if timeout is None else timeout):
+            raise JobTimeoutError(f"Timeout while waiting for the result of job {self.job_id()}.")
+        try:
+            # all results in the result cache means the job has finished, without asking the platform
+            if self._final_result is None and not self._load_cached_results():
+                if wait_for_results:
+                    remaining = None if deadline is None else max(deadline - time.monotonic(), 0.0)
+                    self.wait_for_final_state(timeout=remaining)
+                elif not self.done():
+                    raise RuntimeError(f"(Batch)Job status is {self.status()}.")
+            if self._final_result is None:
+                self._run_sync(self._fetch_job_results())
+                self._final_result = self._process_results()
+            return self._final_result
+        finally:
+            self._result_lock.release()
+
+    async def _result_async(self, wait_for_results: bool, timeout: Optional[float]) -> Result:
+        if self._final_result is not None:
+            return self._final_result
+        loop = asyncio.get_running_loop()
+        task = self._result_tasks.get(loop)
+        if task is None:
+            task = self._result_tasks[loop] = loop.create_task(self._fetch_result_async(wait_for_results, timeout))
+            task.add_done_callback(lambda _: self._result_tasks.pop(loop, None))
+        # A cancelled caller leaves the fetch running for the others
+        return await asyncio.shield(task)
+
+    async def _fetch_result_async(self, wait_for_results: bool, timeout: Optional[float]) -> Result:
+        if self._load_cached_results():
+            pass
+        elif wait_for_results:
+            await self.wait_for_final_state_async(timeout=timeout)
+        else:
+            status = await self.status_async()
+            if status not in JOB_FINAL_STATES:
+                raise RuntimeError(f"(Batch)Job status is {status}.")
+        await self._fetch_job_results()
+        self._final_result = self._process_results()
+        return self._final_result
 
     def _add_circuits(self, circuits: Union[QuantumCircuit, List[QuantumCircuit]]) -> None:
         """Add circuits to the list of circuits to be run."""
@@ -101,36 +592,22 @@ class QIBaseJob(JobV1):  # type: ignore[misc]
 
     def _process_results(self) -> Result:
         """Process the raw job results obtained from QuantumInspire."""
+        return self._build_result(range(len(self.circuits_run_data)))
 
+    def _build_result(self, circuit_indices: Iterable[int], partial: bool = False) -> Result:
+        """Build a result holding the experiments of the circuits at `circuit_indices`, in that order."""
         results = []
-        batch_job_success = [False] * len(self.circuits_run_data)
+        experiment_success = []
         failed_experiments = dict()
 
-        for idx, circuit_data in enumerate(self.circuits_run_data):
-            qi_result = circuit_data.results
-            circuit_name = circuit_data.circuit.name
-            num_qubits = circuit_data.circuit.num_qubits
-            num_clbits = circuit_data.circuit.num_clbits
-            num_bits = num_qubits if (num_clbits == 0) else num_clbits
-            exp_header = {"name": circuit_name, "memory_slots": num_bits}
-
-            if qi_result is None:
-                assert circuit_data.system_message is not None
-                failed_experiments[circuit_name] = circuit_data.system_message
-                trace_id = circuit_data.system_message.get("trace_id", "")
-                error_message = circuit_data.system_message.get("message", "")
-                experiment_result = self._create_empty_experiment_result(
-                    exp_header=exp_header, trace_id=trace_id, message=error_message
-                )
-                results.append(experiment_result)
-                continue
-
-            experiment_result = self._create_experiment_result(
-                exp_header=exp_header,
-                result=qi_result,
-            )
+        for idx in circuit_indices:
+            circuit_data = self.circuits_run_data[idx]
+            experiment_result = self._experiment_result(circuit_data)
             results.append(experiment_result)
-            batch_job_success[idx] = qi_result.shots_done > 0
+            if circuit_data.results is None:
+                assert circuit_data.system_message is not None
+                failed_experiments[circuit_data.circuit.name] = circuit_data.system_message
+            experiment_success.append(circuit_data.results is not None and circuit_data.results.shots_done > 0)
 
         if failed_experiments:
             warning_message = (
@@ -141,30 +618,66 @@ class QIBaseJob(JobV1):  # type: ignore[misc]
             )
             warnings.warn(warning_message, category=ExperimentFailedWarning)
 
+        success = all(experiment_success) and not partial
+        if partial:
+            status = f"Partial result: {len(results)} of {len(self.circuits_run_data)} experiments finished"
+        else:
+            status = "Result successful" if success else "Result failed"
         result = Result(
             backend_name=self.backend().name,
             backend_version="1.0.0",
             qobj_id="",
-            job_id=str(self.batch_job_id),
-            success=all(batch_job_success),
+            job_id=self._result_job_id(),
+            success=success,
             results=results,
-            status="Result successful" if all(batch_job_success) else "Result failed",
+            status=status,
             system_messages=failed_experiments,
         )
         return result
 
+    def _result_job_id(self) -> str:
+        return str(self.batch_job_id)
+
+    def _experiment_result(self, circuit_data: CircuitExecutionData) -> ExperimentResult:
+        """Return the experiment result of a finished circuit."""
+        num_qubits = circuit_data.circuit.num_qubits
+        num_clbits = circuit_data.circuit.num_clbits
+        num_bits = num_qubits if (num_clbits == 0) else num_clbits
+        exp_header = {"name": circuit_data.circuit.name, "memory_slots": num_bits}
+
+        if circuit_data.results is None:
+            assert circuit_data.system_message is not None
+            return self._create_empty_experiment_result(
+                exp_header=exp_header,
+                trace_id=circuit_data.system_message.get("trace_id", ""),
+                message=circuit_data.system_message.get("message", ""),
+            )
+        memory_format = self.backend().options.get("memory_format", MemoryFormat.HEX)
+        return self._create_experiment_result(
+            exp_header=exp_header, result=circuit_data.results, memory_format=MemoryFormat(memory_format)
+        )
+
     @staticmethod
     def _create_experiment_result(
         exp_header: Dict[str, Any],
         result: RawJobResult,
+        memory_format: MemoryFormat = MemoryFormat.HEX,
     ) -> ExperimentResult:
         """Create an ExperimentResult instance based on RawJobResult parameters."""
-        counts = {hex(int(key, 2)): value for key, value in result.results.items()}
-        memory = [hex(int(measurement, 2)) for measurement in result.raw_data] if result.raw_data else None
+        counts = counts_to_hex(result.results)
+        shot_data: Dict[str, Any] = {}
+        if result.raw_data:
+            if memory_format == MemoryFormat.PACKED:
+                num_bits = max(exp_header["memory_slots"], len(result.raw_data[0]))
+                shot_data["bit_array"] = bitstrings_to_bit_array(result.raw_data, num_bits)
+            elif memory_format == MemoryFormat.BITSTRING:
+                shot_data["memory"] = result.raw_data
+            else:
+                shot_data["memory"] = bitstrings_to_hex(result.raw_data)
 
         experiment_data = ExperimentResultData(
             counts={} if counts is None else counts,
-            memory=memory,
+            **shot_data,
         )
         return ExperimentResult(
             shots=result.shots_done,
@@ -191,61 +704,382 @@ class QIBaseJob(JobV1):  # type: ignore[misc]
 class QIJob(QIBaseJob):
     """A wrapper class for QuantumInspire batch jobs to integrate with Qiskit's Job interface."""
 
+    def __init__(
+        self,
+        run_input: Union[QuantumCircuit, List[QuantumCircuit]],
+        backend: Union[BackendV2, None],
+        session: Optional["QISession"] = None,
+        **kwargs: Any,
+    ) -> None:
+        """Initialize a QIJob instance.
+
+        Args:
+            run_input: A single/list of Qiskit QuantumCircuit object(s).
+            backend: The backend on which the job is run.
+            session: Session whose platform objects are reused on submission, if any.
+            **kwargs: Additional keyword arguments passed to the parent `Job` class.
+        """
+        super().__init__(run_input, backend, **kwargs)
+        self._session = session
+        # The submission of this job in the submission journal, if the job is journaled
+        self.submission_id: Optional[int] = None
+        self._submission_journal: Optional[SubmissionJournal] = None
+        # The project and batch job of a submission that failed before enqueuing, reused when submitting again
+        self._unqueued_submission_ids: Optional[Tuple[int, int]] = None
+
     def submit(self) -> None:
-        self._check_backendtype_job_limits()
-        run_async(self._submit_async())
+        self._check_backendtype_job_limits(self.backend().get_backend_type())
+        self._run_sync(self._submit_async())
+
+    async def submit_async(self) -> None:
+        """Submit the (batch)job like :meth:`submit`, on the running event loop."""
+        self._check_backendtype_job_limits(await self.backend().get_backend_type_async())
+        await self._submit_async()
 
     async def _submit_async(self) -> None:
         """Submit the (batch)job to the quantum inspire backend.
 
-        Use compute-api-client to call the cjm endpoints in the correct order, to submit the jobs.
+        Use compute-api-client to call the cjm endpoints in the correct order, to submit the jobs. With a submission
+        journal, every created object is recorded, and a submission that was interrupted before is finished with the
+        recorded objects instead of creating them again.
         """
         options = cast(dict[str, Any], self.backend().options)
-        configuration = config()
-        settings = ApiSettings.from_config_file()
+        pool = self._api_client_pool
+        configuration = pool.configuration if pool is not None else config()
+        team_member_id = METADATA_CACHE.team_member_id()
+
+        journal = self._submission_journal or cast(Optional[SubmissionJournal], options.get("submission_journal"))
+        # the journal commits every write to disk, keep that off the event loop
+        submission = await asyncio.to_thread(self._journaled_submission, journal, configuration.host, options)
+        recorder = _SubmissionRecorder(journal, submission)
+        raw_data_enabled = cast(bool, options.get("memory")) if submission is None else submission.raw_data_enabled
+        number_of_shots = options.get("shots") if submission is None else submission.number_of_shots
+        if submission is not None:
+            self._restore_journaled_circuits(submission)
+            if submission.enqueued:
+                self.batch_job_id = submission.batch_job_id
+                return
+        resumed = (submission is not None and submission.batch_job_id is not None) or (
+            self._unqueued_submission_ids is not None
+        )
+
+        # convert the circuits in the background while the project and batch job are being created
+        conversion = self._convert_circuits(
+            cast(Optional[int], options.get("cqasm_workers", DEFAULT_CQASM_WORKERS)),
+            cast(Optional[CompileCache], options.get("compile_cache")),
+        )
 
         # call create algorithm
-        async with ApiClient(configuration) as api_client:
-            language = await self._get_language(api_client, "cqasm", "3.0")
+        async with _in_background(conversion) as converted, self._api_client() as api_client:
+            language = await METADATA_CACHE.language(
+                configuration.host, "cqasm", "3.0", lambda: self._get_language(api_client, "cqasm", "3.0")
+            )
             if language is None:
                 raise RuntimeError("No cqasm v3.0 language id returned by the platform")
 
-            team_member_id = settings.auths[settings.default_host].team_member_id
-            assert isinstance(team_member_id, int)
+            project_id, batch_job_id = await self._get_submission_ids(api_client, team_member_id, recorder)
+            self._unqueued_submission_ids = (project_id, batch_job_id)
+            # jobs created just before the submission was interrupted, whose ids never made it to the journal
+            unrecorded_jobs: Dict[int, List[int]] = {}
+            if submission is not None and resumed:
+                unrecorded_jobs = await self._fetch_unrecorded_jobs(api_client, batch_job_id, submission)
+            await converted
 
-            project = await self._create_project(api_client, team_member_id)
-            batch_job = await self._create_batch_job(api_client, backend_type_id=self.backend().id)
+            per_batch = options.get("submission_mode", SubmissionMode.PER_CIRCUIT) == SubmissionMode.PER_BATCH
+            batch_commit_id = await self._get_batch_commit_id(api_client, project_id, per_batch, recorder)
+
+            upload_cache = cast(Optional[UploadCache], options.get("upload_cache"))
+            circuit_indices = {id(circuit_data): index for index, circuit_data in enumerate(self.circuits_run_data)}
 
             async def job_run_sequence(
                 in_api_client: ApiClient,
-                in_project: Project,
-                in_batch_job: BatchJob,
+                in_project_id: int,
+                in_batch_job_id: int,
                 circuit_data: CircuitExecutionData,
             ) -> None:
-                algorithm = await self._create_algorithm(in_api_client, in_project.id)
-                commit = await self._create_commit(in_api_client, algorithm.id)
-                file = await self._create_file(in_api_client, commit.id, language.id, circuit_data.circuit)
-                job: Job = await self._create_job(
-                    in_api_client,
-                    file.id,
-                    in_batch_job.id,
-                    raw_data_enabled=cast(bool, options.get("memory")),
-                    number_of_shots=options.get("shots"),
-                )
-                circuit_data.job_id = job.id
+                if circuit_data.job_id is not None:
+                    # created before the submission was interrupted
+                    return
+                circuit_index = circuit_indices[id(circuit_data)]
+                journaled_circuit = recorder.circuit(circuit_index)
+
+                async def create_job(file_id: int) -> None:
+                    # recorded first, so the job is found in the batch job when the submission is interrupted now
+                    await recorder.record_circuit(circuit_index, file_id=file_id)
+                    job: Job = await self._create_job(
+                        in_api_client,
+                        file_id,
+                        in_batch_job_id,
+                        raw_data_enabled=raw_data_enabled,
+                        number_of_shots=(
+                            circuit_data.number_of_shots
+                            if circuit_data.number_of_shots is not None
+                            else number_of_shots
+                        ),
+                    )
+                    circuit_data.job_id = job.id
+                    await recorder.record_circuit(circuit_index, job_id=job.id)
+
+                if journaled_circuit.file_id is not None:
+                    await self._resume_uploaded_circuit(
+                        circuit_index, journaled_circuit.file_id, unrecorded_jobs, recorder, create_job
+                    )
+                    return
+
+                assert circuit_data.cqasm is not None
+                content = circuit_data.cqasm
+                cache_key = None
+                if upload_cache is not None:
+                    cache_key = upload_cache.key(configuration.host, language.id, content)
+                    cached_file_id = upload_cache.get(cache_key)
+                    if cached_file_id is not None:
+                        try:
+                            await create_job(cached_file_id)
+                            circuit_data.cqasm = None
+                            return
+                        except ApiException as exc:
+                            if not _rejects_cached_file(exc):
+                                raise
+                            # The file no longer exists on the platform, or may no longer be used: upload it again
+                            upload_cache.invalidate(cache_key)
+
+                commit_id = batch_commit_id
+                if commit_id is None:
+                    commit_id = await self._get_circuit_commit_id(
+                        in_api_client, in_project_id, circuit_index, journaled_circuit, recorder
+                    )
+                file = await self._create_file(in_api_client, commit_id, language.id, circuit_data.circuit, content)
+                await create_job(file.id)
+                if upload_cache is not None and cache_key is not None:
+                    upload_cache.put(cache_key, file.id)
+                # the platform holds the cQASM now, no need to keep a copy of it
+                circuit_data.cqasm = None
+
+            # iterate over the circuits, keeping at most `submit_concurrency` of them in flight
+            await self._run_submit_pipeline(
+                lambda circuit_data: job_run_sequence(api_client, project_id, batch_job_id, circuit_data),
+                concurrency=cast(int, options.get("submit_concurrency", DEFAULT_SUBMIT_CONCURRENCY)),
+                progress_callback=options.get("submit_progress_callback"),
+            )
+            if upload_cache is not None:
+                upload_cache.flush()
+            self.batch_job_id = batch_job_id
+            try:
+                # the batch job of an interrupted submission may have been enqueued just before the interruption
+                if not resumed or (await self._fetch_batchjob_status()).status == BatchJobStatus.PLANNED:
+                    await self._enqueue_batch_job(api_client, batch_job_id)
+            except BaseException:
+                # not submitted yet, submitting again enqueues the batch job
+                self.batch_job_id = None
+                raise
+            self._unqueued_submission_ids = None
+            await recorder.finish()
+
+    def _restore_journaled_circuits(self, submission: Submission) -> None:
+        """Restore the job ids, the cQASM that can't be written from the circuits and the shots of `submission`."""
+        for index, circuit_data in enumerate(self.circuits_run_data):
+            journaled_circuit = submission.circuits.get(index)
+            circuit_data.job_id = journaled_circuit.job_id if journaled_circuit is not None else None
+            if journaled_circuit is not None and circuit_data.job_id is None and circuit_data.cqasm is None:
+                # e.g. the cQASM of a parameter_binds run, which can't be written from the circuit again
+                circuit_data.cqasm = journaled_circuit.cqasm
+            if journaled_circuit is not None and journaled_circuit.number_of_shots is not None:
+                circuit_data.number_of_shots = journaled_circuit.number_of_shots
+
+    async def _get_submission_ids(
+        self, api_client: ApiClient, team_member_id: int, recorder: "_SubmissionRecorder"
+    ) -> Tuple[int, int]:
+        """Return the project and batch job of the submission, creating and recording those that were not journaled.
+
+        Those of an earlier submission of this job that failed before enqueuing its batch job are reused.
+        """
+        if self._unqueued_submission_ids is not None:
+            return self._unqueued_submission_ids
+        submission = recorder.submission
+        project_id = submission.project_id if submission is not None else None
+        if project_id is None:
+            project_id = await self._get_project_id(api_client, team_member_id)
+            await recorder.record(project_id=project_id)
+        batch_job_id = submission.batch_job_id if submission is not None else None
+        if batch_job_id is None:
+            batch_job = await self._create_batch_job(api_client, backend_type_id=self.backend().id)
+            batch_job_id = batch_job.id
+            await recorder.record(batch_job_id=batch_job_id)
+        return project_id, batch_job_id
 
-            # iterate over the circuits
-            run_coroutines = (
-                job_run_sequence(api_client, project, batch_job, circuit_run_data)
-                for circuit_run_data in self.circuits_run_data
+    async def _get_batch_commit_id(
+        self, api_client: ApiClient, project_id: int, per_batch: bool, recorder: "_SubmissionRecorder"
+    ) -> Optional[int]:
+        """Return the commit shared by all circuits, journaled or created when submitting `per_batch`, if any.
+
+        The algorithm of the commit is recorded before the commit is created, so it is reused when the submission is
+        interrupted in between.
+        """
+        submission = recorder.submission
+        if submission is not None and submission.commit_id is not None:
+            return submission.commit_id
+        if not per_batch:
+            return None
+        # all files of the batch are attached to a single commit
+        algorithm_id = submission.algorithm_id if submission is not None else None
+        if algorithm_id is None:
+            algorithm_id = await self._get_algorithm_id(api_client, project_id)
+            await recorder.record(algorithm_id=algorithm_id)
+        commit = await self._create_commit(api_client, algorithm_id)
+        commit_id: int = commit.id
+        await recorder.record(commit_id=commit_id)
+        return commit_id
+
+    async def _get_circuit_commit_id(
+        self,
+        api_client: ApiClient,
+        project_id: int,
+        circuit_index: int,
+        journaled_circuit: JournaledCircuit,
+        recorder: "_SubmissionRecorder",
+    ) -> int:
+        """Return the commit of circuit `circuit_index`, creating and recording it and its algorithm if needed."""
+        if journaled_circuit.commit_id is not None:
+            return journaled_circuit.commit_id
+        algorithm_id = journaled_circuit.algorithm_id
+        if algorithm_id is None:
+            algorithm_id = await self._get_algorithm_id(api_client, project_id)
+            await recorder.record_circuit(circuit_index, algorithm_id=algorithm_id)
+        commit = await self._create_commit(api_client, algorithm_id)
+        commit_id: int = commit.id
+        await recorder.record_circuit(circuit_index, commit_id=commit_id)
+        return commit_id
+
+    async def _resume_uploaded_circuit(
+        self,
+        circuit_index: int,
+        file_id: int,
+        unrecorded_jobs: Dict[int, List[int]],
+        recorder: "_SubmissionRecorder",
+        create_job: Callable[[int], Awaitable[None]],
+    ) -> None:
+        """Finish circuit `circuit_index`, whose file `file_id` was uploaded before the submission was interrupted.
+
+        The job created for the file just before the interruption is taken from `unrecorded_jobs`, if any, instead of
+        creating another one with `create_job`.
+        """
+        circuit_data = self.circuits_run_data[circuit_index]
+        job_ids = unrecorded_jobs.get(file_id)
+        if job_ids:
+            circuit_data.job_id = job_ids.pop()
+            await recorder.record_circuit(circuit_index, job_id=circuit_data.job_id)
+        else:
+            await create_job(file_id)
+        circuit_data.cqasm = None
+
+    async def _fetch_unrecorded_jobs(
+        self, api_client: ApiClient, batch_job_id: int, submission: Submission
+    ) -> Dict[int, List[int]]:
+        """Return the ids of the jobs in the batch job that are not in `submission` yet, by the id of their file.
+
+        Only the files of circuits with a recorded file and no recorded job are looked up.
+        """
+        file_ids = {
+            journaled_circuit.file_id
+            for journaled_circuit in submission.circuits.values()
+            if journaled_circuit.file_id is not None and journaled_circuit.job_id is None
+        }
+        if not file_ids:
+            return {}
+        recorded_job_ids = {journaled_circuit.job_id for journaled_circuit in submission.circuits.values()}
+        jobs_api = JobsApi(api_client)
+        jobs = await PageReader[PageJob, Job]().get_all(
+            self._retrying(jobs_api.read_jobs_jobs_get), batch_job_id=batch_job_id
+        )
+        unrecorded_jobs: Dict[int, List[int]] = {}
+        for job in jobs:
+            if job.file_id in file_ids and job.id not in recorded_job_ids:
+                unrecorded_jobs.setdefault(job.file_id, []).append(job.id)
+        return unrecorded_jobs
+
+    def _journaled_submission(
+        self, journal: Optional[SubmissionJournal], host: str, options: Mapping[str, Any]
+    ) -> Optional[Submission]:
+        """Return the journaled submission of this job, starting a new one if it has none yet."""
+        self._submission_journal = journal
+        if journal is None:
+            return None
+        if self.submission_id is None:
+            self.submission_id = journal.begin(
+                host,
+                self.backend().name,
+                self.backend().id,
+                [circuit_data.circuit for circuit_data in self.circuits_run_data],
+                options.get("shots"),
+                bool(options.get("memory")),
+                [circuit_data.cqasm for circuit_data in self.circuits_run_data],
+                [circuit_data.number_of_shots for circuit_data in self.circuits_run_data],
             )
-            await asyncio.gather(*run_coroutines)
-            await self._enqueue_batch_job(api_client, batch_job.id)
-            self.batch_job_id = batch_job.id
+        submission = journal.get(self.submission_id)
+        if submission.host != host:
+            raise ValueError(f"Submission {self.submission_id} was made to {submission.host}, not to {host}")
+        return submission
+
+    async def _convert_circuits(self, workers: Optional[int], compile_cache: Optional[CompileCache] = None) -> None:
+        """Convert all circuits that have no cQASM yet, in `workers` processes, without blocking the event loop.
+
+        Circuits found in `compile_cache` are not converted again, circuits that already have a job not at all.
+        """
+        circuits_to_convert = [
+            circuit_data
+            for circuit_data in self.circuits_run_data
+            if circuit_data.cqasm is None and circuit_data.job_id is None
+        ]
+        dumps_many = compile_cache.dumps_many if compile_cache is not None else cqasm.dumps_many
+        contents = await asyncio.to_thread(
+            dumps_many, [circuit_data.circuit for circuit_data in circuits_to_convert], workers
+        )
+        for circuit_data, content in zip(circuits_to_convert, contents):
+            circuit_data.cqasm = content
+
+    async def _run_submit_pipeline(
+        self,
+        submit_circuit: Callable[[CircuitExecutionData], Awaitable[None]],
+        concurrency: int,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+    ) -> None:
+        """Submit all circuits with a fixed number of workers.
+
+        Each worker takes the next circuit as soon as its previous one has been uploaded, so a steady number of
+        requests is in flight instead of one burst for the whole batch. When a circuit fails to upload, the remaining
+        workers are cancelled, and the error is raised once they have stopped.
 
-    def _check_backendtype_job_limits(self) -> None:
+        Args:
+            submit_circuit: Coroutine function performing all platform calls for a single circuit.
+            concurrency: Maximum number of circuits that are submitted at the same time.
+            progress_callback: Called as ``progress_callback(uploaded, total)`` after each uploaded circuit.
+        """
+        total = len(self.circuits_run_data)
+        pending = iter(self.circuits_run_data)
+        uploaded = 0
+
+        async def worker() -> None:
+            nonlocal uploaded
+            for circuit_data in pending:
+                await submit_circuit(circuit_data)
+                uploaded += 1
+                logger.debug("Uploaded %d/%d circuits of %s", uploaded, total, self.program_name)
+                if progress_callback is not None:
+                    progress_callback(uploaded, total)
+
+        workers = [asyncio.ensure_future(worker()) for _ in range(min(max(concurrency, 1), total))]
+        try:
+            await asyncio.gather(*workers)
+        except BaseException:
+            for task in workers:
+                task.cancel()
+            # let the workers unwind, so none is left running after the error is raised
+            await asyncio.gather(*workers, return_exceptions=True)
+            raise
+        logger.info("Uploaded %d circuits of %s", total, self.program_name)
+
+    def _check_backendtype_job_limits(self, backend_type: BackendType) -> None:
         """Check if the submitted jobs are within batchjob size limits of the backendtype."""
-        backend_type: BackendType = self.backend().get_backend_type()
         max_jobs_per_batch_job = backend_type.max_jobs_per_batch_job
         batch_job_size = len(self.circuits_run_data)
         if batch_job_size <= max_jobs_per_batch_job:
@@ -256,6 +1090,28 @@ class QIJob(QIBaseJob):
         )
         raise ValueError(error_message)
 
+    async def _get_project_id(self, api_client: ApiClient, owner_id: int) -> int:
+        """Return the project to submit to: the session's project if there is a session, a new one otherwise."""
+
+        async def create_project() -> int:
+            project = await self._create_project(api_client, owner_id)
+            return cast(int, project.id)
+
+        if self._session is None:
+            return await create_project()
+        return await self._session.get_project_id(create_project)
+
+    async def _get_algorithm_id(self, api_client: ApiClient, project_id: int) -> int:
+        """Return the algorithm to commit a circuit to, shared across the session if it reuses its algorithm."""
+
+        async def create_algorithm() -> int:
+            algorithm = await self._create_algorithm(api_client, project_id)
+            return cast(int, algorithm.id)
+
+        if self._session is None or not self._session.reuse_algorithm:
+            return await create_algorithm()
+        return await self._session.get_algorithm_id(create_algorithm)
+
     async def _create_project(self, api_client: ApiClient, owner_id: int) -> Project:
         api_instance = ProjectsApi(api_client)
         obj = ProjectIn(
@@ -264,14 +1120,14 @@ class QIJob(QIBaseJob):
             description=self.program_name,
             starred=False,
         )
-        return await api_instance.create_project_projects_post(obj)
+        return await self._retrying(api_instance.create_project_projects_post)(obj)
 
     async def _create_algorithm(self, api_client: ApiClient, project_id: int) -> Algorithm:
         api_instance = AlgorithmsApi(api_client)
         obj = AlgorithmIn(
             project_id=project_id, type=AlgorithmType.QUANTUM, shared=ShareType.PRIVATE, name=self.program_name
         )
-        return await api_instance.create_algorithm_algorithms_post(obj)
+        return await self._retrying(api_instance.create_algorithm_algorithms_post)(obj)
 
     async def _create_commit(self, api_client: ApiClient, algorithm_id: int) -> Commit:
         api_instance = CommitsApi(api_client)
@@ -279,26 +1135,26 @@ class QIJob(QIBaseJob):
             description=f"Commit created by {self.program_name}",
             algorithm_id=algorithm_id,
         )
-        return await api_instance.create_commit_commits_post(obj)
+        return await self._retrying(api_instance.create_commit_commits_post)(obj)
 
     async def _create_file(
-        self, api_client: ApiClient, commit_id: int, language_id: int, circuit: QuantumCircuit
+        self, api_client: ApiClient, commit_id: int, language_id: int, circuit: QuantumCircuit, content: str
     ) -> File:
         api_instance = FilesApi(api_client)
         obj = FileIn(
             commit_id=commit_id,
-            content=cqasm.dumps(circuit),
+            content=content,
             language_id=language_id,
             compile_stage=CompileStage.NONE,
             compile_properties={},
             name=circuit.name,
         )
-        return await api_instance.create_file_files_post(obj)
+        return await self._retrying(api_instance.create_file_files_post)(obj)
 
     async def _create_batch_job(self, api_client: ApiClient, backend_type_id: int) -> BatchJob:
         api_instance = BatchJobsApi(api_client)
         obj = BatchJobIn(backend_type_id=backend_type_id)
-        return await api_instance.create_batch_job_batch_jobs_post(obj)
+        return await self._retrying(api_instance.create_batch_job_batch_jobs_post)(obj)
 
     async def _create_job(
         self,
@@ -315,17 +1171,17 @@ class QIJob(QIBaseJob):
             number_of_shots=number_of_shots,
             raw_data_enabled=raw_data_enabled,
         )
-        return await api_instance.create_job_jobs_post(obj)
+        return await self._retrying(api_instance.create_job_jobs_post)(obj)
 
     async def _enqueue_batch_job(self, api_client: ApiClient, batch_job_id: int) -> BatchJob:
         api_instance = BatchJobsApi(api_client)
-        return await api_instance.enqueue_batch_job_batch_jobs_id_enqueue_patch(batch_job_id)
+        return await self._retrying(api_instance.enqueue_batch_job_batch_jobs_id_enqueue_patch)(batch_job_id)
 
     async def _get_language(
         self, api_client: ApiClient, language_name: str, language_version: str
     ) -> Union[Language, None]:
         language_api_instance = LanguagesApi(api_client)
-        languages_page = await language_api_instance.read_languages_languages_get()
+        languages_page = await self._retrying(language_api_instance.read_languages_languages_get)()
         for lan in languages_page.items:
             if language_name.lower() == lan.name.lower():
                 if language_version == lan.version:
@@ -335,20 +1191,25 @@ class QIJob(QIBaseJob):
 
     async def _fetch_job_results(self) -> None:
         """Fetch results for job_ids from CJM using api client."""
-        async with ApiClient(config()) as client:
+        self._load_cached_results()
+        # circuits whose results were fetched while streaming them, or found in the result cache, are not fetched
+        circuits_to_fetch = [circuit_data for circuit_data in self.circuits_run_data if not circuit_data.finished]
+        if not circuits_to_fetch:
+            return
+
+        async with self._api_client() as client:
             page_reader = PageReader[PageResult, RawJobResult]()
             results_api = ResultsApi(client)
             pagination_handler = page_reader.get_all
-            results_handler = results_api.read_results_by_job_id_results_job_job_id_get
+            results_handler = self._retrying(results_api.read_results_by_job_id_results_job_job_id_get)
 
             result_tasks = [
-                pagination_handler(results_handler, job_id=circuit_data.job_id)
-                for circuit_data in self.circuits_run_data
+                pagination_handler(results_handler, job_id=circuit_data.job_id) for circuit_data in circuits_to_fetch
             ]
             result_items = await asyncio.gather(*result_tasks)
             job_ids_to_check = []
 
-            for circuit_data, result_item in zip(self.circuits_run_data, result_items):
+            for circuit_data, result_item in zip(circuits_to_fetch, result_items):
                 circuit_data.results = None if not result_item else result_item[0]
                 if circuit_data.results is None:
                     assert circuit_data.job_id is not None
@@ -357,6 +1218,32 @@ class QIJob(QIBaseJob):
             if job_ids_to_check:
                 await self._fetch_failed_jobs_message(client, job_ids_to_check)
 
+        self._store_cached_results(circuits_to_fetch)
+
+    def _load_cached_results(self) -> bool:
+        result_cache = self._result_cache()
+        pending = [circuit_data for circuit_data in self.circuits_run_data if not circuit_data.finished]
+        if pending and result_cache is not None and self.batch_job_id is not None:
+            job_ids = [circuit_data.job_id for circuit_data in pending if circuit_data.job_id is not None]
+            cached = result_cache.get_many(self._host(), self.batch_job_id, job_ids)
+            for circuit_data in pending:
+                outcome = cached.get(circuit_data.job_id) if circuit_data.job_id is not None else None
+                if outcome is not None:
+                    circuit_data.results = outcome.result
+                    circuit_data.system_message = outcome.system_message
+        return bool(self.circuits_run_data) and all(circuit_data.finished for circuit_data in self.circuits_run_data)
+
+    def _store_cached_results(self, circuits: List[CircuitExecutionData]) -> None:
+        result_cache = self._result_cache()
+        if result_cache is None or self.batch_job_id is None:
+            return
+        outcomes = {
+            circuit_data.job_id: CachedResult(circuit_data.results, circuit_data.system_message)
+            for circuit_data in circuits
+            if circuit_data.job_id is not None and circuit_data.finished
+        }
+        result_cache.put_many(self._host(), self.batch_job_id, outcomes)
+
     async def _fetch_failed_jobs_message(self, api_client: ApiClient, job_ids_to_check: List[int]) -> None:
         """Fetch messages for failed jobs and update circuit data accordingly.
 
@@ -367,7 +1254,8 @@ class QIJob(QIBaseJob):
 
         jobs_api = JobsApi(api_client)
 
-        job_tasks = [jobs_api.read_job_jobs_id_get(id=_id) for _id in job_ids_to_check]
+        read_job = self._retrying(jobs_api.read_job_jobs_id_get)
+        job_tasks = [read_job(id=_id) for _id in job_ids_to_check]
 
         jobs: List[Job] = await asyncio.gather(*job_tasks)
 
@@ -385,25 +1273,28 @@ class QIJob(QIBaseJob):
 
     def status(self) -> JobStatus:
         """Return the status of the (batch)job, among the values of ``JobStatus``."""
+        return self._run_sync(self.status_async())
 
-        # mapping of QI BatchJobStatus to Qiskit JobStatus
-        status_map = {
-            BatchJobStatus.QUEUED: JobStatus.QUEUED,
-            BatchJobStatus.RESERVED: JobStatus.QUEUED,
-            BatchJobStatus.PLANNED: JobStatus.QUEUED,
-            BatchJobStatus.RUNNING: JobStatus.RUNNING,
-            BatchJobStatus.FINISHED: JobStatus.DONE,
-        }
+    async def status_async(self) -> JobStatus:
+        """Return the status of the (batch)job like :meth:`status`, on the running event loop."""
+        batch_job = await self._fetch_batchjob_status()
+        return _BATCH_JOB_STATUS_MAP[batch_job.status]
 
-        batch_job = run_async(self._fetch_batchjob_status())
-        return status_map[batch_job.status]
+    def _batch_job_ids(self) -> List[int]:
+        return [] if self.batch_job_id is None else [self.batch_job_id]
+
+    async def _status_from_batch_jobs(self, batch_job_statuses: Mapping[int, BatchJobStatus]) -> JobStatus:
+        assert self.batch_job_id is not None
+        return _BATCH_JOB_STATUS_MAP[batch_job_statuses[self.batch_job_id]]
 
     async def _fetch_batchjob_status(self) -> BatchJob:
-        async with ApiClient(config()) as api_client:
+        async with self._api_client() as api_client:
             api_instance = BatchJobsApi(api_client)
 
             page_reader = PageReader[PageBatchJob, BatchJob]()
-            batch_job = await page_reader.get_single(api_instance.read_batch_jobs_batch_jobs_get, id=self.batch_job_id)
+            batch_job = await page_reader.get_single(
+                self._retrying(api_instance.read_batch_jobs_batch_jobs_get), id=self.batch_job_id
+            )
             if batch_job is None:
                 raise RuntimeError(f"No (batch)job with id {self.batch_job_id}")
 
@@ -414,7 +1305,8 @@ class QIJob(QIBaseJob):
 
         Uses Qiskit serialization to write circuits to a .qpy file, and includes
         backend and and batch_job information in the metadata so that we can recover
-        the associated data later.
+        the associated data later. The circuits of the job are left unchanged; see
+        :meth:`serialize_many` for a compact format holding many jobs and their results.
 
         Args:
             file_path: The path to the file where the job information will be stored.
@@ -422,23 +1314,70 @@ class QIJob(QIBaseJob):
         if len(self.circuits_run_data) == 0:
             raise ValueError("No circuits to serialize")
 
+        circuits = []
+        for circuit_data in self.circuits_run_data:
+            # copies carry their own metadata, so the ids don't end up in the circuits of the user
+            circuit = circuit_data.circuit.copy()
+            circuit.metadata.update(
+                {
+                    "job_id": circuit_data.job_id,
+                    "backend_type_name": self.backend().name,
+                    "backend_type_id": self.backend().id,
+                    "batch_job_id": self.batch_job_id,
+                }
+            )
+            circuits.append(circuit)
+
         with open(file_path, "wb") as file:
-            for circuit_data in self.circuits_run_data:
-                circuit_data.circuit.metadata["job_id"] = circuit_data.job_id
-                circuit_data.circuit.metadata["backend_type_name"] = self.backend().name
-                circuit_data.circuit.metadata["backend_type_id"] = self.backend().id
-                circuit_data.circuit.metadata["batch_job_id"] = self.batch_job_id
+            qpy.dump(circuits, file)
+
+    @staticmethod
+    def serialize_many(jobs: Iterable["QIJob"], file_path: Union[str, Path], include_results: bool = True) -> None:
+        """Serialize many jobs to a single compressed archive.
 
-            qpy.dump([circuit_data.circuit for circuit_data in self.circuits_run_data], file)
+        The archive holds the circuits of every job, a columnar index of their batch job and job ids and, with
+        `include_results`, the results fetched so far, so the restored jobs don't download them again. Jobs are
+        loaded back one at a time by :meth:`deserialize` and :meth:`deserialize_many`.
+
+        Args:
+            jobs: The jobs to store.
+            file_path: The path of the archive.
+            include_results: Whether to store the results of circuits that have them.
+        """
+        write_job_archive(file_path, (job._archived(include_results) for job in jobs))
+
+    def _archived(self, include_results: bool) -> ArchivedJob:
+        results = None
+        if include_results and any(circuit_data.finished for circuit_data in self.circuits_run_data):
+            results = [
+                CachedResult(circuit_data.results, circuit_data.system_message)
+                for circuit_data in self.circuits_run_data
+            ]
+        return ArchivedJob(
+            backend_name=self.backend().name,
+            backend_id=self.backend().id,
+            batch_job_id=self.batch_job_id,
+            circuits=[circuit_data.circuit for circuit_data in self.circuits_run_data],
+            job_ids=[circuit_data.job_id for circuit_data in self.circuits_run_data],
+            results=results,
+        )
 
     @classmethod
-    def deserialize(cls, provider: BaseProvider, file_path: Union[str, Path]) -> "QIJob":
-        """Recover a prior job from a file written by QIJob.serialize().
+    def deserialize(cls, provider: BaseProvider, file_path: Union[str, Path], index: int = 0) -> "QIJob":
+        """Recover a prior job from a file written by QIJob.serialize() or QIJob.serialize_many().
 
         Args:
             provider: Used to get the backend on which the original job ran.
             file_path: The path to the file where the job information is stored.
+            index: The position of the job in an archive written by :meth:`serialize_many`; only the circuits and
+                results of that job are loaded.
         """
+        if zipfile.is_zipfile(file_path):
+            with JobArchive(file_path) as archive:
+                return cls._from_archived(provider, archive.read(index))
+        if index != 0:
+            raise ValueError(f"{file_path} holds a single job")
+
         with open(file_path, "rb") as file:
             circuits = qpy.load(file)
 
@@ -459,15 +1398,190 @@ class QIJob(QIBaseJob):
 
             for circuit_data in job.circuits_run_data:
                 circuit_data.job_id = circuit_data.circuit.metadata.get("job_id")
+                for key in ("job_id", "backend_type_name", "backend_type_id", "batch_job_id"):
+                    circuit_data.circuit.metadata.pop(key, None)
 
             return job
 
-    @cache
+    @classmethod
+    def deserialize_many(cls, provider: BaseProvider, file_path: Union[str, Path]) -> Iterator["QIJob"]:
+        """Recover the jobs of an archive written by QIJob.serialize_many(), loading them one at a time.
+
+        Args:
+            provider: Used to get the backends on which the original jobs ran.
+            file_path: The path of the archive.
+        """
+        with JobArchive(file_path) as archive:
+            for archived in archive:
+                yield cls._from_archived(provider, archived)
+
+    @classmethod
+    def _from_archived(cls, provider: BaseProvider, archived: ArchivedJob) -> "QIJob":
+        job = cls(archived.circuits, provider.get_backend(archived.backend_name, archived.backend_id))
+        job.batch_job_id = archived.batch_job_id
+        for index, (circuit_data, job_id) in enumerate(zip(job.circuits_run_data, archived.job_ids)):
+            circuit_data.job_id = job_id
+            if archived.results is not None:
+                circuit_data.results = archived.results[index].result
+                circuit_data.system_message = archived.results[index].system_message
+        return job
+
+    @classmethod
+    def resume(cls, provider: BaseProvider, journal: SubmissionJournal, submission_id: int) -> "QIJob":
+        """Finish a submission recorded in `journal`, e.g. one interrupted by a crash of another process.
+
+        The platform objects recorded for the submission are reused, so only the circuits that have no job yet are
+        uploaded, before the batch job is enqueued. Submissions that were already enqueued are only restored.
+
+        Args:
+            provider: Used to get the backend the submission was made to.
+            journal: The journal that recorded the submission.
+            submission_id: The submission to finish, see :meth:`SubmissionJournal.pending`.
+
+        Returns:
+            The job of the submission.
+        """
+        submission = journal.get(submission_id)
+        job = cls(journal.circuits(submission_id), provider.get_backend(submission.backend_name, submission.backend_id))
+        job.submission_id = submission_id
+        job._submission_journal = journal
+        job.submit()
+        return job
+
     def result(self, wait_for_results: bool = True, timeout: float = 60.0) -> Result:
-        """Return the results of the job."""
-        if wait_for_results:
-            self.wait_for_final_state(timeout=timeout)
-        elif not self.done():
-            raise RuntimeError(f"(Batch)Job status is {self.status()}.")
-        run_async(self._fetch_job_results())
-        return self._process_results()
+        """Return the results of the job.
+
+        The results are fetched once and kept with the job; threads calling this at the same time share one fetch.
+        """
+        return self._result(wait_for_results, timeout)
+
+    async def result_async(self, wait_for_results: bool = True, timeout: Optional[float] = 60.0) -> Result:
+        """Return the results of the job like :meth:`result`, on the running event loop."""
+        return await self._result_async(wait_for_results, timeout)
+
+
+class QIShardedJob(QIBaseJob):
+    """A Qiskit job for runs that exceed the batch job size of the backend type.
+
+    The circuits are split over as many QuantumInspire batch jobs as needed to stay within
+    ``max_jobs_per_batch_job``. At most ``batchjobs_per_queue_limit`` batch jobs are queued at the same time; the
+    remaining ones are submitted as earlier batch jobs finish, which happens while polling ``status()`` or waiting for
+    ``result()``. When submitting a batch job fails there, the error is raised, and the batch job is submitted again
+    at the next poll. Results are returned in the order of the original circuits.
+    """
+
+    def __init__(
+        self,
+        run_input: Union[QuantumCircuit, List[QuantumCircuit]],
+        backend: Union[BackendV2, None],
+        session: Optional["QISession"] = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(run_input, backend, **kwargs)
+        self._session = session
+        self.jobs: List[QIJob] = []
+        self._queue_limit = 1
+
+    @property
+    def batch_job_ids(self) -> List[Union[int, None]]:
+        """The batch job ids of all shards, ``None`` for shards that have not been submitted yet."""
+        return [job.batch_job_id for job in self.jobs]
+
+    def submit(self) -> None:
+        self._create_shards(self.backend().get_backend_type())
+        self._run_sync(self._submit_pending_jobs(active_jobs=0))
+
+    async def submit_async(self) -> None:
+        """Submit the first batch jobs like :meth:`submit`, on the running event loop."""
+        self._create_shards(await self.backend().get_backend_type_async())
+        await self._submit_pending_jobs(active_jobs=0)
+
+    def _create_shards(self, backend_type: BackendType) -> None:
+        shard_size = backend_type.max_jobs_per_batch_job
+        self._queue_limit = max(backend_type.batchjobs_per_queue_limit, 1)
+
+        self.jobs = []
+        for start in range(0, len(self.circuits_run_data), shard_size):
+            job = QIJob(run_input=[], backend=self.backend(), session=self._session)
+            # Shards share the execution data of this job, so results end up in the original circuit order.
+            job.circuits_run_data = self.circuits_run_data[start : start + shard_size]
+            job.program_name = self.program_name
+            self.jobs.append(job)
+
+    async def _submit_pending_jobs(self, active_jobs: int) -> None:
+        """Submit shards that have not been submitted yet, as far as the queue limit allows.
+
+        Args:
+            active_jobs: Number of submitted shards that have not finished yet.
+        """
+        pending_jobs = [job for job in self.jobs if job.batch_job_id is None]
+        jobs_to_submit = pending_jobs[: max(self._queue_limit - active_jobs, 0)]
+        # a failed shard stays pending, and is submitted again by the next call; the others are not interrupted
+        outcomes = await asyncio.gather(*(job._submit_async() for job in jobs_to_submit), return_exceptions=True)
+        for outcome in outcomes:
+            if isinstance(outcome, BaseException):
+                raise outcome
+
+    async def status_async(self) -> JobStatus:
+        """Fetch the status of all unfinished shards and submit further shards when queue capacity frees up."""
+        submitted_jobs = [job for job in self.jobs if job.batch_job_id is not None]
+        batch_jobs = await asyncio.gather(*(job._fetch_batchjob_status() for job in submitted_jobs))
+        return await self._status_from_batch_jobs(
+            {cast(int, job.batch_job_id): batch_job.status for job, batch_job in zip(submitted_jobs, batch_jobs)}
+        )
+
+    def _batch_job_ids(self) -> List[int]:
+        return [batch_job_id for batch_job_id in self.batch_job_ids if batch_job_id is not None]
+
+    async def _status_from_batch_jobs(self, batch_job_statuses: Mapping[int, BatchJobStatus]) -> JobStatus:
+        """Combine the statuses of the shards and submit further shards when queue capacity frees up."""
+        batch_job_ids = self._batch_job_ids()
+        statuses = [_BATCH_JOB_STATUS_MAP[batch_job_statuses[batch_job_id]] for batch_job_id in batch_job_ids]
+
+        active_jobs = sum(status != JobStatus.DONE for status in statuses)
+        if len(batch_job_ids) < len(self.jobs) and active_jobs < self._queue_limit:
+            await self._submit_pending_jobs(active_jobs)
+            return JobStatus.QUEUED
+
+        if len(batch_job_ids) == len(self.jobs) and active_jobs == 0:
+            return JobStatus.DONE
+        return JobStatus.RUNNING if JobStatus.RUNNING in statuses else JobStatus.QUEUED
+
+    def status(self) -> JobStatus:
+        """Return the combined status of all batch jobs, among the values of ``JobStatus``."""
+        return self._run_sync(self.status_async())
+
+    async def _fetch_job_results(self) -> None:
+        await asyncio.gather(*(job._fetch_job_results() for job in self.jobs))
+
+    def _load_cached_results(self) -> bool:
+        # every shard loads its own results, even when an earlier one is incomplete
+        return bool(self.jobs) and all([job._load_cached_results() for job in self.jobs])
+
+    def _store_cached_results(self, circuits: List[CircuitExecutionData]) -> None:
+        # the results are cached per batch job, so every shard stores its own circuits
+        circuit_ids = {id(circuit_data) for circuit_data in circuits}
+        for job in self.jobs:
+            job._store_cached_results(
+                [circuit_data for circuit_data in job.circuits_run_data if id(circuit_data) in circuit_ids]
+            )
+
+    async def _fetch_finished_experiments(self) -> None:
+        if None in self.batch_job_ids:
+            # submits further shards when earlier ones have finished
+            await self.status_async()
+        await super()._fetch_finished_experiments()
+
+    def _result_job_id(self) -> str:
+        return ",".join(str(batch_job_id) for batch_job_id in self.batch_job_ids)
+
+    def result(self, wait_for_results: bool = True, timeout: Optional[float] = 60.0) -> Result:
+        """Return the results of all batch jobs, in the order of the submitted circuits.
+
+        The results are fetched once and kept with the job; threads calling this at the same time share one fetch.
+        """
+        return self._result(wait_for_results, timeout)
+
+    async def result_async(self, wait_for_results: bool = True, timeout: Optional[float] = 60.0) -> Result:
+        """Return the results of all batch jobs like :meth:`result`, on the running event loop."""
+        return await self._result_async(wait_for_results, timeout)
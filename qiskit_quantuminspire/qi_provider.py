@@ -1,40 +1,123 @@
 import logging
-from typing import Any, List, Optional, Sequence
+from types import TracebackType
+from typing import Any, List, Optional, Sequence, Type
 
-from compute_api_client import ApiClient, BackendType, BackendTypesApi, PageBackendType
-from qi2_shared.client import config
+from compute_api_client import BackendType, BackendTypesApi, PageBackendType
 from qi2_shared.pagination import PageReader
-from qi2_shared.utils import run_async
 
+from qiskit_quantuminspire.api_client_pool import ApiClientPool
 from qiskit_quantuminspire.base_provider import BaseProvider
 from qiskit_quantuminspire.qi_backend import QIBackend
+from qiskit_quantuminspire.retry import DEFAULT_RETRY_POLICY, RetryPolicy
 
 
 class QIProvider(BaseProvider):
-    """List QIBackends integrated with QiskitBackend interface."""
+    """List QIBackends integrated with QiskitBackend interface.
 
-    def __init__(self) -> None:
+    The provider, its backends and their jobs share the connections of a single client pool. Close the provider with
+    :meth:`close`, or use it as a context manager, to close the connections. A provider that is not closed releases
+    them when its pool is garbage collected.
+
+    Args:
+        api_client_pool: The client pool to use, a pool with default settings when not given.
+        retry_policy: Retries of the requests of the provider, and the ``retry_policy`` option of its backends;
+            ``None`` makes every request once.
+    """
+
+    def __init__(
+        self,
+        api_client_pool: Optional[ApiClientPool] = None,
+        retry_policy: Optional[RetryPolicy] = DEFAULT_RETRY_POLICY,
+    ) -> None:
+        self._init(api_client_pool, retry_policy)
         self._qiskit_backends = self._construct_backends()
 
+    def _init(self, api_client_pool: Optional[ApiClientPool], retry_policy: Optional[RetryPolicy]) -> None:
+        """Set up everything but the backends, shared by the constructor and :meth:`create_async`."""
+        self.api_client_pool = api_client_pool if api_client_pool is not None else ApiClientPool()
+        self.retry_policy = retry_policy
+
+    @classmethod
+    async def create_async(
+        cls, api_client_pool: Optional[ApiClientPool] = None, retry_policy: Optional[RetryPolicy] = DEFAULT_RETRY_POLICY
+    ) -> "QIProvider":
+        """Create a provider like the constructor does, fetching the backends on the running event loop."""
+        # the constructor would fetch the backends by blocking on the pool's event loop
+        provider = cls.__new__(cls)
+        provider._init(api_client_pool, retry_policy)
+        provider._qiskit_backends = [
+            provider._create_backend(backend_type) for backend_type in await provider._fetch_qi_backend_types()
+        ]
+        return provider
+
+    async def __aenter__(self) -> "QIProvider":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        await self.aclose()
+
+    def __enter__(self) -> "QIProvider":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the connections of the client pool. Backends and jobs open a connection per request afterwards."""
+        self.api_client_pool.close()
+
+    async def aclose(self) -> None:
+        """Close the connections of the client pool like :meth:`close`, without blocking the running event loop."""
+        await self.api_client_pool.aclose()
+
     async def _fetch_qi_backend_types(self) -> List[BackendType]:
         """Fetch backend types from CJM using api client.
 
         (Implemented without paging only for demonstration purposes, should get a proper implementation)
         """
-        async with ApiClient(config()) as client:
+        async with self.api_client_pool.client() as client:
             page_reader = PageReader[PageBackendType, BackendType]()
             backend_types_api = BackendTypesApi(client)
-            backend_types: List[BackendType] = await page_reader.get_all(
-                backend_types_api.read_backend_types_backend_types_get
-            )
+            read_backend_types = backend_types_api.read_backend_types_backend_types_get
+            if self.retry_policy is not None:
+                read_backend_types = self.retry_policy.wrap(read_backend_types)
+            backend_types: List[BackendType] = await page_reader.get_all(read_backend_types)
         return backend_types
 
+    def _create_backend(self, backend_type: BackendType) -> QIBackend:
+        backend = QIBackend(provider=self, backend_type=backend_type, api_client_pool=self.api_client_pool)
+        backend.set_options(retry_policy=self.retry_policy)
+        return backend
+
     def _construct_backends(self) -> List[QIBackend]:
         """Construct QIBackend using fetched backendtypes and metadata."""
-        qi_backend_types = run_async(self._fetch_qi_backend_types())
-        qi_backends = [QIBackend(provider=self, backend_type=backend_type) for backend_type in qi_backend_types]
+        qi_backend_types = self.api_client_pool.run(self._fetch_qi_backend_types())
+        qi_backends = [self._create_backend(backend_type) for backend_type in qi_backend_types]
         return qi_backends
 
+    def refresh_all(self) -> None:
+        """Refresh the backend type snapshots of all backends with a single listing of the platform's backend types.
+
+        Backend types that were added to the platform since the provider was created are added as new backends.
+        """
+        backends_by_id = {backend.id: backend for backend in self._qiskit_backends}
+        for backend_type in self.api_client_pool.run(self._fetch_qi_backend_types()):
+            backend = backends_by_id.get(backend_type.id)
+            if backend is None:
+                self._qiskit_backends.append(self._create_backend(backend_type))
+            else:
+                backend._update_backend_type(backend_type)
+
     def backends(self) -> Sequence[QIBackend]:
         return self._qiskit_backends
 
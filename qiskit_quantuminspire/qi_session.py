@@ -0,0 +1,77 @@
+import asyncio
+import weakref
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, List, Optional, Type, Union
+
+from qiskit.circuit import QuantumCircuit
+
+if TYPE_CHECKING:
+    from qiskit_quantuminspire.qi_backend import QIBackend
+    from qiskit_quantuminspire.qi_jobs import QIJob, QIShardedJob
+
+
+class QISession:
+    """Keeps the platform objects of a QIBackend alive across multiple runs.
+
+    Without a session, every run creates a new project on the platform. A session creates its project on the first
+    submission and reuses it for every later run. With ``reuse_algorithm=True`` a single algorithm is reused as well,
+    so every run only adds commits, files and jobs.
+
+    Example:
+        with backend.session() as session:
+            for parameters in sweep:
+                job = session.run(build_circuit(parameters))
+    """
+
+    def __init__(self, backend: "QIBackend", reuse_algorithm: bool = False) -> None:
+        self._backend = backend
+        self.reuse_algorithm = reuse_algorithm
+        self.project_id: Optional[int] = None
+        self.algorithm_id: Optional[int] = None
+        # Runs are submitted on short-lived event loops, so the locks guarding object creation are kept per loop.
+        self._locks: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock] = weakref.WeakKeyDictionary()
+
+    def __enter__(self) -> "QISession":
+        self._backend._activate_session(self)
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self._backend._deactivate_session(self)
+
+    @property
+    def active(self) -> bool:
+        return self._backend.active_session is self
+
+    def run(
+        self, run_input: Union[QuantumCircuit, List[QuantumCircuit]], **options: Any
+    ) -> "Union[QIJob, QIShardedJob]":
+        """Run circuits on the backend of this session, see :meth:`QIBackend.run`."""
+        if not self.active:
+            raise RuntimeError("Session is not active, use it as a context manager to run circuits")
+        return self._backend.run(run_input, **options)
+
+    def _lock(self) -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+        lock = self._locks.get(loop)
+        if lock is None:
+            lock = self._locks[loop] = asyncio.Lock()
+        return lock
+
+    async def get_project_id(self, create_project: Callable[[], Awaitable[int]]) -> int:
+        """Return the id of the session's project, creating it with `create_project` on first use."""
+        async with self._lock():
+            if self.project_id is None:
+                self.project_id = await create_project()
+            return self.project_id
+
+    async def get_algorithm_id(self, create_algorithm: Callable[[], Awaitable[int]]) -> int:
+        """Return the id of the session's algorithm, creating it with `create_algorithm` on first use."""
+        async with self._lock():
+            if self.algorithm_id is None:
+                self.algorithm_id = await create_algorithm()
+            return self.algorithm_id
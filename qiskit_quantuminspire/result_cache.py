@@ -0,0 +1,148 @@
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from contextlib import closing, contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Union
+
+from compute_api_client import Result as RawJobResult
+
+# Plenty for the counts of many thousands of jobs, while keeping raw shot data from filling up the disk
+DEFAULT_MAX_BYTES = 1 << 30
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    host TEXT NOT NULL,
+    batch_job_id INTEGER NOT NULL,
+    job_id INTEGER NOT NULL,
+    result BLOB,
+    system_message TEXT,
+    size INTEGER NOT NULL,
+    accessed_at REAL NOT NULL,
+    PRIMARY KEY (host, batch_job_id, job_id)
+);
+CREATE INDEX IF NOT EXISTS results_accessed_at ON results (accessed_at);
+"""
+
+
+@dataclass(frozen=True)
+class CachedResult:
+    """The final outcome of a finished job: its result, or the message explaining why it has none."""
+
+    result: Optional[RawJobResult] = None
+    system_message: Optional[Dict[str, Any]] = None
+
+
+class ResultCache:
+    """On-disk store of the results of finished jobs, keyed by the host, batch job id and job id.
+
+    Results on the platform never change once a job has finished, so a job that finds all its results here, e.g. one
+    restored with :meth:`QIJob.deserialize`, returns them from ``result()`` without any request to the platform. The
+    results are stored compressed in a SQLite database, which several processes can share. Once the stored results
+    take more than `max_bytes`, the least recently used ones are evicted.
+
+    Pass the cache to a backend with ``backend.set_options(result_cache=cache)`` to use it for the jobs of that
+    backend.
+
+    Args:
+        path: The database file, created when it doesn't exist.
+        max_bytes: The maximum size of the stored (compressed) results.
+    """
+
+    def __init__(self, path: Union[str, Path], max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be at least 1")
+        self.path = Path(path).expanduser()
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as connection:
+            connection.executescript(_SCHEMA)
+
+    def __len__(self) -> int:
+        with self._connect() as connection:
+            (count,) = connection.execute("SELECT COUNT(*) FROM results").fetchone()
+        return int(count)
+
+    @property
+    def size_bytes(self) -> int:
+        """The size of the stored (compressed) results."""
+        with self._connect() as connection:
+            (size,) = connection.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()
+        return int(size)
+
+    def get_many(self, host: str, batch_job_id: int, job_ids: Iterable[int]) -> Dict[int, CachedResult]:
+        """Return the stored outcomes of the jobs `job_ids` of batch job `batch_job_id` on `host`, by job id.
+
+        Jobs without a stored outcome are left out; entries that can't be read are treated as missing.
+        """
+        job_ids = list(job_ids)
+        found: Dict[int, CachedResult] = {}
+        with self._connect() as connection:
+            for chunk in _chunks(job_ids):
+                rows = connection.execute(
+                    f"SELECT job_id, result, system_message FROM results "
+                    f"WHERE host = ? AND batch_job_id = ? AND job_id IN ({','.join('?' * len(chunk))})",
+                    (host, batch_job_id, *chunk),
+                ).fetchall()
+                for job_id, result, system_message in rows:
+                    try:
+                        found[job_id] = CachedResult(
+                            result=RawJobResult.model_validate_json(zlib.decompress(result)) if result else None,
+                            system_message=json.loads(system_message) if system_message else None,
+                        )
+                    except (zlib.error, ValueError):
+                        # A corrupt entry only costs downloading the result again
+                        continue
+            if found:
+                connection.executemany(
+                    "UPDATE results SET accessed_at = ? WHERE host = ? AND batch_job_id = ? AND job_id = ?",
+                    [(time.time(), host, batch_job_id, job_id) for job_id in found],
+                )
+        return found
+
+    def put_many(self, host: str, batch_job_id: int, outcomes: Mapping[int, CachedResult]) -> None:
+        """Store the outcomes of finished jobs of batch job `batch_job_id` on `host`, by job id."""
+        if not outcomes:
+            return
+        rows = []
+        for job_id, outcome in outcomes.items():
+            result = zlib.compress(outcome.result.model_dump_json().encode()) if outcome.result is not None else None
+            system_message = json.dumps(outcome.system_message) if outcome.system_message is not None else None
+            size = (len(result) if result else 0) + (len(system_message) if system_message else 0)
+            rows.append((host, batch_job_id, job_id, result, system_message, size, time.time()))
+
+        with self._connect() as connection:
+            connection.executemany("INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+            # Keep the most recently used results that fit in max_bytes
+            connection.execute(
+                "DELETE FROM results WHERE rowid IN ("
+                "SELECT rowid FROM (SELECT rowid, SUM(size) OVER (ORDER BY accessed_at DESC, rowid DESC) AS total "
+                "FROM results) WHERE total > ?)",
+                (self.max_bytes,),
+            )
+
+    def invalidate(self, host: Optional[str] = None, batch_job_id: Optional[int] = None) -> None:
+        """Remove the results of batch job `batch_job_id`, of all batch jobs of `host`, or all results."""
+        conditions = {"host": host, "batch_job_id": batch_job_id}
+        conditions = {column: value for column, value in conditions.items() if value is not None}
+        where = " AND ".join(f"{column} = ?" for column in conditions) or "1"
+        with self._connect() as connection:
+            connection.execute(f"DELETE FROM results WHERE {where}", tuple(conditions.values()))
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        # Other processes may be writing, wait for their transactions rather than failing
+        with self._lock, closing(sqlite3.connect(self.path, timeout=30.0)) as connection:
+            # commits when the block succeeds, rolls back otherwise
+            with connection:
+                yield connection
+
+
+def _chunks(values: List[int], size: int = 500) -> Iterator[List[int]]:
+    """Split `values` to stay well below the limit on the number of parameters of a statement."""
+    for start in range(0, len(values), size):
+        yield values[start : start + size]
@@ -0,0 +1,148 @@
+import asyncio
+import logging
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Awaitable, Callable, Coroutine, Optional, ParamSpec, TypeVar
+
+import aiohttp
+from compute_api_client.exceptions import ApiException
+
+from qiskit_quantuminspire.utils import Backoff
+
+logger = logging.getLogger(__name__)
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+# Requests with these methods have the same effect when they are made twice
+IDEMPOTENT_METHODS = frozenset({"DELETE", "GET", "HEAD", "OPTIONS", "PUT", "TRACE"})
+# The platform did not handle the request, so it is safe to make it again whatever its method
+RETRYABLE_STATUSES = frozenset({429, 503})
+# The request may have been handled before it failed, so it is only made again when that is harmless
+IDEMPOTENT_RETRYABLE_STATUSES = frozenset({500, 502, 504})
+
+
+class RetryPolicy:
+    """Retries of API requests that failed for a reason that is likely to pass.
+
+    A request is made again when it could not reach the platform, or when the platform asks to try later (status 429
+    or 503). Requests that may have been handled before they failed, e.g. on a lost connection, a timeout or a gateway
+    error, are only made again when their HTTP method is idempotent: reads are retried, but a ``create_*`` call is not,
+    as it could create a duplicate object. The HTTP method is taken from the name of the generated API method, such as
+    ``create_job_jobs_post``.
+
+    Retries are spaced by `backoff`, or by the ``Retry-After`` header of the response when that asks for a longer wait.
+    To keep retries from piling up while the platform is down, they are limited by a budget shared by all requests
+    made with the policy: up to `budget` retries, earning back `budget_ratio` of a retry for every request.
+
+    Args:
+        max_attempts: The maximum number of attempts of a single request, including the first one.
+        backoff: The delays between attempts.
+        max_delay: Requests that would have to wait longer than this number of seconds, e.g. because of their
+            ``Retry-After`` header, are not retried.
+        budget: The maximum number of retries in a burst.
+        budget_ratio: The number of retries earned by every request.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 5,
+        backoff: Backoff = Backoff(initial=0.5, maximum=10.0, factor=2.0, jitter=0.2),
+        max_delay: float = 60.0,
+        budget: int = 50,
+        budget_ratio: float = 0.1,
+    ) -> None:
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        if budget < 0 or budget_ratio < 0:
+            raise ValueError("The retry budget can't be negative")
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.max_delay = max_delay
+        self.budget = budget
+        self.budget_ratio = budget_ratio
+        self._tokens = float(budget)
+        self._lock = threading.Lock()
+
+    def wrap(self, api_method: Callable[P, Awaitable[T]]) -> Callable[P, Coroutine[Any, Any, T]]:
+        """Return a function calling `api_method`, a method of a compute-api-client API, with retries."""
+        idempotent = getattr(api_method, "__name__", "").rsplit("_", 1)[-1].upper() in IDEMPOTENT_METHODS
+
+        async def call(*args: P.args, **kwargs: P.kwargs) -> T:
+            return await self.call(lambda: api_method(*args, **kwargs), idempotent)
+
+        return call
+
+    async def call(self, request: Callable[[], Awaitable[T]], idempotent: bool) -> T:
+        """Await `request()`, retrying it as long as it fails in a way that this policy retries.
+
+        Args:
+            request: Makes the request, every time it is called.
+            idempotent: Whether making the request more than once has the same effect as making it once.
+        """
+        self._earn()
+        delays = self.backoff.delays()
+        attempt = 1
+        while True:
+            try:
+                return await request()
+            except Exception as exc:
+                delay = self._retry_delay(exc, idempotent, attempt, next(delays))
+                if delay is None:
+                    raise
+                logger.debug("Request failed (attempt %d), retrying in %.1fs: %r", attempt, delay, exc)
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    def retryable(self, exc: Exception, idempotent: bool) -> bool:
+        """Return whether a request that failed with `exc` may be made again."""
+        if isinstance(exc, ApiException):
+            return exc.status in RETRYABLE_STATUSES or (idempotent and exc.status in IDEMPOTENT_RETRYABLE_STATUSES)
+        if isinstance(exc, aiohttp.ClientConnectorError):
+            # the connection was never made, so the platform never saw the request
+            return True
+        return idempotent and isinstance(exc, (aiohttp.ClientError, asyncio.TimeoutError, ConnectionError))
+
+    def _retry_delay(self, exc: Exception, idempotent: bool, attempt: int, backoff_delay: float) -> Optional[float]:
+        """Return the number of seconds to wait before retrying, or ``None`` if the request is not retried."""
+        if attempt >= self.max_attempts or not self.retryable(exc, idempotent):
+            return None
+        delay = max(backoff_delay, _retry_after(exc) or 0.0)
+        if delay > self.max_delay or not self._spend():
+            return None
+        return delay
+
+    def _earn(self) -> None:
+        with self._lock:
+            self._tokens = min(self._tokens + self.budget_ratio, float(self.budget))
+
+    def _spend(self) -> bool:
+        with self._lock:
+            if self._tokens < 1:
+                logger.warning("Retry budget exhausted, not retrying failed requests")
+                return False
+            self._tokens -= 1
+            return True
+
+
+def _retry_after(exc: Exception) -> Optional[float]:
+    """Return the number of seconds the ``Retry-After`` header of a failed response asks to wait, if any."""
+    headers: Any = getattr(exc, "headers", None)
+    if not headers:
+        return None
+    value = next((value for name, value in headers.items() if name.lower() == "retry-after"), None)
+    if value is None:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+# Shared by everything that doesn't configure its own policy, so the budget applies to all requests of the process
+DEFAULT_RETRY_POLICY = RetryPolicy()
@@ -0,0 +1,308 @@
+import io
+import sqlite3
+import threading
+import time
+import weakref
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import TracebackType
+from typing import Dict, Iterator, List, Optional, Sequence, Type, Union
+
+from qiskit import qpy
+from qiskit.circuit import QuantumCircuit
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS submissions (
+    submission_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    host TEXT NOT NULL,
+    backend_name TEXT NOT NULL,
+    backend_id INTEGER NOT NULL,
+    circuits BLOB NOT NULL,
+    number_of_shots INTEGER,
+    raw_data_enabled INTEGER NOT NULL,
+    project_id INTEGER,
+    batch_job_id INTEGER,
+    algorithm_id INTEGER,
+    commit_id INTEGER,
+    enqueued INTEGER NOT NULL DEFAULT 0,
+    created_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS circuits (
+    submission_id INTEGER NOT NULL,
+    circuit_index INTEGER NOT NULL,
+    algorithm_id INTEGER,
+    commit_id INTEGER,
+    file_id INTEGER,
+    job_id INTEGER,
+    cqasm TEXT,
+    number_of_shots INTEGER,
+    PRIMARY KEY (submission_id, circuit_index)
+);
+"""
+
+_CIRCUIT_IDS = ("algorithm_id", "commit_id", "file_id", "job_id")
+
+
+@dataclass
+class JournaledCircuit:
+    """The platform objects created so far for a single circuit of a submission.
+
+    `cqasm` is the program of the circuit when it was not written from the circuit itself, e.g. with the parameter
+    values of a ``parameter_binds`` run filled in. `number_of_shots` is the number of shots of the circuit when it
+    differs from those of the submission.
+    """
+
+    algorithm_id: Optional[int] = None
+    commit_id: Optional[int] = None
+    file_id: Optional[int] = None
+    job_id: Optional[int] = None
+    cqasm: Optional[str] = None
+    number_of_shots: Optional[int] = None
+
+
+@dataclass
+class Submission:
+    """A submission recorded in a :class:`SubmissionJournal`, with the platform objects created for it so far.
+
+    `algorithm_id` and `commit_id` are the algorithm and commit shared by all circuits when they are submitted per
+    batch.
+    """
+
+    submission_id: int
+    host: str
+    backend_name: str
+    backend_id: int
+    number_of_shots: Optional[int]
+    raw_data_enabled: bool
+    project_id: Optional[int] = None
+    batch_job_id: Optional[int] = None
+    algorithm_id: Optional[int] = None
+    commit_id: Optional[int] = None
+    enqueued: bool = False
+    circuits: Dict[int, JournaledCircuit] = field(default_factory=dict)
+
+
+class SubmissionJournal:
+    """Write-ahead journal of the platform objects created while submitting jobs.
+
+    A submission creates a project, a batch job and, for every circuit, an algorithm, commit, file and job before the
+    batch job is enqueued. When the process dies or the connection drops halfway, the objects created so far are
+    recorded here, so the submission is finished later without creating any of them again: call ``submit()`` on the
+    job again, or restore the job with :meth:`QIJob.resume` in a new process.
+
+    Every id is committed to a SQLite database as soon as the platform returns it, so the journal survives a crash of
+    the submitting process. Submissions stay in the journal after they are enqueued, which allows restoring their jobs
+    as well; :meth:`remove` drops them. The journal keeps a single connection to the database, which is shared by all
+    threads; close it with :meth:`close`, or use the journal as a context manager, when it is no longer needed.
+
+    Pass the journal to a backend with ``backend.set_options(submission_journal=journal)`` to record the submissions
+    of that backend.
+
+    Args:
+        path: The database file, created when it doesn't exist.
+    """
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        self.path = Path(path).expanduser()
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Other processes may be writing, wait for their transactions rather than failing. Submissions record their
+        # ids from worker threads, the lock serializes the use of the connection.
+        self._connection: Optional[sqlite3.Connection] = sqlite3.connect(
+            self.path, timeout=30.0, check_same_thread=False
+        )
+        self._finalizer = weakref.finalize(self, self._connection.close)
+        # Commits only append to the log, instead of rewriting and syncing the database for every recorded id
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        # in WAL mode a commit survives a crash of the process without syncing the disk
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        with self._connect() as connection:
+            connection.executescript(_SCHEMA)
+
+    def __enter__(self) -> "SubmissionJournal":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the connection to the database. Closing a closed journal has no effect."""
+        with self._lock:
+            self._connection = None
+            self._finalizer()
+
+    def __len__(self) -> int:
+        with self._connect() as connection:
+            (count,) = connection.execute("SELECT COUNT(*) FROM submissions").fetchone()
+        return int(count)
+
+    def begin(
+        self,
+        host: str,
+        backend_name: str,
+        backend_id: int,
+        circuits: Sequence[QuantumCircuit],
+        number_of_shots: Optional[int],
+        raw_data_enabled: bool,
+        contents: Optional[Sequence[Optional[str]]] = None,
+        circuit_shots: Optional[Sequence[Optional[int]]] = None,
+    ) -> int:
+        """Record a new submission of `circuits` and return its id.
+
+        The circuits and run options are stored with the submission, so it can be finished with the same settings
+        from another process. `contents` holds, per circuit, the cQASM to upload instead of the cQASM of the circuit,
+        if any, and `circuit_shots` the number of shots to use instead of `number_of_shots`, if any.
+        """
+        buffer = io.BytesIO()
+        qpy.dump(list(circuits), buffer)
+        with self._connect() as connection:
+            cursor = connection.execute(
+                "INSERT INTO submissions (host, backend_name, backend_id, circuits, number_of_shots, raw_data_enabled, "
+                "created_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (host, backend_name, backend_id, buffer.getvalue(), number_of_shots, raw_data_enabled, time.time()),
+            )
+            submission_id = int(cursor.lastrowid or 0)
+            contents = contents or [None] * len(circuits)
+            circuit_shots = circuit_shots or [None] * len(circuits)
+            connection.executemany(
+                "INSERT INTO circuits (submission_id, circuit_index, cqasm, number_of_shots) VALUES (?, ?, ?, ?)",
+                [
+                    (submission_id, circuit_index, content, shots)
+                    for circuit_index, (content, shots) in enumerate(zip(contents, circuit_shots))
+                    if content is not None or shots is not None
+                ],
+            )
+        return submission_id
+
+    def get(self, submission_id: int) -> Submission:
+        """Return submission `submission_id` with the ids of the platform objects created for it.
+
+        Raises:
+            KeyError: If the journal holds no such submission.
+        """
+        with self._connect() as connection:
+            cursor = connection.cursor()
+            cursor.row_factory = sqlite3.Row
+            row = cursor.execute(
+                "SELECT host, backend_name, backend_id, number_of_shots, raw_data_enabled, project_id, batch_job_id, "
+                "algorithm_id, commit_id, enqueued FROM submissions WHERE submission_id = ?",
+                (submission_id,),
+            ).fetchone()
+            if row is None:
+                raise KeyError(submission_id)
+            circuit_rows = cursor.execute("SELECT * FROM circuits WHERE submission_id = ?", (submission_id,)).fetchall()
+
+        return Submission(
+            submission_id=submission_id,
+            host=row["host"],
+            backend_name=row["backend_name"],
+            backend_id=row["backend_id"],
+            number_of_shots=row["number_of_shots"],
+            raw_data_enabled=bool(row["raw_data_enabled"]),
+            project_id=row["project_id"],
+            batch_job_id=row["batch_job_id"],
+            algorithm_id=row["algorithm_id"],
+            commit_id=row["commit_id"],
+            enqueued=bool(row["enqueued"]),
+            circuits={
+                circuit_row["circuit_index"]: JournaledCircuit(
+                    **{column: circuit_row[column] for column in _CIRCUIT_IDS},
+                    cqasm=circuit_row["cqasm"],
+                    number_of_shots=circuit_row["number_of_shots"],
+                )
+                for circuit_row in circuit_rows
+            },
+        )
+
+    def circuits(self, submission_id: int) -> List[QuantumCircuit]:
+        """Return the circuits of submission `submission_id`.
+
+        Raises:
+            KeyError: If the journal holds no such submission.
+        """
+        with self._connect() as connection:
+            row = connection.execute(
+                "SELECT circuits FROM submissions WHERE submission_id = ?", (submission_id,)
+            ).fetchone()
+        if row is None:
+            raise KeyError(submission_id)
+        return list(qpy.load(io.BytesIO(row[0])))
+
+    def pending(self) -> List[int]:
+        """Return the ids of the submissions whose batch job was not enqueued, oldest first."""
+        with self._connect() as connection:
+            rows = connection.execute(
+                "SELECT submission_id FROM submissions WHERE NOT enqueued ORDER BY submission_id"
+            ).fetchall()
+        return [submission_id for (submission_id,) in rows]
+
+    def record(
+        self,
+        submission_id: int,
+        project_id: Optional[int] = None,
+        batch_job_id: Optional[int] = None,
+        algorithm_id: Optional[int] = None,
+        commit_id: Optional[int] = None,
+    ) -> None:
+        """Record the ids of platform objects shared by all circuits of submission `submission_id`."""
+        ids = {
+            "project_id": project_id,
+            "batch_job_id": batch_job_id,
+            "algorithm_id": algorithm_id,
+            "commit_id": commit_id,
+        }
+        ids = {column: value for column, value in ids.items() if value is not None}
+        if not ids:
+            return
+        with self._connect() as connection:
+            connection.execute(
+                f"UPDATE submissions SET {', '.join(f'{column} = ?' for column in ids)} WHERE submission_id = ?",
+                (*ids.values(), submission_id),
+            )
+
+    def record_circuit(
+        self,
+        submission_id: int,
+        circuit_index: int,
+        algorithm_id: Optional[int] = None,
+        commit_id: Optional[int] = None,
+        file_id: Optional[int] = None,
+        job_id: Optional[int] = None,
+    ) -> None:
+        """Record the ids of platform objects created for circuit `circuit_index` of submission `submission_id`.
+
+        Ids that are not given keep their recorded value.
+        """
+        with self._connect() as connection:
+            connection.execute(
+                f"INSERT INTO circuits (submission_id, circuit_index, {', '.join(_CIRCUIT_IDS)}) "
+                f"VALUES (?, ?, ?, ?, ?, ?) ON CONFLICT (submission_id, circuit_index) DO UPDATE "
+                f"SET {', '.join(f'{column} = COALESCE(excluded.{column}, {column})' for column in _CIRCUIT_IDS)}",
+                (submission_id, circuit_index, algorithm_id, commit_id, file_id, job_id),
+            )
+
+    def finish(self, submission_id: int) -> None:
+        """Record that the batch job of submission `submission_id` was enqueued."""
+        with self._connect() as connection:
+            connection.execute("UPDATE submissions SET enqueued = 1 WHERE submission_id = ?", (submission_id,))
+
+    def remove(self, submission_id: int) -> None:
+        """Remove submission `submission_id` from the journal."""
+        with self._connect() as connection:
+            connection.execute("DELETE FROM circuits WHERE submission_id = ?", (submission_id,))
+            connection.execute("DELETE FROM submissions WHERE submission_id = ?", (submission_id,))
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        with self._lock:
+            if self._connection is None:
+                raise RuntimeError("SubmissionJournal is closed")
+            # commits when the block succeeds, rolls back otherwise
+            with self._connection:
+                yield self._connection
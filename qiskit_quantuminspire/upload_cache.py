@@ -0,0 +1,106 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Union
+
+DEFAULT_MAX_ENTRIES = 10_000
+
+
+class UploadCache:
+    """Content-addressed index of circuits that were uploaded to the platform before.
+
+    Maps a hash of the cQASM content, the host and the language to the id of the platform File holding that content,
+    so a circuit that was uploaded before can be submitted as a new job on the existing file. Entries are evicted in
+    least-recently-used order once `max_entries` is exceeded.
+
+    The index lives in memory. When `path` is given, it is loaded from that file on construction and written back
+    on :meth:`flush`, which the job calls at the end of every submission.
+    """
+
+    _FORMAT_VERSION = 1
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, path: Optional[Union[str, Path]] = None) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self.path = Path(path).expanduser() if path is not None else None
+        self._entries: OrderedDict[str, int] = OrderedDict()
+        self._lock = threading.Lock()
+        self._dirty = False
+        if self.path is not None and self.path.is_file():
+            self._load(self.path)
+
+    @staticmethod
+    def key(host: str, language_id: int, content: str) -> str:
+        """Return the cache key for `content` uploaded in language `language_id` to `host`."""
+        digest = hashlib.sha256()
+        for part in (host, str(language_id), content):
+            digest.update(part.encode())
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[int]:
+        """Return the id of the file uploaded for `key`, if any."""
+        with self._lock:
+            file_id = self._entries.get(key)
+            if file_id is not None:
+                self._entries.move_to_end(key)
+            return file_id
+
+    def put(self, key: str, file_id: int) -> None:
+        """Record that the content for `key` is stored in file `file_id`."""
+        with self._lock:
+            self._entries[key] = file_id
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            self._dirty = True
+
+    def invalidate(self, key: Optional[str] = None) -> None:
+        """Forget the file for `key`, or all files if no key is given."""
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+            self._dirty = True
+        self.flush()
+
+    def flush(self) -> None:
+        """Write the index to `path`, if the cache is backed by a file and has changed."""
+        if self.path is None:
+            return
+        with self._lock:
+            if not self._dirty:
+                return
+            data = {"version": self._FORMAT_VERSION, "entries": list(self._entries.items())}
+            self._dirty = False
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first, so a crash never leaves a truncated index behind
+        fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, prefix=self.path.name, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as file:
+                json.dump(data, file)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def _load(self, path: Path) -> None:
+        try:
+            data = json.loads(path.read_text())
+        except (OSError, ValueError):
+            # A corrupt index only costs re-uploads, start empty
+            return
+        if not isinstance(data, dict) or data.get("version") != self._FORMAT_VERSION:
+            return
+        for key, file_id in data.get("entries", [])[-self.max_entries :]:
+            self._entries[str(key)] = int(file_id)
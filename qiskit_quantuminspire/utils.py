@@ -1,3 +1,7 @@
+import random
+from dataclasses import dataclass
+from typing import Iterator, Optional
+
 from qiskit.transpiler import CouplingMap
 
 
@@ -10,3 +14,37 @@ def is_coupling_map_complete(coupling_map: CouplingMap) -> bool:
     is_semicomplete = all(distance in [1, 0] for distance in distance_matrix.flatten())
 
     return is_semicomplete and coupling_map.is_symmetric
+
+
+@dataclass(frozen=True)
+class Backoff:
+    """Exponentially growing delays with random jitter.
+
+    Args:
+        initial: The first delay, in seconds.
+        maximum: The delay stops growing once it reaches this number of seconds.
+        factor: Every delay is this factor longer than the previous one.
+        jitter: Every delay is varied randomly by up to this fraction, so clients that started at the same time do
+            not keep making their requests at the same time.
+    """
+
+    initial: float = 0.5
+    maximum: float = 30.0
+    factor: float = 1.5
+    jitter: float = 0.1
+
+    def __post_init__(self) -> None:
+        if self.initial <= 0 or self.maximum < self.initial:
+            raise ValueError("Backoff requires 0 < initial <= maximum")
+        if self.factor < 1:
+            raise ValueError("Backoff factor must be at least 1")
+        if not 0 <= self.jitter < 1:
+            raise ValueError("Backoff jitter must be in [0, 1)")
+
+    def delays(self, rng: Optional[random.Random] = None) -> Iterator[float]:
+        """Yield an endless sequence of delays, in seconds."""
+        uniform = (rng or random).uniform
+        delay = self.initial
+        while True:
+            yield min(delay * uniform(1 - self.jitter, 1 + self.jitter), self.maximum)
+            delay = min(delay * self.factor, self.maximum)
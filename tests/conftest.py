@@ -6,9 +6,16 @@ from pytest_mock import MockerFixture
 from qi2_shared.hybrid.quantum_interface import QuantumInterface
 from qi2_shared.pagination import PageReader
 
+from qiskit_quantuminspire.metadata_cache import METADATA_CACHE
 from tests.helpers import create_backend_type
 
 
+@pytest.fixture(autouse=True)
+def clear_metadata_cache() -> None:
+    # The metadata cache is process-wide, make sure no test sees metadata cached by another test
+    METADATA_CACHE.invalidate()
+
+
 @pytest.fixture
 def page_reader_mock(mocker: MockerFixture) -> AsyncMock:
     # Simply calling mocker.patch() doesn't work because PageReader is a generic class
@@ -25,6 +32,7 @@ def mock_api_client(mocker: MockerFixture) -> MagicMock:
     mocker.patch("qiskit_quantuminspire.qi_provider.BackendTypesApi")
 
     config_mock = MagicMock()
+    config_mock.host = "https://host"
     auth_settings = MagicMock()
     auth_settings.team_member_id = 1
     config_mock.auth_settings.return_value = auth_settings
@@ -32,16 +40,17 @@ def mock_api_client(mocker: MockerFixture) -> MagicMock:
         "qiskit_quantuminspire.qi_jobs.config",
         return_value=config_mock,
     )
+    mocker.patch("qiskit_quantuminspire.api_client_pool.config", return_value=config_mock)
 
     api_settings = MagicMock()
     auth_settings = MagicMock()
     auth_settings.team_member_id = 1
     api_settings.default_host = "url"
     api_settings.auths = {"url": auth_settings}
-    mocker.patch("qiskit_quantuminspire.qi_jobs.ApiSettings.from_config_file", return_value=api_settings)
+    mocker.patch("qiskit_quantuminspire.metadata_cache.ApiSettings.from_config_file", return_value=api_settings)
 
     return mocker.patch(
-        "qiskit_quantuminspire.qi_jobs.ApiClient",
+        "qiskit_quantuminspire.api_client_pool.ApiClient",
         autospec=True,
     )
 
@@ -26,6 +26,16 @@ def test_submit(quantum_interface: MagicMock, qi_hybrid_job_mock: MagicMock) ->
     qi_hybrid_job_mock.submit.assert_called_once()
 
 
+def test_submission_options_are_not_supported(quantum_interface: MagicMock) -> None:
+    # Arrange
+    backend = QIHybridBackend(quantum_interface)
+
+    # Act / Assert
+    assert not hasattr(backend.options, "submission_mode")
+    with pytest.raises(AttributeError):
+        backend.set_options(submit_concurrency=4)
+
+
 def test_raw_data(quantum_interface: MagicMock) -> None:
     # Arrange
     backend = QIHybridBackend(quantum_interface)
@@ -1,14 +1,31 @@
+import asyncio
 from unittest.mock import MagicMock
 
+import pytest
 from qi2_shared.hybrid.quantum_interface import ExecuteCircuitResult
 from qiskit import QuantumCircuit
+from qiskit.providers.jobstatus import JobStatus
 from qiskit.result.models import ExperimentResultData
 
 from qiskit_quantuminspire.hybrid.hybrid_backend import QIHybridBackend
 from qiskit_quantuminspire.hybrid.hybrid_job import QIHybridJob
+from qiskit_quantuminspire.job_monitor import JobMonitor
 from qiskit_quantuminspire.qi_instructions import Asm
 
 
+def _submitted_job(quantum_interface: MagicMock) -> QIHybridJob:
+    quantum_interface.execute_circuit.return_value = ExecuteCircuitResult(
+        shots_requested=1024, shots_done=1024, results={"0": 1000, "1": 24}, raw_data=None
+    )
+    circuit = QuantumCircuit(1, 1, name="circuit")
+    circuit.measure(0, 0)
+    job = QIHybridJob(
+        run_input=[circuit], backend=QIHybridBackend(quantum_interface), quantum_interface=quantum_interface
+    )
+    job.submit()
+    return job
+
+
 def test_submit(quantum_interface: MagicMock) -> None:
     backend = QIHybridBackend(quantum_interface)
     circuit = QuantumCircuit(2, 2)
@@ -31,3 +48,32 @@ def test_submit(quantum_interface: MagicMock) -> None:
     expected_result_data = ExperimentResultData(counts={"0x0": 256, "0x1": 256, "0x2": 256, "0x3": 256})
 
     assert actual_result.data(circuit) == expected_result_data.to_dict()
+
+
+def test_wait_for_final_state(quantum_interface: MagicMock) -> None:
+    # Arrange
+    job = QIHybridJob(
+        run_input=[QuantumCircuit(1, 1)],
+        backend=QIHybridBackend(quantum_interface),
+        quantum_interface=quantum_interface,
+    )
+
+    # Act / Assert
+    # hybrid jobs run synchronously, so they are done right away
+    job.wait_for_final_state(timeout=1)
+
+
+def test_results_without_batch_job(quantum_interface: MagicMock) -> None:
+    # Arrange
+    job = _submitted_job(quantum_interface)
+
+    # Act / Assert
+    assert asyncio.run(job.status_async()) == JobStatus.DONE
+    assert job.partial_result().get_counts() == {"0": 1000, "1": 24}
+    assert [index for index, _ in job.iter_results()] == [0]
+    assert job.raw_results()[0].results is not None
+
+
+def test_job_monitor_rejects_hybrid_job(quantum_interface: MagicMock) -> None:
+    with pytest.raises(ValueError, match="Only submitted jobs"):
+        JobMonitor([_submitted_job(quantum_interface)])
@@ -0,0 +1,143 @@
+import math
+from typing import Dict, List, Optional
+
+import numpy as np
+import pytest
+from pytest_mock import MockerFixture
+from qiskit import QuantumCircuit
+from qiskit.circuit import Parameter
+from qiskit.quantum_info import SparsePauliOp, Statevector
+
+from qiskit_quantuminspire.primitives.estimator import QIEstimatorV2
+from qiskit_quantuminspire.qi_backend import QIBackend
+from qiskit_quantuminspire.qi_jobs import CircuitExecutionData, QIJob
+from tests.helpers import create_backend_type, create_raw_job_result
+
+
+@pytest.fixture
+def backend(mocker: MockerFixture) -> QIBackend:
+    backend_type = create_backend_type()
+    qi_backend = QIBackend(backend_type=backend_type)
+    mocker.patch.object(qi_backend, "get_backend_type", return_value=backend_type)
+    mocker.patch("qiskit_quantuminspire.qi_jobs.QIJob.submit")
+    return qi_backend
+
+
+def _exact_counts(circuit: QuantumCircuit, shots: int) -> Dict[str, int]:
+    """Return the counts of the measurements of `circuit` without shot noise."""
+    measured = [
+        circuit.find_bit(instruction.qubits[0]).index for instruction in circuit.data if instruction.name == "measure"
+    ]
+    probabilities = Statevector(circuit.remove_final_measurements(inplace=False)).probabilities_dict(qargs=measured)
+    return {bitstring: round(probability * shots) for bitstring, probability in probabilities.items() if probability}
+
+
+def _patch_results(mocker: MockerFixture, counts: Optional[Dict[str, int]] = None) -> List[QIJob]:
+    """Let every job return `counts` for each circuit, or the exact counts of the circuit when not given."""
+    jobs: List[QIJob] = []
+
+    def raw_results(self: QIJob, timeout: Optional[float] = None) -> List[CircuitExecutionData]:
+        jobs.append(self)
+        shots = self.backend().options.get("shots")
+        for circuit_data in self.circuits_run_data:
+            results = counts if counts is not None else _exact_counts(circuit_data.circuit, shots)
+            circuit_data.results = create_raw_job_result(results=results)
+        return self.circuits_run_data
+
+    mocker.patch.object(QIJob, "raw_results", raw_results)
+    return jobs
+
+
+def test_run_groups_qubit_wise_commuting_terms(mocker: MockerFixture, backend: QIBackend) -> None:
+    # Arrange
+    bell = QuantumCircuit(2)
+    bell.h(0)
+    bell.cx(0, 1)
+    observables = [SparsePauliOp(["ZZ", "ZI", "IZ", "II"], [1, 2, 3, 4]), SparsePauliOp(["XX", "XI"]), "YY"]
+    jobs = _patch_results(mocker)
+
+    # Act
+    result = QIEstimatorV2(backend).run([(bell, observables)], precision=0.125).result()
+
+    # Assert
+    # ZZ/ZI/IZ, XX/XI and YY need a measurement circuit each, the identity none
+    assert len(jobs) == 1
+    assert len(jobs[0].circuits_run_data) == 3
+    np.testing.assert_allclose(result[0].data.evs, [5.0, 1.0, -1.0], atol=1e-12)
+    assert result[0].metadata["shots"] == 64
+    assert result[0].metadata["target_precision"] == 0.125
+
+
+def test_run_parameter_broadcasting(mocker: MockerFixture, backend: QIBackend) -> None:
+    # Arrange
+    theta = Parameter("theta")
+    circuit = QuantumCircuit(2)
+    circuit.ry(theta, 0)
+    observables = [SparsePauliOp(["ZZ", "XX"], [1, 0.5]), SparsePauliOp(["YY", "ZI"])]
+    jobs = _patch_results(mocker, {"00": 10})
+
+    # Act
+    result = QIEstimatorV2(backend).run([(circuit, observables, [[0.1], [0.2]])], precision=0.5).result()
+
+    # Assert
+    # each observable pairs with one set of values: XX is only run for the first and YY for the second,
+    # the group of ZZ and ZI for both
+    assert [len(job.circuits_run_data) for job in jobs] == [4]
+    np.testing.assert_allclose(result[0].data.evs, [1.5, 2.0])
+    np.testing.assert_allclose(result[0].data.stds, [0.0, 0.0])
+
+
+def test_run_standard_error(mocker: MockerFixture, backend: QIBackend) -> None:
+    # Arrange
+    circuit = QuantumCircuit(1)
+    circuit.h(0)
+    _patch_results(mocker)
+
+    # Act
+    result = QIEstimatorV2(backend, default_precision=0.1).run([(circuit, SparsePauliOp("Z", 2.0))]).result()
+
+    # Assert
+    assert result[0].data.evs == pytest.approx(0.0)
+    assert result[0].data.stds == pytest.approx(2.0 / math.sqrt(100))
+    # the options of the backend are left untouched
+    assert backend.options.get("shots") == 1024
+
+
+def test_run_identity_needs_no_circuits(mocker: MockerFixture, backend: QIBackend) -> None:
+    # Arrange
+    run = mocker.patch.object(backend, "run")
+
+    # Act
+    result = QIEstimatorV2(backend).run([(QuantumCircuit(2), SparsePauliOp("II", 3.0))]).result()
+
+    # Assert
+    assert result[0].data.evs == pytest.approx(3.0)
+    run.assert_not_called()
+
+
+def test_run_failed_circuit(mocker: MockerFixture, backend: QIBackend) -> None:
+    # Arrange
+    def raw_results(self: QIJob, timeout: Optional[float] = None) -> List[CircuitExecutionData]:
+        self.circuits_run_data[0].system_message = {"message": "out of time"}
+        return self.circuits_run_data
+
+    mocker.patch.object(QIJob, "raw_results", raw_results)
+
+    # Act / Assert
+    with pytest.raises(RuntimeError, match="out of time"):
+        QIEstimatorV2(backend).run([(QuantumCircuit(1), "Z")]).result()
+
+
+@pytest.mark.parametrize("counts", [{}, {"0": 0, "1": 0}])
+def test_run_circuit_without_shots(mocker: MockerFixture, backend: QIBackend, counts: Dict[str, int]) -> None:
+    # Arrange
+    _patch_results(mocker, counts)
+
+    # Act / Assert
+    with pytest.raises(RuntimeError, match="returned no shots"):
+        QIEstimatorV2(backend).run([(QuantumCircuit(1), "Z")]).result()
+
+
+def test_run_invalid_precision(backend: QIBackend) -> None:
+    with pytest.raises(ValueError):
+        QIEstimatorV2(backend).run([(QuantumCircuit(1), "Z")], precision=0.0)
@@ -0,0 +1,138 @@
+from typing import Dict, List, Optional
+
+import numpy as np
+import pytest
+from compute_api_client import BackendType
+from pytest_mock import MockerFixture
+from qiskit import ClassicalRegister, QuantumCircuit, QuantumRegister
+from qiskit.circuit import Parameter
+
+from qiskit_quantuminspire.cqasm import dumps
+from qiskit_quantuminspire.primitives.sampler import QISamplerV2
+from qiskit_quantuminspire.qi_backend import QIBackend
+from qiskit_quantuminspire.qi_jobs import CircuitExecutionData, QIJob
+from tests.helpers import create_backend_type, create_raw_job_result
+
+
+def _backend(mocker: MockerFixture, backend_type: Optional[BackendType] = None) -> QIBackend:
+    backend_type = backend_type or create_backend_type()
+    backend = QIBackend(backend_type=backend_type)
+    mocker.patch.object(backend, "get_backend_type", return_value=backend_type)
+    mocker.patch("qiskit_quantuminspire.qi_jobs.QIJob.submit")
+    return backend
+
+
+def _patch_results(mocker: MockerFixture, results: List[Dict[str, object]]) -> List[QIJob]:
+    """Let every job return the next platform results, one per circuit, from `raw_results`."""
+    jobs: List[QIJob] = []
+    remaining = iter(results)
+
+    def raw_results(self: QIJob, timeout: Optional[float] = None) -> List[CircuitExecutionData]:
+        jobs.append(self)
+        for circuit_data in self.circuits_run_data:
+            circuit_data.results = create_raw_job_result(**next(remaining))  # type: ignore[arg-type]
+        return self.circuits_run_data
+
+    mocker.patch.object(QIJob, "raw_results", raw_results)
+    return jobs
+
+
+def test_run_packs_shots_per_register(mocker: MockerFixture) -> None:
+    # Arrange
+    backend = _backend(mocker)
+    circuit = QuantumCircuit(QuantumRegister(2), ClassicalRegister(2, "a"), ClassicalRegister(1, "b"))
+    circuit.measure([0, 1], [0, 2])
+    # clbit 0 is the rightmost bit
+    _patch_results(mocker, [{"results": {"001": 1, "100": 2}, "raw_data": ["001", "100", "100"]}])
+
+    # Act
+    result = QISamplerV2(backend).run([circuit], shots=3).result()
+
+    # Assert
+    data = result[0].data
+    assert data.a.get_bitstrings() == ["01", "00", "00"]
+    assert data.b.get_bitstrings() == ["0", "1", "1"]
+    assert data.a.num_shots == 3
+    assert result[0].metadata["shots"] == 3
+
+
+def test_run_parameter_sweep(mocker: MockerFixture) -> None:
+    # Arrange
+    backend = _backend(mocker)
+    theta = Parameter("theta")
+    circuit = QuantumCircuit(1, 1)
+    circuit.rx(theta, 0)
+    circuit.measure(0, 0)
+    values = np.array([[[0.1], [0.2]], [[0.3], [0.4]]])
+    jobs = _patch_results(
+        mocker, [{"results": {"1": 2}, "raw_data": ["1"] * index + ["0"] * (2 - index)} for index in (0, 1, 2, 0)]
+    )
+
+    # Act
+    result = QISamplerV2(backend).run([(circuit, values)], shots=2).result()
+
+    # Assert
+    assert [circuit_data.cqasm for circuit_data in jobs[0].circuits_run_data] == [
+        dumps(circuit.assign_parameters([value])) for value in (0.1, 0.2, 0.3, 0.4)
+    ]
+    bit_array = result[0].data.c
+    assert bit_array.shape == (2, 2)
+    np.testing.assert_array_equal(bit_array.bitcount().sum(axis=-1), [[0, 1], [2, 0]])
+
+
+def test_run_submits_pubs_with_their_shots_together(mocker: MockerFixture) -> None:
+    # Arrange
+    backend = _backend(mocker)
+    backend.set_options(shots=7)
+    circuit = QuantumCircuit(1, 1)
+    circuit.measure(0, 0)
+    jobs = _patch_results(
+        mocker,
+        [
+            {"results": {"1": 2}, "raw_data": ["1", "1"]},
+            {"results": {"0": 4}, "raw_data": ["0"] * 4},
+            {"results": {"1": 2}, "raw_data": ["1", "1"]},
+        ],
+    )
+
+    # Act
+    result = QISamplerV2(backend, default_shots=2).run([circuit, (circuit, None, 4), circuit]).result()
+
+    # Assert
+    assert len(jobs) == 1
+    assert [circuit_data.number_of_shots for circuit_data in jobs[0].circuits_run_data] == [2, 4, 2]
+    assert [pub_result.data.c.num_shots for pub_result in result] == [2, 4, 2]
+    # the options of the backend are left untouched
+    assert backend.options.get("shots") == 7
+    assert backend.options.get("memory") is False
+
+
+def test_run_without_raw_data_uses_counts(mocker: MockerFixture) -> None:
+    # Arrange
+    backend = _backend(mocker, create_backend_type(supports_raw_data=False))
+    circuit = QuantumCircuit(2, 2)
+    circuit.measure([0, 1], [0, 1])
+    _patch_results(mocker, [{"results": {"00": 1, "11": 3}}])
+
+    # Act
+    result = QISamplerV2(backend).run([circuit], shots=4).result()
+
+    # Assert
+    assert result[0].data.c.get_counts() == {"00": 1, "11": 3}
+
+
+def test_run_failed_circuit(mocker: MockerFixture) -> None:
+    # Arrange
+    backend = _backend(mocker)
+    circuit = QuantumCircuit(1, 1)
+    circuit.measure(0, 0)
+
+    def raw_results(self: QIJob, timeout: Optional[float] = None) -> List[CircuitExecutionData]:
+        self.circuits_run_data[0].system_message = {"message": "out of time"}
+        return self.circuits_run_data
+
+    mocker.patch.object(QIJob, "raw_results", raw_results)
+
+    # Act / Assert
+    with pytest.raises(RuntimeError, match="out of time"):
+        QISamplerV2(backend).run([circuit]).result()
@@ -0,0 +1,132 @@
+import asyncio
+import gc
+
+import pytest
+from compute_api_client import ApiClient, Configuration
+from pytest_mock import MockerFixture
+
+from qiskit_quantuminspire.api_client_pool import ApiClientPool
+
+
+async def _get_client(pool: ApiClientPool) -> ApiClient:
+    async with pool.client() as api_client:
+        return api_client
+
+
+@pytest.fixture
+def pool() -> ApiClientPool:
+    return ApiClientPool(Configuration(host="https://host"), pool_size=5, keepalive_timeout=10.0)
+
+
+def test_client_is_shared_between_sync_calls(pool: ApiClientPool) -> None:
+    with pool:
+        # Act
+        first = pool.run(_get_client(pool))
+        second = pool.run(_get_client(pool))
+
+        # Assert
+        assert first is second
+        connector = first.rest_client.pool_manager.connector
+        assert connector.limit == 5
+        assert connector._keepalive_timeout == 10.0
+
+
+def test_client_per_event_loop(pool: ApiClientPool) -> None:
+    with pool:
+        # Act
+        pooled_client = pool.run(_get_client(pool))
+        loop = asyncio.new_event_loop()
+        try:
+            first = loop.run_until_complete(_get_client(pool))
+            second = loop.run_until_complete(_get_client(pool))
+            pool.close()
+        finally:
+            loop.close()
+
+    # Assert
+    assert first is second
+    assert first is not pooled_client
+    assert first.rest_client.pool_manager.closed
+    assert pooled_client.rest_client.pool_manager.closed
+
+
+def test_client_is_closed_when_event_loop_shuts_down(pool: ApiClientPool) -> None:
+    with pool:
+        # Act
+        first = asyncio.run(_get_client(pool))
+        second = asyncio.run(_get_client(pool))
+
+        # Assert
+        assert first is not second
+        assert first.rest_client.pool_manager.closed
+        assert second.rest_client.pool_manager.closed
+
+
+def test_garbage_collected_pool_stops_its_thread() -> None:
+    # Arrange
+    pool = ApiClientPool(Configuration(host="https://host"))
+    api_client = pool.run(_get_client(pool))
+    thread = pool._thread
+    assert thread is not None
+
+    # Act
+    del pool
+    gc.collect()
+
+    # Assert
+    assert not thread.is_alive()
+    assert api_client.rest_client.pool_manager.closed
+
+
+def test_close(pool: ApiClientPool) -> None:
+    # Arrange
+    api_client = pool.run(_get_client(pool))
+
+    # Act
+    pool.close()
+    pool.close()
+
+    # Assert
+    assert pool.closed
+    assert api_client.rest_client.pool_manager.closed
+    with pytest.raises(RuntimeError):
+        pool.run(_get_client(pool))
+
+
+def test_run_on_pool_loop_is_refused(pool: ApiClientPool) -> None:
+    # Arrange
+    async def run_nested() -> None:
+        pool.run(asyncio.sleep(0))
+
+    # Act / Assert
+    with pool, pytest.raises(RuntimeError):
+        pool.run(run_nested())
+
+
+def test_configuration_defaults_to_cli_login(mocker: MockerFixture) -> None:
+    # Arrange
+    configuration = Configuration(host="https://host")
+    mocker.patch("qiskit_quantuminspire.api_client_pool.config", return_value=configuration)
+
+    # Act / Assert
+    assert ApiClientPool().configuration is configuration
+
+
+def test_invalid_pool_size() -> None:
+    with pytest.raises(ValueError):
+        ApiClientPool(pool_size=0)
+
+
+def test_aclose(pool: ApiClientPool) -> None:
+    # Arrange
+    async def use_and_close() -> ApiClient:
+        api_client = await _get_client(pool)
+        await pool.aclose()
+        return api_client
+
+    # Act
+    api_client = asyncio.run(use_and_close())
+
+    # Assert
+    assert pool.closed
+    assert api_client.rest_client.pool_manager.closed
@@ -0,0 +1,103 @@
+from typing import List
+
+import numpy as np
+import pytest
+
+from qiskit_quantuminspire.bitstrings import (
+    bitstrings_to_bit_array,
+    bitstrings_to_bits,
+    bitstrings_to_hex,
+    bitstrings_to_ints,
+    counts_to_hex,
+    ints_to_hex,
+)
+
+
+@pytest.mark.parametrize("width", [1, 7, 8, 9, 16, 17, 32, 33, 63, 64, 65, 100])
+def test_bitstrings_to_hex_matches_hex(width: int) -> None:
+    # Arrange
+    rng = np.random.default_rng(width)
+    bitstrings = ["".join(bits) for bits in rng.choice(["0", "1"], size=(500, width))]
+
+    # Act
+    hex_strings = bitstrings_to_hex(bitstrings)
+
+    # Assert
+    assert hex_strings == [hex(int(bitstring, 2)) for bitstring in bitstrings]
+
+
+def test_bitstrings_to_ints() -> None:
+    # Act
+    values = bitstrings_to_ints(["0000", "0101", "1111", "0101"])
+
+    # Assert
+    assert values.dtype == np.uint64
+    assert values.tolist() == [0, 5, 15, 5]
+
+
+@pytest.mark.parametrize(
+    "bitstrings, expected",
+    [
+        ([], []),
+        (["1", "011", "10"], [1, 3, 2]),  # different widths
+        (["1" * 70], [2**70 - 1]),  # wider than 64 bits
+    ],
+)
+def test_bitstrings_to_ints_without_packing(bitstrings: List[str], expected: List[int]) -> None:
+    assert bitstrings_to_ints(bitstrings).tolist() == expected
+
+
+@pytest.mark.parametrize("bitstrings", [["012"], ["01", "0a"], ["0é"]])
+def test_bitstrings_to_ints_invalid_characters(bitstrings: List[str]) -> None:
+    with pytest.raises(ValueError):
+        bitstrings_to_ints(bitstrings)
+
+
+def test_ints_to_hex() -> None:
+    assert ints_to_hex(np.array([3, 0, 255, 3], dtype=np.uint64)) == ["0x3", "0x0", "0xff", "0x3"]
+
+
+def test_counts_to_hex() -> None:
+    assert counts_to_hex({"00": 1, "01": 2, "11": 3}) == {"0x0": 1, "0x1": 2, "0x3": 3}
+
+
+def test_bitstrings_to_bits() -> None:
+    # Act
+    bits = bitstrings_to_bits(["110", "001"])
+
+    # Assert
+    # column i holds bit i, counted from the right
+    np.testing.assert_array_equal(bits, [[0, 1, 1], [1, 0, 0]])
+    assert bitstrings_to_bits([]).shape == (0, 0)
+    with pytest.raises(ValueError):
+        bitstrings_to_bits(["1", "01"])
+
+
+def test_bitstrings_to_bit_array() -> None:
+    # Arrange
+    bitstrings = ["101", "000", "111", "101"]
+
+    # Act
+    bit_array = bitstrings_to_bit_array(bitstrings, num_bits=9)
+
+    # Assert
+    assert bit_array.num_shots == 4
+    assert bit_array.num_bits == 9
+    assert bit_array.array.dtype == np.uint8
+    assert bit_array.array.shape == (4, 2)
+    assert bit_array.get_bitstrings() == [bitstring.zfill(9) for bitstring in bitstrings]
+
+
+def test_bitstrings_to_bit_array_without_shots() -> None:
+    # Act
+    bit_array = bitstrings_to_bit_array([], num_bits=3)
+
+    # Assert
+    assert bit_array.num_shots == 0
+    assert bit_array.num_bits == 3
+
+
+@pytest.mark.parametrize("bitstrings, num_bits", [(["1", "01"], None), (["0101"], 3)])
+def test_bitstrings_to_bit_array_invalid(bitstrings: List[str], num_bits: int) -> None:
+    with pytest.raises(ValueError):
+        bitstrings_to_bit_array(bitstrings, num_bits)
@@ -0,0 +1,247 @@
+import math
+from pathlib import Path
+
+import numpy as np
+import pytest
+from pytest_mock import MockerFixture
+from qiskit import ClassicalRegister, QuantumCircuit, QuantumRegister
+from qiskit.circuit import Parameter
+
+from qiskit_quantuminspire.compile_cache import CompileCache, circuit_fingerprint, target_fingerprint
+from qiskit_quantuminspire.cqasm import dumps
+from qiskit_quantuminspire.qi_backend import QIBackend
+from tests.helpers import create_backend_type
+
+
+def _bell_circuit(angle: float = math.pi / 2) -> QuantumCircuit:
+    qc = QuantumCircuit(2, 2)
+    qc.h(0)
+    qc.cx(0, 1)
+    qc.rz(angle, 1)
+    qc.measure([0, 1], [0, 1])
+    return qc
+
+
+def _qi_backend() -> QIBackend:
+    return QIBackend(backend_type=create_backend_type())
+
+
+def test_fingerprint_ignores_name_and_metadata() -> None:
+    # Arrange
+    qc = _bell_circuit()
+    other = _bell_circuit()
+    other.name = "other"
+    other.metadata = {"key": "value"}
+
+    # Act / Assert
+    assert circuit_fingerprint(qc) == circuit_fingerprint(other)
+
+
+def _modified_bell_circuits() -> list[QuantumCircuit]:
+    swapped_operands = QuantumCircuit(2, 2)
+    swapped_operands.h(1)
+    swapped_operands.cx(1, 0)
+    swapped_operands.rz(math.pi / 2, 0)
+    swapped_operands.measure([0, 1], [0, 1])
+
+    swapped_clbits = QuantumCircuit(2, 2)
+    swapped_clbits.compose(_bell_circuit().remove_final_measurements(inplace=False), inplace=True)
+    swapped_clbits.measure([0, 1], [1, 0])
+
+    extra_clbit = QuantumCircuit(2, 3)
+    extra_clbit.compose(_bell_circuit(), inplace=True)
+
+    other_register = QuantumCircuit(QuantumRegister(2, "r"), ClassicalRegister(2))
+    other_register.compose(_bell_circuit(), inplace=True)
+
+    parameterized = _bell_circuit()
+    parameterized.rx(Parameter("theta"), 0)
+
+    return [_bell_circuit(math.pi / 4), swapped_operands, swapped_clbits, extra_clbit, other_register, parameterized]
+
+
+@pytest.mark.parametrize("circuit", _modified_bell_circuits())
+def test_fingerprint_detects_structural_changes(circuit: QuantumCircuit) -> None:
+    assert circuit_fingerprint(circuit) != circuit_fingerprint(_bell_circuit())
+
+
+def test_fingerprint_normalizes_numpy_parameters() -> None:
+    assert circuit_fingerprint(_bell_circuit(np.float64(0.5))) == circuit_fingerprint(_bell_circuit(0.5))
+
+
+def test_fingerprint_of_unitary_gate() -> None:
+    # Arrange
+    qc = QuantumCircuit(2)
+    qc.unitary(np.eye(4), [0, 1])
+    other = QuantumCircuit(2)
+    other.unitary(np.kron(np.eye(2), [[0, 1], [1, 0]]), [0, 1])
+    cache = CompileCache()
+
+    # Act / Assert
+    assert circuit_fingerprint(qc) == circuit_fingerprint(qc.copy())
+    assert circuit_fingerprint(qc) != circuit_fingerprint(other)
+    assert cache.compile(qc, _qi_backend()).cqasm == cache.compile(qc.copy(), _qi_backend()).cqasm
+    assert cache.stats.hits == 1
+
+
+def test_fingerprint_includes_custom_gate_definitions() -> None:
+    # Arrange
+    def oracle(marked: int) -> QuantumCircuit:
+        body = QuantumCircuit(2, name="oracle")
+        body.x(marked)
+        body.cz(0, 1)
+        body.x(marked)
+        qc = QuantumCircuit(2)
+        qc.append(body.to_gate(), [0, 1])
+        qc.append(body.to_instruction(), [0, 1])
+        return qc
+
+    # Act / Assert
+    assert circuit_fingerprint(oracle(0)) == circuit_fingerprint(oracle(0))
+    assert circuit_fingerprint(oracle(0)) != circuit_fingerprint(oracle(1))
+
+
+def test_target_fingerprint() -> None:
+    # Arrange
+    backend = _qi_backend()
+    same_backend = _qi_backend()
+    other_backend = QIBackend(backend_type=create_backend_type(topology=[[0, 1], [1, 2]], nqubits=3))
+
+    # Act / Assert
+    assert target_fingerprint(backend.target) == target_fingerprint(same_backend.target)
+    assert target_fingerprint(backend.target) != target_fingerprint(other_backend.target)
+
+
+def test_compile_hit_skips_transpilation(mocker: MockerFixture) -> None:
+    # Arrange
+    cache = CompileCache()
+    backend = _qi_backend()
+    transpile = mocker.patch("qiskit_quantuminspire.compile_cache.transpile", side_effect=lambda qc, **_: qc.copy())
+
+    # Act
+    first = cache.compile(_bell_circuit(), backend)
+    renamed = _bell_circuit()
+    renamed.name = "renamed"
+    second = cache.compile(renamed, backend)
+
+    # Assert
+    transpile.assert_called_once()
+    assert second.cqasm == first.cqasm == dumps(_bell_circuit())
+    assert second.circuit.name == "renamed"
+    assert cache.stats.hits == 1
+    assert cache.stats.misses == 1
+    assert cache.stats.hit_rate == 0.5
+
+
+def test_compile_key_includes_transpile_options(mocker: MockerFixture) -> None:
+    # Arrange
+    cache = CompileCache()
+    backend = _qi_backend()
+    transpile = mocker.patch("qiskit_quantuminspire.compile_cache.transpile", side_effect=lambda qc, **_: qc.copy())
+
+    # Act
+    cache.compile(_bell_circuit(), backend, optimization_level=1)
+    cache.compile(_bell_circuit(), backend, optimization_level=2)
+
+    # Assert
+    assert transpile.call_count == 2
+
+
+def test_compiled_circuit_cqasm_is_reused(mocker: MockerFixture) -> None:
+    # Arrange
+    cache = CompileCache()
+    compiled = cache.compile(_bell_circuit(), _qi_backend(), seed_transpiler=1)
+    dumps_many = mocker.patch("qiskit_quantuminspire.compile_cache.cqasm.dumps_many", return_value=[])
+
+    # Act
+    contents = cache.dumps_many([compiled.circuit])
+
+    # Assert
+    assert contents == [compiled.cqasm]
+    dumps_many.assert_called_once_with([], None)
+
+
+def test_dumps_many_only_converts_misses() -> None:
+    # Arrange
+    cache = CompileCache()
+    circuits = [_bell_circuit(angle) for angle in (0.1, 0.2, 0.1, 0.3)]
+    cache.dumps_many(circuits[:1])
+
+    # Act
+    contents = cache.dumps_many(circuits)
+
+    # Assert
+    assert contents == [dumps(qc) for qc in circuits]
+    assert len(cache) == 3
+    assert cache.stats.hits == 2
+    assert cache.stats.misses == 3
+
+
+def test_least_recently_used_entry_is_evicted() -> None:
+    # Arrange
+    cache = CompileCache(max_entries=2)
+    circuits = [_bell_circuit(angle) for angle in (0.1, 0.2, 0.3)]
+
+    # Act
+    cache.dumps_many(circuits[:2])
+    cache.dumps_many(circuits[:1])
+    cache.dumps_many(circuits[2:])
+    cache.dumps_many(circuits[:1])
+
+    # Assert
+    assert len(cache) == 2
+    assert cache.stats.hits == 2
+
+
+def test_invalid_max_entries() -> None:
+    with pytest.raises(ValueError):
+        CompileCache(max_entries=0)
+
+
+def test_disk_store_is_shared_between_caches(tmp_path: Path, mocker: MockerFixture) -> None:
+    # Arrange
+    backend = _qi_backend()
+    compiled = CompileCache(path=tmp_path).compile(_bell_circuit(), backend)
+    transpile = mocker.patch("qiskit_quantuminspire.compile_cache.transpile")
+    cache = CompileCache(path=tmp_path)
+
+    # Act
+    from_disk = cache.compile(_bell_circuit(), backend)
+    from_memory = cache.compile(_bell_circuit(), backend)
+
+    # Assert
+    transpile.assert_not_called()
+    assert from_disk.cqasm == from_memory.cqasm == compiled.cqasm
+    assert from_disk.circuit == compiled.circuit
+    assert cache.stats.disk_hits == 1
+    assert cache.stats.hits == 2
+
+
+def test_corrupt_disk_entry_is_recompiled(tmp_path: Path) -> None:
+    # Arrange
+    backend = _qi_backend()
+    CompileCache(path=tmp_path).compile(_bell_circuit(), backend)
+    for entry in tmp_path.glob("*.qpy"):
+        entry.write_bytes(b"not qpy")
+    cache = CompileCache(path=tmp_path)
+
+    # Act
+    compiled = cache.compile(_bell_circuit(), backend)
+
+    # Assert
+    assert compiled.cqasm == dumps(compiled.circuit)
+    assert cache.stats.misses == 1
+
+
+def test_clear(tmp_path: Path) -> None:
+    # Arrange
+    cache = CompileCache(path=tmp_path)
+    cache.compile(_bell_circuit(), _qi_backend())
+
+    # Act
+    cache.clear()
+
+    # Assert
+    assert len(cache) == 0
+    assert cache.stats.hits == cache.stats.misses == 0
+    assert list(tmp_path.iterdir()) == []
@@ -1,9 +1,13 @@
 import math
+from typing import List, Optional
 
+import numpy as np
 import pytest
+from pytest_mock import MockerFixture
 from qiskit import QuantumCircuit
+from qiskit.circuit import Parameter, ParameterVector
 
-from qiskit_quantuminspire.cqasm import dumps
+from qiskit_quantuminspire.cqasm import _dumps_native, _dumps_opensquirrel, compile_template, dumps, dumps_many
 from qiskit_quantuminspire.qi_instructions import Asm
 
 
@@ -101,3 +105,237 @@ def test_cqasm_without_unit() -> None:
 
     # Assert
     assert "wait(20)" in cqasm
+
+
+@pytest.mark.parametrize("workers", [None, 1, 2])
+def test_cqasm_dumps_many(workers: Optional[int]) -> None:
+    # Arrange
+    circuits = []
+    for n in range(1, 6):
+        qc = QuantumCircuit(n, n)
+        qc.h(0)
+        qc.rx(math.pi / n, n - 1)
+        qc.measure(range(n), range(n))
+        circuits.append(qc)
+
+    # Act
+    serialized_cqasm = dumps_many(circuits, workers=workers)
+
+    # Assert
+    assert serialized_cqasm == [dumps(qc) for qc in circuits]
+
+
+def test_cqasm_dumps_many_spawns_workers(mocker: MockerFixture) -> None:
+    # Arrange
+    executor = mocker.patch("qiskit_quantuminspire.cqasm.ProcessPoolExecutor")
+    executor.return_value.__enter__.return_value.map.return_value = iter(["cqasm 1", "cqasm 2"])
+
+    # Act
+    dumps_many([QuantumCircuit(1), QuantumCircuit(2)], workers=2)
+
+    # Assert
+    assert executor.call_args.kwargs["mp_context"].get_start_method() == "spawn"
+
+
+def test_cqasm_dumps_many_empty() -> None:
+    assert dumps_many([], workers=4) == []
+
+
+ANGLES = [0.0, 1e-12, -1e-12, math.pi / 2, math.pi, -math.pi, 3 * math.pi, -7.5, 123456.789, np.float64(0.3)]
+
+
+def _single_instruction_circuits() -> List[QuantumCircuit]:
+    circuits = []
+    for gate in ["id", "h", "x", "y", "z", "s", "sdg", "t", "tdg", "reset"]:
+        qc = QuantumCircuit(3)
+        getattr(qc, gate)(2)
+        circuits.append(qc)
+    for gate in ["rx", "ry", "rz"]:
+        for angle in ANGLES:
+            qc = QuantumCircuit(2)
+            getattr(qc, gate)(angle, 1)
+            circuits.append(qc)
+    for angle in ANGLES:
+        qc = QuantumCircuit(3)
+        qc.cp(angle, 2, 0)
+        circuits.append(qc)
+    for gate in ["cx", "cz", "swap"]:
+        qc = QuantumCircuit(3)
+        getattr(qc, gate)(2, 0)
+        circuits.append(qc)
+    for duration in [0, 20, 20.0]:
+        qc = QuantumCircuit(2)
+        qc.delay(duration, 1, unit="dt")
+        circuits.append(qc)
+    qc = QuantumCircuit(3, 2)
+    qc.measure([2, 0], [0, 1])
+    circuits.append(qc)
+    qc = QuantumCircuit(3)
+    qc.barrier()
+    qc.barrier(1)
+    circuits.append(qc)
+    qc = QuantumCircuit(1)
+    qc.append(Asm(backend_name="TestBackend", asm_code="""\n a ' " {} () [] b \n"""))
+    circuits.append(qc)
+    return circuits
+
+
+def _random_circuit(seed: int) -> QuantumCircuit:
+    rng = np.random.default_rng(seed)
+    num_qubits = int(rng.integers(2, 6))
+    qc = QuantumCircuit(num_qubits, int(rng.integers(0, num_qubits + 1)))
+    for _ in range(200):
+        qubits = [int(qubit) for qubit in rng.choice(num_qubits, size=2, replace=False)]
+        gate = rng.choice(["h", "x", "sdg", "t", "rx", "ry", "rz", "cx", "cz", "cp", "swap", "barrier", "reset"])
+        if gate in ["rx", "ry", "rz"]:
+            getattr(qc, gate)(float(rng.uniform(-20, 20)), qubits[0])
+        elif gate == "cp":
+            qc.cp(float(rng.uniform(-20, 20)), *qubits)
+        elif gate in ["cx", "cz", "swap", "barrier"]:
+            getattr(qc, gate)(*qubits)
+        else:
+            getattr(qc, gate)(qubits[0])
+    qc.measure(range(qc.num_clbits), range(qc.num_clbits))
+    return qc
+
+
+@pytest.mark.parametrize(
+    "circuit",
+    [
+        *_single_instruction_circuits(),
+        *[_random_circuit(seed) for seed in range(10)],
+        QuantumCircuit(),
+        QuantumCircuit(2),
+        QuantumCircuit(0, 2),
+        QuantumCircuit(2, 2),
+    ],
+)
+def test_cqasm_native_writer_parity(circuit: QuantumCircuit) -> None:
+    # Act
+    native_cqasm = _dumps_native(circuit)
+
+    # Assert
+    assert native_cqasm is not None
+    assert native_cqasm == _dumps_opensquirrel(circuit)
+
+
+def _unbound_parameter_circuit() -> QuantumCircuit:
+    qc = QuantumCircuit(1)
+    qc.rx(Parameter("theta"), 0)
+    return qc
+
+
+def _circuit_with_delay_in(unit: str) -> QuantumCircuit:
+    qc = QuantumCircuit(1)
+    qc.delay(20, 0, unit=unit)
+    return qc
+
+
+def _toffoli_circuit() -> QuantumCircuit:
+    qc = QuantumCircuit(3)
+    qc.ccx(0, 1, 2)
+    return qc
+
+
+@pytest.mark.parametrize("circuit", [_unbound_parameter_circuit(), _circuit_with_delay_in("ns"), _toffoli_circuit()])
+def test_cqasm_native_writer_falls_back(circuit: QuantumCircuit) -> None:
+    assert _dumps_native(circuit) is None
+
+
+def _ansatz() -> QuantumCircuit:
+    theta = ParameterVector("theta", 3)
+    qc = QuantumCircuit(3, 3)
+    qc.h(0)
+    qc.rx(theta[0], 0)
+    qc.append(Asm(backend_name="TestBackend", asm_code=" {} "))
+    qc.ry(2 * theta[1] + 1, 1)
+    qc.cx(0, 1)
+    qc.cp(theta[0] - theta[2], 1, 2)
+    qc.rz(0.5, 2)
+    qc.measure([0, 1, 2], [0, 1, 2])
+    qc.rz(theta[2], 0)
+    return qc
+
+
+@pytest.mark.parametrize("circuit", [_ansatz(), _unbound_parameter_circuit(), QuantumCircuit(2), QuantumCircuit()])
+def test_cqasm_template_bind_many(circuit: QuantumCircuit) -> None:
+    # Arrange
+    rng = np.random.default_rng(1)
+    values = {
+        parameter: rng.uniform(-20, 20, size=8).tolist() + [0.0, math.pi, -math.pi] for parameter in circuit.parameters
+    }
+    num_bindings = 11 if circuit.parameters else 1
+    template = compile_template(circuit)
+
+    # Act
+    contents = template.bind_many(values)
+
+    # Assert
+    assert contents == [
+        dumps(circuit.assign_parameters({parameter: column[index] for parameter, column in values.items()}))
+        for index in range(num_bindings)
+    ]
+
+
+def test_cqasm_template_bind() -> None:
+    # Arrange
+    circuit = _ansatz()
+    values = dict(zip(circuit.parameters, [0.1, 0.2, 0.3]))
+
+    # Act
+    cqasm = compile_template(circuit).bind(values)
+
+    # Assert
+    assert cqasm == dumps(circuit.assign_parameters(values))
+
+
+def test_cqasm_template_without_native_writers() -> None:
+    # Arrange
+    duration = Parameter("duration")
+    circuit = _unbound_parameter_circuit()
+    circuit.delay(duration, 0, unit="dt")
+    values: dict[Parameter, list[float]] = {circuit.parameters[0]: [10, 20], circuit.parameters[1]: [0.1, 0.2]}
+
+    # Act
+    contents = compile_template(circuit).bind_many(values)
+
+    # Assert
+    assert contents == [
+        dumps(circuit.assign_parameters({parameter: column[index] for parameter, column in values.items()}))
+        for index in range(2)
+    ]
+
+
+def test_cqasm_template_bind_numpy_values() -> None:
+    # Arrange
+    circuit = _unbound_parameter_circuit()
+    template = compile_template(circuit)
+
+    # Act
+    contents = template.bind_many({circuit.parameters[0]: np.linspace(0, 1, 5)})
+
+    # Assert
+    assert contents == [dumps(circuit.assign_parameters([value])) for value in np.linspace(0, 1, 5)]
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        {},
+        {Parameter("theta"): [0.1]},
+        {Parameter("phi"): [0.1]},
+    ],
+)
+def test_cqasm_template_invalid_parameters(values: dict[Parameter, list[float]]) -> None:
+    with pytest.raises(ValueError):
+        compile_template(_unbound_parameter_circuit()).bind_many(values)
+
+
+def test_cqasm_template_values_of_different_length() -> None:
+    # Arrange
+    circuit = _ansatz()
+    values = dict(zip(circuit.parameters, [[0.1, 0.2], [0.1, 0.2], [0.1]]))
+
+    # Act / Assert
+    with pytest.raises(ValueError):
+        compile_template(circuit).bind_many(values)
@@ -0,0 +1,94 @@
+from pathlib import Path
+
+import pytest
+from pytest_mock import MockerFixture
+from qiskit import QuantumCircuit, qpy
+
+from qiskit_quantuminspire.job_archive import ArchivedJob, JobArchive, write_job_archive
+from qiskit_quantuminspire.result_cache import CachedResult
+from tests.helpers import create_raw_job_result
+
+
+def _circuit(num_qubits: int) -> QuantumCircuit:
+    circuit = QuantumCircuit(num_qubits, name=f"circuit_{num_qubits}")
+    circuit.h(0)
+    circuit.measure_all()
+    return circuit
+
+
+def test_round_trip(tmp_path: Path) -> None:
+    # Arrange
+    jobs = [
+        ArchivedJob(
+            backend_name="spin",
+            backend_id=1,
+            batch_job_id=10,
+            circuits=[_circuit(1), _circuit(2)],
+            job_ids=[100, 101],
+            results=[CachedResult(result=create_raw_job_result(raw_data=["0", "1"])), CachedResult()],
+        ),
+        ArchivedJob(backend_name="emulator", backend_id=2, batch_job_id=None, circuits=[_circuit(3)], job_ids=[None]),
+    ]
+
+    # Act
+    write_job_archive(tmp_path / "jobs.zip", jobs)
+
+    # Assert
+    with JobArchive(tmp_path / "jobs.zip") as archive:
+        assert len(archive) == 2
+        assert archive.batch_job_ids.tolist() == [10, -1]
+        assert archive.job_ids(0).tolist() == [100, 101]
+        assert archive.find(10) == 0
+        assert list(archive) == jobs
+
+
+def test_read_loads_one_job(tmp_path: Path, mocker: MockerFixture) -> None:
+    # Arrange
+    jobs = [
+        ArchivedJob(backend_name="spin", backend_id=1, batch_job_id=id_, circuits=[_circuit(1)], job_ids=[id_])
+        for id_ in range(5)
+    ]
+    write_job_archive(tmp_path / "jobs.zip", jobs)
+    load = mocker.spy(qpy, "load")
+
+    # Act
+    with JobArchive(tmp_path / "jobs.zip") as archive:
+        job = archive.read(archive.find(3))
+
+    # Assert
+    assert job == jobs[3]
+    load.assert_called_once()
+
+
+def test_find_unknown_batch_job(tmp_path: Path) -> None:
+    # Arrange
+    write_job_archive(
+        tmp_path / "jobs.zip",
+        [ArchivedJob(backend_name="spin", backend_id=1, batch_job_id=1, circuits=[_circuit(1)], job_ids=[1])],
+    )
+
+    # Act / Assert
+    with JobArchive(tmp_path / "jobs.zip") as archive:
+        with pytest.raises(KeyError):
+            archive.find(2)
+        with pytest.raises(IndexError):
+            archive.read(1)
+
+
+def test_invalid_archive(tmp_path: Path) -> None:
+    # Arrange
+    path = tmp_path / "jobs.qpy"
+    with open(path, "wb") as file:
+        qpy.dump([_circuit(1)], file)
+
+    # Act / Assert
+    with pytest.raises(ValueError):
+        JobArchive(path)
+
+
+def test_job_without_circuits(tmp_path: Path) -> None:
+    with pytest.raises(ValueError):
+        write_job_archive(
+            tmp_path / "jobs.zip",
+            [ArchivedJob(backend_name="spin", backend_id=1, batch_job_id=1, circuits=[], job_ids=[])],
+        )
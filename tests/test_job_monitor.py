@@ -0,0 +1,207 @@
+import asyncio
+from typing import Dict, List, Optional
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from compute_api_client import BatchJobStatus
+from compute_api_client.exceptions import ServiceException
+from pytest_mock import MockerFixture
+from qiskit import QuantumCircuit
+from qiskit.providers.exceptions import JobTimeoutError
+from qiskit.providers.jobstatus import JobStatus
+
+from qiskit_quantuminspire.job_monitor import JobMonitor
+from qiskit_quantuminspire.qi_jobs import QIBaseJob, QIJob, QIShardedJob
+from qiskit_quantuminspire.utils import Backoff
+
+
+def _page(statuses: Dict[int, BatchJobStatus], pages: Optional[int] = 1) -> MagicMock:
+    return MagicMock(items=[MagicMock(id=id_, status=status) for id_, status in statuses.items()], pages=pages)
+
+
+def _job(mocker: MockerFixture, batch_job_id: int) -> QIJob:
+    job = QIJob(run_input=QuantumCircuit(), backend=None)
+    job.batch_job_id = batch_job_id
+    mocker.patch.object(job, "_fetch_job_results")
+    mocker.patch.object(job, "_process_results", return_value=MagicMock(job_id=batch_job_id))
+    return job
+
+
+@pytest.fixture
+def batch_jobs_api(mocker: MockerFixture) -> AsyncMock:
+    mocker.patch("qiskit_quantuminspire.api_client_pool.config")
+    mocker.patch("qiskit_quantuminspire.api_client_pool.ApiClient", autospec=True)
+    api = AsyncMock()
+    mocker.patch("qiskit_quantuminspire.job_monitor.BatchJobsApi", return_value=api)
+    return api
+
+
+@pytest.fixture
+def sleep(mocker: MockerFixture) -> MagicMock:
+    return mocker.patch("qiskit_quantuminspire.job_monitor.time.sleep")
+
+
+def test_refresh_lists_batch_jobs_once(mocker: MockerFixture, batch_jobs_api: AsyncMock) -> None:
+    # Arrange
+    jobs = [_job(mocker, batch_job_id) for batch_job_id in (3, 5, 6)]
+    batch_jobs_api.read_batch_jobs_batch_jobs_get.return_value = _page(
+        {7: BatchJobStatus.QUEUED, 6: BatchJobStatus.RUNNING, 5: BatchJobStatus.FINISHED, 3: BatchJobStatus.PLANNED}
+    )
+    monitor = JobMonitor(jobs)
+
+    # Act
+    statuses = monitor.refresh()
+
+    # Assert
+    assert statuses == dict(zip(jobs, [JobStatus.QUEUED, JobStatus.DONE, JobStatus.RUNNING]))
+    batch_jobs_api.read_batch_jobs_batch_jobs_get.assert_awaited_once_with(sort_by="-created_on", page=1, size=100)
+
+
+def test_refresh_stops_listing_past_the_oldest_batch_job(mocker: MockerFixture, batch_jobs_api: AsyncMock) -> None:
+    # Arrange
+    jobs = [_job(mocker, batch_job_id) for batch_job_id in (2, 4, 9)]
+    pages = [
+        _page({9: BatchJobStatus.QUEUED, 8: BatchJobStatus.QUEUED}, pages=5),
+        _page({4: BatchJobStatus.RUNNING, 1: BatchJobStatus.FINISHED}, pages=5),
+    ]
+    single = _page({2: BatchJobStatus.FINISHED})
+    batch_jobs_api.read_batch_jobs_batch_jobs_get.side_effect = lambda **kwargs: (
+        single if "id" in kwargs else pages[kwargs["page"] - 1]
+    )
+    monitor = JobMonitor(jobs, page_size=2)
+
+    # Act
+    statuses = monitor.refresh()
+
+    # Assert
+    # the batch job missing from the listing (e.g. deleted and recreated) is fetched on its own
+    assert statuses == dict(zip(jobs, [JobStatus.DONE, JobStatus.RUNNING, JobStatus.QUEUED]))
+    assert batch_jobs_api.read_batch_jobs_batch_jobs_get.await_count == 3
+
+
+def test_refresh_falls_back_to_single_requests(mocker: MockerFixture, batch_jobs_api: AsyncMock) -> None:
+    # Arrange
+    job = _job(mocker, 1)
+    newer_batch_jobs = _page({10: BatchJobStatus.QUEUED}, pages=10)
+    batch_jobs_api.read_batch_jobs_batch_jobs_get.side_effect = lambda **kwargs: (
+        _page({1: BatchJobStatus.QUEUED}) if "id" in kwargs else newer_batch_jobs
+    )
+    monitor = JobMonitor([job], page_size=1)
+
+    # Act
+    statuses = monitor.refresh()
+
+    # Assert
+    # a second page would cost more than fetching the one batch job directly
+    assert statuses == {job: JobStatus.QUEUED}
+    assert batch_jobs_api.read_batch_jobs_batch_jobs_get.await_count == 2
+
+
+def test_as_completed(mocker: MockerFixture, batch_jobs_api: AsyncMock, sleep: MagicMock) -> None:
+    # Arrange
+    jobs = [_job(mocker, batch_job_id) for batch_job_id in (1, 2)]
+    batch_jobs_api.read_batch_jobs_batch_jobs_get.side_effect = [
+        _page({2: BatchJobStatus.RUNNING, 1: BatchJobStatus.QUEUED}),
+        _page({2: BatchJobStatus.FINISHED, 1: BatchJobStatus.RUNNING}),
+        _page({1: BatchJobStatus.RUNNING}),
+        _page({1: BatchJobStatus.FINISHED}),
+    ]
+    monitor = JobMonitor(jobs, poll_backoff=Backoff(initial=1.0, factor=2.0, jitter=0.0))
+
+    # Act
+    completed: List[QIBaseJob] = []
+    for job in monitor.as_completed():
+        completed.append(job)
+
+    # Assert
+    assert completed == [jobs[1], jobs[0]]
+    # the interval starts over after a job finishes
+    assert [call.args[0] for call in sleep.call_args_list] == [1.0, 1.0, 2.0]
+    # finished jobs are only polled until they finish
+    assert batch_jobs_api.read_batch_jobs_batch_jobs_get.await_count == 4
+    for job in jobs:
+        job._fetch_job_results.assert_called_once()  # type: ignore[attr-defined]
+        assert job.result().job_id == job.batch_job_id
+        job._fetch_job_results.assert_called_once()  # type: ignore[attr-defined]
+
+
+def test_as_completed_async(mocker: MockerFixture, batch_jobs_api: AsyncMock) -> None:
+    # Arrange
+    jobs = [_job(mocker, batch_job_id) for batch_job_id in (1, 2)]
+    batch_jobs_api.read_batch_jobs_batch_jobs_get.side_effect = [
+        _page({2: BatchJobStatus.QUEUED, 1: BatchJobStatus.FINISHED}),
+        _page({2: BatchJobStatus.FINISHED}),
+    ]
+    sleep = mocker.patch("qiskit_quantuminspire.job_monitor.asyncio.sleep")
+    monitor = JobMonitor(jobs, fetch_results=False)
+
+    async def collect() -> List[QIBaseJob]:
+        return [job async for job in monitor.as_completed_async()]
+
+    # Act
+    completed = asyncio.run(collect())
+
+    # Assert
+    assert completed == jobs
+    sleep.assert_awaited_once()
+    assert asyncio.run(monitor.refresh_async()) == {job: JobStatus.DONE for job in jobs}
+    for job in jobs:
+        job._fetch_job_results.assert_not_called()  # type: ignore[attr-defined]
+
+
+def test_as_completed_timeout(mocker: MockerFixture, batch_jobs_api: AsyncMock, sleep: MagicMock) -> None:
+    # Arrange
+    batch_jobs_api.read_batch_jobs_batch_jobs_get.return_value = _page({1: BatchJobStatus.QUEUED})
+    monitor = JobMonitor([_job(mocker, 1)])
+
+    # Act / Assert
+    with pytest.raises(JobTimeoutError):
+        list(monitor.as_completed(timeout=0.0))
+    sleep.assert_not_called()
+
+
+def test_sharded_job_submits_pending_shards(mocker: MockerFixture, batch_jobs_api: AsyncMock) -> None:
+    # Arrange
+    sharded_job = QIShardedJob(run_input=[QuantumCircuit(), QuantumCircuit()], backend=None)
+    sharded_job.jobs = [QIJob(run_input=[], backend=None), QIJob(run_input=[], backend=None)]
+    sharded_job.jobs[0].batch_job_id = 1
+    submit = mocker.patch.object(sharded_job, "_submit_pending_jobs")
+    batch_jobs_api.read_batch_jobs_batch_jobs_get.return_value = _page({1: BatchJobStatus.FINISHED})
+    monitor = JobMonitor([sharded_job])
+
+    # Act
+    statuses = monitor.refresh()
+
+    # Assert
+    assert statuses == {sharded_job: JobStatus.QUEUED}
+    submit.assert_awaited_once_with(0)
+
+
+def test_refresh_uses_retry_policy_of_backend(mocker: MockerFixture, batch_jobs_api: AsyncMock) -> None:
+    # Arrange
+    job = _job(mocker, 3)
+    job._backend = MagicMock()
+    job._backend.options.get = lambda name, default=None: None if name == "retry_policy" else default
+    batch_jobs_api.read_batch_jobs_batch_jobs_get.__name__ = "read_batch_jobs_batch_jobs_get"
+    batch_jobs_api.read_batch_jobs_batch_jobs_get.side_effect = [
+        ServiceException(status=503),
+        _page({3: BatchJobStatus.QUEUED}),
+    ]
+    monitor = JobMonitor([job])
+
+    # Act / Assert
+    # retries are turned off for the backend
+    with pytest.raises(ServiceException):
+        monitor.refresh()
+    batch_jobs_api.read_batch_jobs_batch_jobs_get.assert_awaited_once()
+
+
+def test_only_submitted_jobs_can_be_monitored() -> None:
+    with pytest.raises(ValueError):
+        JobMonitor([QIJob(run_input=QuantumCircuit(), backend=None)])
+
+
+@pytest.mark.parametrize("page_size", [0, 101])
+def test_invalid_page_size(page_size: int) -> None:
+    with pytest.raises(ValueError):
+        JobMonitor(page_size=page_size)
@@ -0,0 +1,85 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+from freezegun import freeze_time
+from pytest_mock import MockerFixture
+
+from qiskit_quantuminspire.metadata_cache import MetadataCache
+
+
+def test_api_settings_are_read_once(mocker: MockerFixture) -> None:
+    # Arrange
+    settings = MagicMock()
+    settings.default_host = "https://host"
+    settings.auths = {"https://host": MagicMock(team_member_id=7)}
+    from_config_file = mocker.patch(
+        "qiskit_quantuminspire.metadata_cache.ApiSettings.from_config_file", return_value=settings
+    )
+    cache = MetadataCache()
+
+    # Act
+    team_member_ids = [cache.team_member_id() for _ in range(3)]
+
+    # Assert
+    assert team_member_ids == [7, 7, 7]
+    from_config_file.assert_called_once()
+
+
+def test_api_settings_expire(mocker: MockerFixture) -> None:
+    # Arrange
+    from_config_file = mocker.patch("qiskit_quantuminspire.metadata_cache.ApiSettings.from_config_file")
+    cache = MetadataCache(ttl=60)
+
+    # Act
+    with freeze_time("2025-01-01 12:00:00") as frozen_time:
+        cache.api_settings()
+        frozen_time.tick(30)
+        cache.api_settings()
+        frozen_time.tick(31)
+        cache.api_settings()
+
+    # Assert
+    assert from_config_file.call_count == 2
+
+
+def test_language_is_fetched_once() -> None:
+    # Arrange
+    language = MagicMock()
+    fetch = AsyncMock(return_value=language)
+    cache = MetadataCache()
+
+    # Act
+    first = asyncio.run(cache.language("https://host", "cQASM", "3.0", fetch))
+    second = asyncio.run(cache.language("https://host", "cqasm", "3.0", fetch))
+
+    # Assert
+    assert first is language
+    assert second is language
+    fetch.assert_awaited_once()
+
+
+def test_unknown_language_is_not_cached() -> None:
+    # Arrange
+    fetch = AsyncMock(return_value=None)
+    cache = MetadataCache()
+
+    # Act
+    asyncio.run(cache.language("https://host", "cqasm", "4.0", fetch))
+    asyncio.run(cache.language("https://host", "cqasm", "4.0", fetch))
+
+    # Assert
+    assert fetch.await_count == 2
+
+
+def test_invalidate() -> None:
+    # Arrange
+    fetch = AsyncMock(return_value=MagicMock())
+    cache = MetadataCache()
+    asyncio.run(cache.language("https://host", "cqasm", "3.0", fetch))
+
+    # Act
+    cache.invalidate()
+    asyncio.run(cache.language("https://host", "cqasm", "3.0", fetch))
+
+    # Assert
+    assert fetch.await_count == 2
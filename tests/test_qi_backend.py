@@ -1,11 +1,15 @@
+import asyncio
 from typing import Any, Callable, Dict, Generator, Optional, Type
-from unittest.mock import MagicMock, PropertyMock
+from unittest.mock import AsyncMock, MagicMock, PropertyMock
 
 import pytest
 from compute_api_client import BackendStatus
+from freezegun import freeze_time
 from pytest_mock import MockerFixture
 from qiskit import QuantumCircuit
+from qiskit.circuit import Parameter
 
+from qiskit_quantuminspire.cqasm import dumps
 from qiskit_quantuminspire.mapping.instruction_mapping import InstructionMapping
 from qiskit_quantuminspire.qi_backend import QIBackend
 from tests.helpers import create_backend_type
@@ -32,6 +36,7 @@ def qi_backend_factory(mocker: MockerFixture) -> Callable[..., QIBackend]:
 
         qi_backend = QIBackend(backend_type=backend_type)
         mocker.patch.object(type(qi_backend), "status", PropertyMock(return_value=status))  # The class of the instance
+        mocker.patch.object(qi_backend, "get_backend_type", return_value=backend_type)
 
         return qi_backend
 
@@ -145,7 +150,7 @@ def test_qi_backend_repr() -> None:
 def test_qi_backend_construction_messages(mocker: MockerFixture, qi_backend_factory: Callable[..., QIBackend]) -> None:
     # Arrange
     backend_type = create_backend_type()
-    mock_run_async = mocker.patch("qiskit_quantuminspire.qi_backend.run_async")
+    mock_run_async = mocker.patch("qiskit_quantuminspire.api_client_pool.run_async")
     mock_run_async.return_value = backend_type
 
     # Act
@@ -155,6 +160,45 @@ def test_qi_backend_construction_messages(mocker: MockerFixture, qi_backend_fact
     assert qi_backend.message == "backend: message for backend"
 
 
+def test_qi_backend_backend_type_is_cached(mocker: MockerFixture) -> None:
+    # Arrange
+    offline_backend_type = create_backend_type().model_copy(update={"status": BackendStatus.OFFLINE})
+    get_backend_type = mocker.patch.object(
+        QIBackend, "_get_backend_type", new_callable=AsyncMock, return_value=offline_backend_type
+    )
+
+    with freeze_time("2025-01-01 12:00:00") as frozen_time:
+        qi_backend = QIBackend(backend_type=create_backend_type(), backend_type_ttl=30)
+
+        # Act
+        available_before_expiry = qi_backend.available and bool(qi_backend.message)
+        frozen_time.tick(31)
+        available_after_expiry = qi_backend.available
+        qi_backend.get_backend_type()
+
+    # Assert
+    assert available_before_expiry
+    assert not available_after_expiry
+    get_backend_type.assert_awaited_once()
+
+
+def test_qi_backend_refresh(mocker: MockerFixture) -> None:
+    # Arrange
+    refreshed_backend_type = create_backend_type(max_number_of_shots=10)
+    get_backend_type = mocker.patch.object(
+        QIBackend, "_get_backend_type", new_callable=AsyncMock, return_value=refreshed_backend_type
+    )
+    qi_backend = QIBackend(backend_type=create_backend_type())
+
+    # Act
+    backend_type = qi_backend.refresh()
+
+    # Assert
+    assert backend_type is refreshed_backend_type
+    assert qi_backend.get_backend_type() is refreshed_backend_type
+    get_backend_type.assert_awaited_once()
+
+
 @pytest.mark.parametrize("backend_online", [True, False])  # Test cases for backend being available and offline
 def test_qi_backend_run_backend_status(
     qi_job_mock: MagicMock, qi_backend_factory: Callable[..., QIBackend], backend_online: bool
@@ -172,6 +216,126 @@ def test_qi_backend_run_backend_status(
             qi_backend.run(qc)
 
 
+def test_qi_backend_run_shards_oversized_batch(
+    mocker: MockerFixture, qi_job_mock: MagicMock, qi_backend_factory: Callable[..., QIBackend]
+) -> None:
+    # Arrange
+    sharded_job = MagicMock()
+    sharded_job_class = mocker.patch("qiskit_quantuminspire.qi_backend.QIShardedJob", return_value=sharded_job)
+    qi_backend = qi_backend_factory()  # max_jobs_per_batch_job is 5
+    circuits = [QuantumCircuit(2, 2) for _ in range(6)]
+
+    # Act
+    job = qi_backend.run(circuits)
+
+    # Assert
+    sharded_job_class.assert_called_once_with(run_input=circuits, backend=qi_backend, session=None)
+    sharded_job.submit.assert_called_once()
+    qi_job_mock.submit.assert_not_called()
+    assert job is sharded_job
+
+
+def test_qi_backend_session(mocker: MockerFixture, qi_backend_factory: Callable[..., QIBackend]) -> None:
+    # Arrange
+    qi_job_class = mocker.patch("qiskit_quantuminspire.qi_backend.QIJob")
+    qi_backend = qi_backend_factory()
+    qc = QuantumCircuit(2, 2)
+
+    # Act
+    with qi_backend.session(reuse_algorithm=True) as session:
+        session.run(qc)
+        qi_backend.run(qc)
+        with pytest.raises(RuntimeError):
+            qi_backend.session().__enter__()
+    qi_backend.run(qc)
+
+    # Assert
+    assert [call.kwargs["session"] for call in qi_job_class.call_args_list] == [session, session, None]
+    assert qi_backend.active_session is None
+    with pytest.raises(RuntimeError):
+        session.run(qc)
+
+
+def test_qi_backend_run_parameter_binds(mocker: MockerFixture, qi_backend_factory: Callable[..., QIBackend]) -> None:
+    # Arrange
+    mocker.patch("qiskit_quantuminspire.qi_jobs.QIJob.submit")
+    qi_backend = qi_backend_factory()
+    theta = Parameter("theta")
+    parameterized = QuantumCircuit(1, 1)
+    parameterized.rx(theta, 0)
+    fixed = QuantumCircuit(1, 1)
+
+    # Act
+    job = qi_backend.run([parameterized, fixed], parameter_binds=[{theta: [0.1, 0.2, 0.3]}, {}])
+
+    # Assert
+    assert [circuit_data.circuit for circuit_data in job.circuits_run_data] == [parameterized] * 3 + [fixed]
+    assert [circuit_data.cqasm for circuit_data in job.circuits_run_data] == [
+        dumps(parameterized.assign_parameters([0.1])),
+        dumps(parameterized.assign_parameters([0.2])),
+        dumps(parameterized.assign_parameters([0.3])),
+        dumps(fixed),
+    ]
+
+
+def test_qi_backend_run_circuit_shots(mocker: MockerFixture, qi_backend_factory: Callable[..., QIBackend]) -> None:
+    # Arrange
+    mocker.patch("qiskit_quantuminspire.qi_jobs.QIJob.submit")
+    qi_backend = qi_backend_factory()
+    theta = Parameter("theta")
+    parameterized = QuantumCircuit(1, 1)
+    parameterized.rx(theta, 0)
+
+    # Act
+    job = qi_backend.run(
+        [parameterized, QuantumCircuit(1, 1)], parameter_binds=[{theta: [0.1, 0.2]}, {}], circuit_shots=[10, 20]
+    )
+
+    # Assert
+    assert [circuit_data.number_of_shots for circuit_data in job.circuits_run_data] == [10, 10, 20]
+    with pytest.raises(ValueError):
+        qi_backend.run([QuantumCircuit(1), QuantumCircuit(1)], circuit_shots=[10])
+
+
+def test_qi_backend_run_parameter_binds_for_each_circuit(qi_backend_factory: Callable[..., QIBackend]) -> None:
+    # Arrange
+    qi_backend = qi_backend_factory()
+
+    # Act / Assert
+    with pytest.raises(ValueError):
+        qi_backend.run([QuantumCircuit(1), QuantumCircuit(1)], parameter_binds=[{}])
+
+
+def test_qi_backend_run_async(mocker: MockerFixture) -> None:
+    # Arrange
+    qi_backend = QIBackend(backend_type=create_backend_type())
+    job = MagicMock(submit_async=AsyncMock())
+    qi_job_class = mocker.patch("qiskit_quantuminspire.qi_backend.QIJob", return_value=job)
+    qc = QuantumCircuit(2, 2)
+
+    # Act
+    submitted_job = asyncio.run(qi_backend.run_async(qc, shots=100))
+
+    # Assert
+    qi_job_class.assert_called_once_with(run_input=qc, backend=qi_backend, session=None)
+    job.submit_async.assert_awaited_once()
+    job.submit.assert_not_called()
+    assert qi_backend.options.get("shots") == 100
+    assert submitted_job is job
+
+
+def test_qi_backend_run_async_backend_offline(mocker: MockerFixture) -> None:
+    # Arrange
+    offline_backend_type = create_backend_type().model_copy(update={"status": BackendStatus.OFFLINE})
+    qi_backend = QIBackend(backend_type=create_backend_type(), backend_type_ttl=0)
+    mocker.patch.object(qi_backend, "_get_backend_type", return_value=offline_backend_type)
+
+    # Act / Assert
+    with pytest.raises(RuntimeError):
+        asyncio.run(qi_backend.run_async(QuantumCircuit(2, 2)))
+    assert qi_backend.get_backend_type() is offline_backend_type
+
+
 def test_qi_backend_run_updates_shots(qi_job_mock: MagicMock, qi_backend_factory: Callable[..., QIBackend]) -> None:
     # Arrange
     qi_backend = qi_backend_factory()
@@ -190,6 +354,9 @@ def test_qi_backend_run_updates_shots(qi_job_mock: MagicMock, qi_backend_factory
         ("unsupported_option", True, AttributeError),
         ("memory", True, ValueError),
         ("seed_simulator", 1, ValueError),
+        ("submit_concurrency", 0, ValueError),
+        ("submission_mode", "per_shot", ValueError),
+        ("memory_format", "binary", ValueError),
     ],
 )
 def test_qi_backend_run_with_unsupported_options(
@@ -1,21 +1,36 @@
 import asyncio
+import gc
 import tempfile
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import Any, List, Optional, Union
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
-from compute_api_client import JobStatus as QIJobStatus
+from compute_api_client import BatchJobStatus, JobStatus as QIJobStatus
+from compute_api_client.exceptions import ApiException, NotFoundException, ServiceException
 from pytest_mock import MockerFixture
 from qiskit import QuantumCircuit, qpy
+from qiskit.circuit import Parameter
 from qiskit.providers import BackendV2
 from qiskit.providers.exceptions import JobTimeoutError
 from qiskit.providers.jobstatus import JobStatus
 from qiskit.result.models import ExperimentResult, ExperimentResultData
 from qiskit.result.result import Result
 
+from qiskit_quantuminspire import cqasm
+from qiskit_quantuminspire.api_client_pool import ApiClientPool
 from qiskit_quantuminspire.base_provider import BaseProvider
+from qiskit_quantuminspire.compile_cache import CompileCache
 from qiskit_quantuminspire.qi_backend import QIBackend
-from qiskit_quantuminspire.qi_jobs import ExperimentFailedWarning, QIJob
+from qiskit_quantuminspire.qi_jobs import ExperimentFailedWarning, QIJob, QIShardedJob, _SubmissionRecorder
+from qiskit_quantuminspire.qi_session import QISession
+from qiskit_quantuminspire.result_cache import ResultCache
+from qiskit_quantuminspire.submission_journal import JournaledCircuit, Submission, SubmissionJournal
+from qiskit_quantuminspire.upload_cache import UploadCache
+from qiskit_quantuminspire.utils import Backoff
 from tests.helpers import create_backend_type, create_raw_job_result
 
 
@@ -41,11 +56,11 @@ class SingleBackendProvider(BaseProvider):
 @pytest.fixture
 def mock_configs_apis(mocker: MockerFixture) -> None:
     mocker.patch(
-        "qiskit_quantuminspire.qi_jobs.config",
+        "qiskit_quantuminspire.api_client_pool.config",
         return_value=MagicMock(),
     )
     mocker.patch(
-        "qiskit_quantuminspire.qi_jobs.ApiClient",
+        "qiskit_quantuminspire.api_client_pool.ApiClient",
         autospec=True,
     )
 
@@ -62,12 +77,13 @@ def backend(mocker: MockerFixture) -> MagicMock:
 
     def get_mock(var: str, default: Any = None) -> Any:
         options = {"number_of_shots": 1000}
-        return options.get(var)
+        return options.get(var, default)
 
     backend_mock.options.get = get_mock
     backend_mock.id = 0
     backend_mock.name = "qi_backend_1"
     backend_mock.get_backend_type = MagicMock(return_value=create_backend_type())
+    backend_mock.get_backend_type_async = AsyncMock(return_value=create_backend_type())
     return backend_mock
 
 
@@ -101,6 +117,22 @@ def test_result_blocking_timeout(mocker: MockerFixture) -> None:
         job.result(timeout=0.00001)
 
 
+def test_result_timeout_includes_waiting_for_lock(mocker: MockerFixture) -> None:
+    # Arrange
+    job = QIJob(run_input=QuantumCircuit(2, 2), backend=None)
+    # another thread held the result lock for 3 seconds
+    mocker.patch("qiskit_quantuminspire.qi_jobs.time").monotonic.side_effect = [100.0, 103.0]
+    wait_for_final_state = mocker.patch.object(job, "wait_for_final_state")
+    mocker.patch.object(job, "_fetch_job_results")
+    mocker.patch.object(job, "_process_results", return_value=MagicMock())
+
+    # Act
+    job.result(timeout=10.0)
+
+    # Assert
+    wait_for_final_state.assert_called_once_with(timeout=7.0)
+
+
 def test_result_non_blocking(mocker: MockerFixture, mock_api_client: MagicMock, mock_batchjob_api: MagicMock) -> None:
     job = QIJob(run_input="", backend=None)
     mocker.patch.object(job, "done", return_value=False)
@@ -110,6 +142,81 @@ def test_result_non_blocking(mocker: MockerFixture, mock_api_client: MagicMock,
     mock_wait_for_final_state.assert_not_called()
 
 
+def test_result_single_flight_across_threads(mocker: MockerFixture) -> None:
+    # Arrange
+    job = QIJob(run_input=QuantumCircuit(2, 2), backend=None)
+    mocker.patch.object(job, "wait_for_final_state")
+    fetching = threading.Event()
+    release = threading.Event()
+
+    async def fetch_job_results() -> None:
+        fetching.set()
+        release.wait(timeout=5)
+
+    fetch = mocker.patch.object(job, "_fetch_job_results", side_effect=fetch_job_results)
+    mocker.patch.object(job, "_process_results", side_effect=lambda: MagicMock())
+
+    # Act
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(job.result) for _ in range(4)]
+        fetching.wait(timeout=5)
+        release.set()
+        results = [future.result() for future in futures]
+
+    # Assert
+    fetch.assert_called_once()
+    assert all(result is results[0] for result in results)
+
+
+def test_result_async_single_flight(mocker: MockerFixture) -> None:
+    # Arrange
+    job = QIJob(run_input=QuantumCircuit(2, 2), backend=None)
+    mocker.patch.object(job, "wait_for_final_state_async")
+    fetch = mocker.patch.object(job, "_fetch_job_results")
+    mocker.patch.object(job, "_process_results", side_effect=lambda: MagicMock())
+
+    async def results() -> List[Result]:
+        return list(await asyncio.gather(*(job.result_async() for _ in range(3))))
+
+    # Act
+    first, second, third = asyncio.run(results())
+
+    # Assert
+    fetch.assert_awaited_once()
+    assert first is second is third
+    assert job.result() is first
+
+
+def test_result_is_released_with_job(mocker: MockerFixture) -> None:
+    # Arrange
+    job = QIJob(run_input=QuantumCircuit(2, 2), backend=None)
+    mocker.patch.object(QIJob, "wait_for_final_state")
+    mocker.patch.object(QIJob, "_fetch_job_results")
+    mocker.patch.object(QIJob, "_process_results", return_value=MagicMock())
+    job.result()
+    job_ref = weakref.ref(job)
+
+    # Act
+    del job
+    gc.collect()
+
+    # Assert
+    assert job_ref() is None
+
+
+def test_result_retries_after_failure(mocker: MockerFixture) -> None:
+    # Arrange
+    job = QIJob(run_input=QuantumCircuit(2, 2), backend=None)
+    mocker.patch.object(job, "wait_for_final_state", side_effect=[JobTimeoutError("timeout"), None])
+    mocker.patch.object(job, "_fetch_job_results")
+    mocker.patch.object(job, "_process_results", return_value=MagicMock())
+
+    # Act / Assert
+    with pytest.raises(JobTimeoutError):
+        job.result()
+    assert job.result() is not None
+
+
 @pytest.mark.parametrize(
     "circuits, expected_n_jobs",
     [
@@ -158,6 +265,47 @@ def test_fetch_job_result_handles_invalid_results(
     mock_fetch_failed_jobs_message.assert_awaited_once()
 
 
+def test_result_uses_result_cache(
+    page_reader_mock: AsyncMock, mock_configs_apis: None, mocker: MockerFixture, backend: MagicMock, tmp_path: Path
+) -> None:
+    # Arrange
+    mocker.patch("qiskit_quantuminspire.qi_jobs.config", return_value=MagicMock(host="https://host"))
+    result_cache = ResultCache(tmp_path / "results.sqlite")
+    backend.options.get = lambda name, default=None: result_cache if name == "result_cache" else default
+
+    def submitted_job() -> QIJob:
+        job = QIJob(run_input=[QuantumCircuit(1, 1), QuantumCircuit(1, 1)], backend=backend)
+        job.batch_job_id = 5
+        for job_id, circuit_data in enumerate(job.circuits_run_data, start=1):
+            circuit_data.job_id = job_id
+        return job
+
+    job = submitted_job()
+    mocker.patch.object(job, "wait_for_final_state")
+    page_reader_mock.get_all.side_effect = [[create_raw_job_result(results={"0": 1})], []]
+
+    def fetch_failed_jobs_message(api_client: MagicMock, job_ids: List[int]) -> None:
+        job.circuits_run_data[1].system_message = {"message": "No Results"}
+
+    mocker.patch.object(job, "_fetch_failed_jobs_message", side_effect=fetch_failed_jobs_message)
+    with pytest.warns(ExperimentFailedWarning):
+        job.result()
+    page_reader_mock.get_all.reset_mock()
+
+    # Act
+    # e.g. restored with QIJob.deserialize in another process
+    restored_job = submitted_job()
+    wait_for_final_state = mocker.patch.object(restored_job, "wait_for_final_state")
+    with pytest.warns(ExperimentFailedWarning):
+        restored_job.result()
+
+    # Assert
+    wait_for_final_state.assert_not_called()
+    page_reader_mock.get_all.assert_not_called()
+    assert restored_job.circuits_run_data[0].results == job.circuits_run_data[0].results
+    assert restored_job.circuits_run_data[1].system_message == {"message": "No Results"}
+
+
 def test_fetch_failed_jobs_message(
     mocker: MockerFixture,
 ) -> None:
@@ -267,6 +415,51 @@ def test_process_results_raw_data(
     assert processed_results.data(qc) == experiment_data.to_dict()
 
 
+@pytest.mark.parametrize(
+    "memory_format, expected_memory",
+    [
+        ("hex", ["0x0", "0x1", "0x3", "0x3"]),
+        ("bitstring", ["000", "001", "011", "011"]),
+    ],
+)
+def test_process_results_memory_format(backend: MagicMock, memory_format: str, expected_memory: List[str]) -> None:
+    # Arrange
+    qc = QuantumCircuit(3, 3)
+    backend.options.get = lambda var, default=None: {"memory_format": memory_format}.get(var, default)
+    qi_job = QIJob(run_input=qc, backend=backend)
+    qi_job.circuits_run_data[0].results = create_raw_job_result(
+        results={"000": 1, "001": 1, "011": 2}, raw_data=["000", "001", "011", "011"]
+    )
+
+    # Act
+    processed_results = qi_job._process_results()
+
+    # Assert
+    assert processed_results.data(qc)["memory"] == expected_memory
+    assert processed_results.get_memory(qc) == ["000", "001", "011", "011"]
+
+
+def test_process_results_packed_memory(backend: MagicMock) -> None:
+    # Arrange
+    qc = QuantumCircuit(10, 10)
+    backend.options.get = lambda var, default=None: {"memory_format": "packed"}.get(var, default)
+    qi_job = QIJob(run_input=qc, backend=backend)
+    qi_job.circuits_run_data[0].results = create_raw_job_result(
+        results={"0000000000": 1, "1000000011": 2}, raw_data=["1000000011", "0000000000", "1000000011"]
+    )
+
+    # Act
+    processed_results = qi_job._process_results()
+
+    # Assert
+    bit_array = processed_results.data(qc)["bit_array"]
+    assert "memory" not in processed_results.data(qc)
+    assert bit_array.num_bits == 10
+    assert bit_array.array.tolist() == [[2, 3], [0, 0], [2, 3]]
+    assert bit_array.get_counts() == {"1000000011": 2, "0000000000": 1}
+    assert processed_results.get_counts(qc) == {"0000000000": 1, "1000000011": 2}
+
+
 def test_process_results_handles_invalid_results(
     backend: MagicMock,
 ) -> None:
@@ -364,86 +557,1187 @@ def test_submit_multiple_jobs(
     assert mock_batchjob_api.enqueue_batch_job_batch_jobs_id_enqueue_patch.call_count == 1
 
 
-def test_check_backendtype_job_limits(backend: MagicMock) -> None:
-    run_input = [QuantumCircuit()] * 6
+def test_submit_reuses_cached_metadata(
+    mock_api_client: MagicMock,
+    mock_language_api: MagicMock,
+    mock_job_api: MagicMock,
+    mock_batchjob_api: MagicMock,
+    backend: MagicMock,
+) -> None:
+    for _ in range(3):
+        QIJob(run_input=QuantumCircuit(), backend=backend).submit()
+
+    mock_language_api.read_languages_languages_get.assert_awaited_once()
+    assert mock_job_api.create_job_jobs_post.call_count == 3
+
+
+@pytest.mark.parametrize("concurrency", [1, 3, 16])
+def test_submit_pipeline_bounds_concurrency(concurrency: int) -> None:
+    job = QIJob(run_input=[QuantumCircuit() for _ in range(10)], backend=None)
+    in_flight = 0
+    max_in_flight = 0
+    progress: List[tuple[int, int]] = []
+
+    async def submit_circuit(circuit_data: Any) -> None:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        circuit_data.job_id = 1
+
+    def progress_callback(uploaded: int, total: int) -> None:
+        progress.append((uploaded, total))
+
+    asyncio.run(job._run_submit_pipeline(submit_circuit, concurrency=concurrency, progress_callback=progress_callback))
+
+    assert max_in_flight == min(concurrency, 10)
+    assert all(circuit_data.job_id == 1 for circuit_data in job.circuits_run_data)
+    assert progress == [(n, 10) for n in range(1, 11)]
+
+
+def test_submit_pipeline_stops_on_error() -> None:
+    job = QIJob(run_input=[QuantumCircuit() for _ in range(10)], backend=None)
+    submitted = 0
+
+    async def submit_circuit(circuit_data: Any) -> None:
+        nonlocal submitted
+        submitted += 1
+        if submitted == 2:
+            raise RuntimeError("upload failed")
+        # an upload that is still in flight when the other one fails
+        await asyncio.Event().wait()
+
+    async def run_pipeline() -> None:
+        with pytest.raises(RuntimeError, match="upload failed"):
+            await job._run_submit_pipeline(submit_circuit, concurrency=2)
+        # the cancelled workers have stopped before the error is raised
+        assert asyncio.all_tasks() == {asyncio.current_task()}
+
+    asyncio.run(run_pipeline())
+
+    assert submitted < 10
+
+
+@pytest.mark.parametrize("reuse_algorithm, expected_algorithms", [(False, 4), (True, 1)])
+def test_submit_in_session_reuses_project(
+    mock_api_client: MagicMock,
+    mock_language_api: MagicMock,
+    mock_project_api: MagicMock,
+    mock_algorithms_api: MagicMock,
+    mock_job_api: MagicMock,
+    mock_batchjob_api: MagicMock,
+    backend: MagicMock,
+    reuse_algorithm: bool,
+    expected_algorithms: int,
+) -> None:
+    session = QISession(backend, reuse_algorithm=reuse_algorithm)
+
+    QIJob(run_input=[QuantumCircuit(), QuantumCircuit()], backend=backend, session=session).submit()
+    QIJob(run_input=[QuantumCircuit(), QuantumCircuit()], backend=backend, session=session).submit()
+
+    assert mock_project_api.create_project_projects_post.call_count == 1
+    assert mock_algorithms_api.create_algorithm_algorithms_post.call_count == expected_algorithms
+    assert mock_job_api.create_job_jobs_post.call_count == 4
+    assert session.project_id == 1
+
+
+def test_submit_converts_circuits_with_workers(
+    mocker: MockerFixture,
+    mock_api_client: MagicMock,
+    mock_language_api: MagicMock,
+    mock_files_api: MagicMock,
+    mock_job_api: MagicMock,
+    mock_batchjob_api: MagicMock,
+    backend: MagicMock,
+) -> None:
+    backend.options.get = lambda var, default=None: {"cqasm_workers": 3}.get(var, default)
+    dumps_many = mocker.patch("qiskit_quantuminspire.qi_jobs.cqasm.dumps_many", return_value=["cqasm 1", "cqasm 2"])
+    run_input = [QuantumCircuit(1), QuantumCircuit(2)]
     job = QIJob(run_input=run_input, backend=backend)
-    with pytest.raises(ValueError):
-        job.submit()
 
+    job.submit()
 
-def test_job_status(
+    dumps_many.assert_called_once_with(run_input, 3)
+    assert [call[0][0].content for call in mock_files_api.create_file_files_post.call_args_list] == [
+        "cqasm 1",
+        "cqasm 2",
+    ]
+    assert all(circuit_data.cqasm is None for circuit_data in job.circuits_run_data)
+
+
+def test_submit_cancels_conversion_when_submission_fails(
     mocker: MockerFixture,
+    mock_api_client: MagicMock,
+    mock_language_api: MagicMock,
+    mock_project_api: MagicMock,
+    backend: MagicMock,
+) -> None:
+    # Arrange
+    cancelled = []
+
+    async def convert_circuits(*args: Any) -> None:
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    async def create_project(*args: Any) -> None:
+        await asyncio.sleep(0)
+        raise ConnectionError()
+
+    job = QIJob(run_input=[QuantumCircuit(1)], backend=backend)
+    mocker.patch.object(job, "_convert_circuits", convert_circuits)
+    mock_project_api.create_project_projects_post.side_effect = create_project
+
+    # Act / Assert
+    async def submit() -> None:
+        with pytest.raises(ConnectionError):
+            await job._submit_async()
+        # cancelled by the submission, not by the shutdown of the event loop
+        assert cancelled == [True]
+
+    asyncio.run(submit())
+
+
+def test_submit_uses_compile_cache(
+    mock_api_client: MagicMock,
+    mock_language_api: MagicMock,
+    mock_files_api: MagicMock,
+    mock_job_api: MagicMock,
+    mock_batchjob_api: MagicMock,
+    backend: MagicMock,
+) -> None:
+    compile_cache = CompileCache()
+    backend.options.get = lambda var, default=None: {"compile_cache": compile_cache}.get(var, default)
+
+    QIJob(run_input=[QuantumCircuit(1), QuantumCircuit(1)], backend=backend).submit()
+
+    assert len(compile_cache) == 1
+    assert compile_cache.stats.hits == 1
+    assert [call[0][0].content for call in mock_files_api.create_file_files_post.call_args_list] == [
+        cqasm.dumps(QuantumCircuit(1))
+    ] * 2
+
+
+def test_submit_per_batch(
     mock_api_client: MagicMock,
     mock_language_api: MagicMock,
     mock_project_api: MagicMock,
     mock_algorithms_api: MagicMock,
     mock_commits_api: MagicMock,
     mock_files_api: MagicMock,
-    mock_batchjob_api: MagicMock,
     mock_job_api: MagicMock,
+    mock_batchjob_api: MagicMock,
     backend: MagicMock,
 ) -> None:
-    qc = QuantumCircuit()
-    job = QIJob(run_input=qc, backend=backend)
+    backend.options.get = lambda var, default=None: {"submission_mode": "per_batch"}.get(var, default)
+    job = QIJob(run_input=[QuantumCircuit(), QuantumCircuit(), QuantumCircuit()], backend=backend)
 
-    status = job.status()
+    job.submit()
 
-    assert status == JobStatus.QUEUED
+    assert mock_algorithms_api.create_algorithm_algorithms_post.call_count == 1
+    assert mock_commits_api.create_commit_commits_post.call_count == 1
+    assert mock_files_api.create_file_files_post.call_count == 3
+    assert all(call[0][0].commit_id == 1 for call in mock_files_api.create_file_files_post.call_args_list)
+    assert mock_job_api.create_job_jobs_post.call_count == 3
+    assert [circuit_data.job_id for circuit_data in job.circuits_run_data] == [1, 1, 1]
 
 
-def test_serialize_deserialize(backend: MagicMock) -> None:
-    # Arrange
-    qc1 = QuantumCircuit(3)
-    qc2 = QuantumCircuit(3)
+def test_submit_with_circuit_shots(
+    mock_api_client: MagicMock,
+    mock_language_api: MagicMock,
+    mock_project_api: MagicMock,
+    mock_algorithms_api: MagicMock,
+    mock_commits_api: MagicMock,
+    mock_files_api: MagicMock,
+    mock_job_api: MagicMock,
+    mock_batchjob_api: MagicMock,
+    backend: MagicMock,
+) -> None:
+    backend.options.get = lambda var, default=None: {"shots": 100}.get(var, default)
+    job = QIJob(run_input=[QuantumCircuit(1), QuantumCircuit(2)], backend=backend)
+    job.circuits_run_data[1].number_of_shots = 200
 
-    qc2.h([0, 1])
-    qc2.measure_all()
+    job.submit()
 
-    qc1.x(0)
-    qc1.y(1)
-    qc1.z(2)
-    qc1.measure_all()
+    assert sorted(call[0][0].number_of_shots for call in mock_job_api.create_job_jobs_post.call_args_list) == [100, 200]
 
-    job = QIJob(run_input=[qc1, qc2], backend=backend)
-    job.circuits_run_data[0].job_id = 1
-    job.circuits_run_data[1].job_id = 2
 
-    # Act
-    with tempfile.TemporaryDirectory() as temp_dir:
-        out_file = temp_dir + "/test.qpy"
-        job.serialize(out_file)
+def test_submit_with_upload_cache_skips_known_circuits(
+    mock_api_client: MagicMock,
+    mock_language_api: MagicMock,
+    mock_project_api: MagicMock,
+    mock_algorithms_api: MagicMock,
+    mock_commits_api: MagicMock,
+    mock_files_api: MagicMock,
+    mock_job_api: MagicMock,
+    mock_batchjob_api: MagicMock,
+    backend: MagicMock,
+) -> None:
+    upload_cache = UploadCache()
+    backend.options.get = lambda var, default=None: {"upload_cache": upload_cache}.get(var, default)
+    qc = QuantumCircuit(1, 1)
+    qc.x(0)
 
-        loaded_job = QIJob.deserialize(SingleBackendProvider(backend), out_file)
+    QIJob(run_input=[qc], backend=backend).submit()
+    QIJob(run_input=[qc, QuantumCircuit(1, 1)], backend=backend).submit()
 
-        # Assert
-        assert loaded_job.circuits_run_data == job.circuits_run_data
-        assert loaded_job.backend() == job.backend()
+    assert len(upload_cache) == 2
+    assert mock_algorithms_api.create_algorithm_algorithms_post.call_count == 2
+    assert mock_files_api.create_file_files_post.call_count == 2
+    assert mock_job_api.create_job_jobs_post.call_count == 3
 
 
-def test_deserialize_raises_error_on_missing_metadata(backend: MagicMock) -> None:
-    # Arrange
-    qc = QuantumCircuit(3)
+@pytest.mark.parametrize(
+    "error",
+    [NotFoundException(status=404), ApiException(status=403), ApiException(status=410), ApiException(status=400)],
+)
+def test_submit_with_upload_cache_reuploads_missing_file(
+    error: ApiException,
+    mock_api_client: MagicMock,
+    mock_language_api: MagicMock,
+    mock_project_api: MagicMock,
+    mock_algorithms_api: MagicMock,
+    mock_commits_api: MagicMock,
+    mock_files_api: MagicMock,
+    mock_job_api: MagicMock,
+    mock_batchjob_api: MagicMock,
+    backend: MagicMock,
+) -> None:
+    upload_cache = UploadCache()
+    backend.options.get = lambda var, default=None: {"upload_cache": upload_cache}.get(var, default)
+    mock_files_api.create_file_files_post.return_value.id = 2
+    qc = QuantumCircuit(1, 1)
+    upload_cache.put(UploadCache.key("https://host", 1, cqasm.dumps(qc)), 1)
+    mock_job_api.create_job_jobs_post.side_effect = [error, MagicMock(id=3)]
+
+    job = QIJob(run_input=[qc], backend=backend)
+    job.submit()
 
-    with tempfile.TemporaryDirectory() as temp_dir:
-        out_file = temp_dir + "/test.qpy"
+    assert mock_files_api.create_file_files_post.call_count == 1
+    assert [call[0][0].file_id for call in mock_job_api.create_job_jobs_post.call_args_list] == [1, 2]
+    assert job.circuits_run_data[0].job_id == 3
+    assert upload_cache.get(UploadCache.key("https://host", 1, cqasm.dumps(qc))) == 2
 
-        # Dump with qpy so that metadata normally added by QIJob.serialize is missing
-        with open(out_file, "wb") as f:
-            qpy.dump([qc], f)
 
-        # Act/Assert
-        with pytest.raises(ValueError):
-            QIJob.deserialize(SingleBackendProvider(backend), out_file)
+@pytest.mark.parametrize("error", [ApiException(status=429), ServiceException(status=500)])
+def test_submit_with_upload_cache_keeps_file_on_other_errors(
+    error: ApiException,
+    mock_api_client: MagicMock,
+    mock_language_api: MagicMock,
+    mock_project_api: MagicMock,
+    mock_algorithms_api: MagicMock,
+    mock_commits_api: MagicMock,
+    mock_files_api: MagicMock,
+    mock_job_api: MagicMock,
+    mock_batchjob_api: MagicMock,
+    backend: MagicMock,
+) -> None:
+    upload_cache = UploadCache()
+    backend.options.get = lambda var, default=None: {"upload_cache": upload_cache}.get(var, default)
+    qc = QuantumCircuit(1, 1)
+    upload_cache.put(UploadCache.key("https://host", 1, cqasm.dumps(qc)), 1)
+    mock_job_api.create_job_jobs_post.side_effect = error
+
+    job = QIJob(run_input=[qc], backend=backend)
+    with pytest.raises(type(error)):
+        job.submit()
 
+    mock_files_api.create_file_files_post.assert_not_called()
+    assert upload_cache.get(UploadCache.key("https://host", 1, cqasm.dumps(qc))) == 1
 
-def test_serialize_on_empty_job_raises_error(backend: MagicMock) -> None:
+
+def test_submit_again_after_failed_enqueue_reuses_batch_job(
+    mock_api_client: MagicMock,
+    mock_language_api: MagicMock,
+    mock_project_api: MagicMock,
+    mock_algorithms_api: MagicMock,
+    mock_commits_api: MagicMock,
+    mock_files_api: MagicMock,
+    mock_job_api: MagicMock,
+    mock_batchjob_api: MagicMock,
+    backend: MagicMock,
+) -> None:
     # Arrange
-    job = QIJob(run_input=[], backend=backend)
+    mock_batchjob_api.enqueue_batch_job_batch_jobs_id_enqueue_patch.side_effect = [RuntimeError(), MagicMock()]
+    mock_batchjob_api.read_batch_jobs_batch_jobs_get.return_value.items[0].status = BatchJobStatus.PLANNED
+    job = QIJob(run_input=[QuantumCircuit(1), QuantumCircuit(2)], backend=backend)
+    with pytest.raises(RuntimeError):
+        job.submit()
+    assert job.batch_job_id is None
 
     # Act
-    with tempfile.TemporaryDirectory() as temp_dir:
-        out_file = temp_dir + "/test.qpy"
+    job.submit()
 
-        # Act/Assert
-        with pytest.raises(ValueError):
-            job.serialize(out_file)
+    # Assert
+    assert mock_project_api.create_project_projects_post.call_count == 1
+    assert mock_batchjob_api.create_batch_job_batch_jobs_post.call_count == 1
+    assert mock_job_api.create_job_jobs_post.call_count == 2
+    assert mock_batchjob_api.enqueue_batch_job_batch_jobs_id_enqueue_patch.await_count == 2
+    assert job.batch_job_id == 1
+
+
+def test_submit_with_journal_resumes_interrupted_submission(
+    mock_api_client: MagicMock,
+    mock_language_api: MagicMock,
+    mock_project_api: MagicMock,
+    mock_algorithms_api: MagicMock,
+    mock_commits_api: MagicMock,
+    mock_files_api: MagicMock,
+    mock_job_api: MagicMock,
+    mock_batchjob_api: MagicMock,
+    backend: MagicMock,
+    tmp_path: Path,
+) -> None:
+    # Arrange
+    journal = SubmissionJournal(tmp_path / "journal.sqlite")
+    options = {"submission_journal": journal, "submit_concurrency": 1, "shots": 100}
+    backend.options.get = lambda var, default=None: options.get(var, default)
+    mock_files_api.create_file_files_post.side_effect = [
+        MagicMock(id=1),
+        ConnectionError(),
+        MagicMock(id=2),
+        MagicMock(id=3),
+    ]
+    mock_job_api.create_job_jobs_post.side_effect = [MagicMock(id=10), MagicMock(id=11), MagicMock(id=12)]
+    mock_batchjob_api.read_batch_jobs_batch_jobs_get.return_value.items[0].status = BatchJobStatus.PLANNED
+    job = QIJob(run_input=[QuantumCircuit(1), QuantumCircuit(2), QuantumCircuit(3)], backend=backend)
+    with pytest.raises(ConnectionError):
+        job.submit()
+    options["shots"] = 200
+
+    # Act
+    job.submit()
+
+    # Assert
+    assert mock_project_api.create_project_projects_post.call_count == 1
+    assert mock_batchjob_api.create_batch_job_batch_jobs_post.call_count == 1
+    # the commit of the circuit whose upload failed is reused
+    assert mock_commits_api.create_commit_commits_post.call_count == 3
+    assert mock_files_api.create_file_files_post.call_count == 4
+    assert [call[0][0].number_of_shots for call in mock_job_api.create_job_jobs_post.call_args_list] == [100] * 3
+    assert [circuit_data.job_id for circuit_data in job.circuits_run_data] == [10, 11, 12]
+    mock_batchjob_api.enqueue_batch_job_batch_jobs_id_enqueue_patch.assert_awaited_once_with(1)
+    assert job.batch_job_id == 1
+    assert journal.pending() == []
+
+
+def test_resume_from_journal(
+    mock_api_client: MagicMock,
+    mock_language_api: MagicMock,
+    mock_project_api: MagicMock,
+    mock_algorithms_api: MagicMock,
+    mock_commits_api: MagicMock,
+    mock_files_api: MagicMock,
+    mock_job_api: MagicMock,
+    mock_batchjob_api: MagicMock,
+    backend: MagicMock,
+    tmp_path: Path,
+) -> None:
+    # Arrange
+    # a submission of another process that crashed after creating the job of the first circuit
+    journal = SubmissionJournal(tmp_path / "journal.sqlite")
+    qc = QuantumCircuit(2, name="bell")
+    qc.h(0)
+    qc.cx(0, 1)
+    submission_id = journal.begin("https://host", backend.name, backend.id, [qc, QuantumCircuit(1)], 100, True)
+    journal.record(submission_id, project_id=1, batch_job_id=5)
+    journal.record_circuit(submission_id, 0, algorithm_id=1, commit_id=1, file_id=1, job_id=7)
+    mock_job_api.create_job_jobs_post.return_value.id = 8
+    mock_batchjob_api.read_batch_jobs_batch_jobs_get.return_value.items[0].status = BatchJobStatus.PLANNED
+
+    # Act
+    job = QIJob.resume(SingleBackendProvider(backend), journal, submission_id)
+    restored = QIJob.resume(SingleBackendProvider(backend), journal, submission_id)
+
+    # Assert
+    mock_project_api.create_project_projects_post.assert_not_called()
+    mock_batchjob_api.create_batch_job_batch_jobs_post.assert_not_called()
+    assert mock_files_api.create_file_files_post.call_count == 1
+    assert mock_job_api.create_job_jobs_post.call_args[0][0].raw_data_enabled
+    mock_batchjob_api.enqueue_batch_job_batch_jobs_id_enqueue_patch.assert_awaited_once_with(5)
+    assert job.circuits_run_data[0].circuit == qc
+    assert [circuit_data.job_id for circuit_data in job.circuits_run_data] == [7, 8]
+    # an enqueued submission is only restored
+    assert [circuit_data.job_id for circuit_data in restored.circuits_run_data] == [7, 8]
+    assert restored.batch_job_id == 5
+
+
+def test_resume_per_batch_reuses_journaled_algorithm(
+    mock_api_client: MagicMock,
+    mock_language_api: MagicMock,
+    mock_project_api: MagicMock,
+    mock_algorithms_api: MagicMock,
+    mock_commits_api: MagicMock,
+    mock_files_api: MagicMock,
+    mock_job_api: MagicMock,
+    mock_batchjob_api: MagicMock,
+    backend: MagicMock,
+    tmp_path: Path,
+) -> None:
+    # Arrange
+    # the process crashed after the shared algorithm was created, before the shared commit was
+    journal = SubmissionJournal(tmp_path / "journal.sqlite")
+    backend.options.get = lambda var, default=None: {"submission_mode": "per_batch"}.get(var, default)
+    submission_id = journal.begin(
+        "https://host", backend.name, backend.id, [QuantumCircuit(1), QuantumCircuit(2)], 100, False
+    )
+    journal.record(submission_id, project_id=1, batch_job_id=5, algorithm_id=3)
+    mock_batchjob_api.read_batch_jobs_batch_jobs_get.return_value.items[0].status = BatchJobStatus.PLANNED
+
+    # Act
+    QIJob.resume(SingleBackendProvider(backend), journal, submission_id)
+
+    # Assert
+    mock_algorithms_api.create_algorithm_algorithms_post.assert_not_called()
+    mock_commits_api.create_commit_commits_post.assert_awaited_once()
+    assert mock_commits_api.create_commit_commits_post.call_args[0][0].algorithm_id == 3
+    assert journal.get(submission_id).commit_id == 1
+
+
+def test_submit_per_batch_journals_algorithm(
+    mock_api_client: MagicMock,
+    mock_language_api: MagicMock,
+    mock_project_api: MagicMock,
+    mock_algorithms_api: MagicMock,
+    mock_commits_api: MagicMock,
+    mock_files_api: MagicMock,
+    mock_job_api: MagicMock,
+    mock_batchjob_api: MagicMock,
+    backend: MagicMock,
+    tmp_path: Path,
+) -> None:
+    # Arrange
+    journal = SubmissionJournal(tmp_path / "journal.sqlite")
+    options = {"submission_journal": journal, "submission_mode": "per_batch"}
+    backend.options.get = lambda var, default=None: options.get(var, default)
+    mock_algorithms_api.create_algorithm_algorithms_post.return_value.id = 4
+    job = QIJob(run_input=[QuantumCircuit(1), QuantumCircuit(2)], backend=backend)
+
+    # Act
+    job.submit()
+
+    # Assert
+    assert job.submission_id is not None
+    assert journal.get(job.submission_id).algorithm_id == 4
+
+
+def test_resume_reuses_job_created_before_crash(
+    mock_api_client: MagicMock,
+    mock_language_api: MagicMock,
+    mock_project_api: MagicMock,
+    mock_algorithms_api: MagicMock,
+    mock_commits_api: MagicMock,
+    mock_files_api: MagicMock,
+    mock_job_api: MagicMock,
+    mock_batchjob_api: MagicMock,
+    page_reader_mock: AsyncMock,
+    backend: MagicMock,
+    tmp_path: Path,
+) -> None:
+    # Arrange
+    # the process crashed after the job of the first circuit was created, before its id was recorded
+    journal = SubmissionJournal(tmp_path / "journal.sqlite")
+    submission_id = journal.begin(
+        "https://host", backend.name, backend.id, [QuantumCircuit(1), QuantumCircuit(2)], 100, False
+    )
+    journal.record(submission_id, project_id=1, batch_job_id=5)
+    journal.record_circuit(submission_id, 0, algorithm_id=1, commit_id=1, file_id=3)
+    page_reader_mock.get_all.return_value = [MagicMock(id=7, file_id=3)]
+    mock_job_api.create_job_jobs_post.return_value.id = 8
+    mock_batchjob_api.read_batch_jobs_batch_jobs_get.return_value.items[0].status = BatchJobStatus.PLANNED
+
+    # Act
+    job = QIJob.resume(SingleBackendProvider(backend), journal, submission_id)
+
+    # Assert
+    assert page_reader_mock.get_all.call_args.kwargs == {"batch_job_id": 5}
+    mock_job_api.create_job_jobs_post.assert_awaited_once()
+    assert mock_job_api.create_job_jobs_post.call_args[0][0].file_id != 3
+    assert [circuit_data.job_id for circuit_data in job.circuits_run_data] == [7, 8]
+    assert journal.get(submission_id).circuits[0].job_id == 7
+
+
+def test_resume_parameter_binds_submission(
+    mock_api_client: MagicMock,
+    mock_language_api: MagicMock,
+    mock_project_api: MagicMock,
+    mock_algorithms_api: MagicMock,
+    mock_commits_api: MagicMock,
+    mock_files_api: MagicMock,
+    mock_job_api: MagicMock,
+    mock_batchjob_api: MagicMock,
+    backend: MagicMock,
+    tmp_path: Path,
+) -> None:
+    # Arrange
+    journal = SubmissionJournal(tmp_path / "journal.sqlite")
+    options = {"submission_journal": journal, "submit_concurrency": 1}
+    backend.options.get = lambda var, default=None: options.get(var, default)
+    theta = Parameter("theta")
+    qc = QuantumCircuit(1, 1)
+    qc.rx(theta, 0)
+    circuits, contents, _ = QIBackend._bind_parameters(qc, [{theta: [0.1, 0.2]}])
+    job = QIJob(run_input=circuits, backend=backend)
+    for circuit_data, content in zip(job.circuits_run_data, contents):
+        circuit_data.cqasm = content
+    mock_files_api.create_file_files_post.side_effect = [MagicMock(id=1), ConnectionError(), MagicMock(id=2)]
+    with pytest.raises(ConnectionError):
+        job.submit()
+    assert job.submission_id is not None
+    mock_batchjob_api.read_batch_jobs_batch_jobs_get.return_value.items[0].status = BatchJobStatus.PLANNED
+
+    # Act
+    # the bound values exist only in the journal in a new process
+    QIJob.resume(SingleBackendProvider(backend), journal, job.submission_id)
+
+    # Assert
+    uploaded = [call[0][0].content for call in mock_files_api.create_file_files_post.call_args_list]
+    assert uploaded == [contents[0], contents[1], contents[1]]
+
+
+def test_submission_recorder(tmp_path: Path) -> None:
+    # Arrange
+    journal = SubmissionJournal(tmp_path / "journal.sqlite")
+    submission_id = journal.begin("https://host", "spin", 1, [QuantumCircuit(1), QuantumCircuit(2)], 100, False)
+    journal.record_circuit(submission_id, 1, file_id=3)
+    recorder = _SubmissionRecorder(journal, journal.get(submission_id))
+
+    # Act
+    async def record() -> None:
+        await recorder.record(project_id=1)
+        await recorder.record_circuit(0, job_id=7)
+        await recorder.finish()
+        # without a journal nothing is recorded
+        await _SubmissionRecorder().record(project_id=2)
+
+    asyncio.run(record())
+
+    # Assert
+    submission = journal.get(submission_id)
+    assert submission.project_id == 1
+    assert submission.circuits[0].job_id == 7
+    assert submission.enqueued
+    assert recorder.circuit(1).file_id == 3
+    assert recorder.circuit(0) == JournaledCircuit()
+    assert _SubmissionRecorder().circuit(0) == JournaledCircuit()
+
+
+def test_restore_journaled_circuits(backend: MagicMock) -> None:
+    # Arrange
+    job = QIJob(run_input=[QuantumCircuit(1), QuantumCircuit(2), QuantumCircuit(3)], backend=backend)
+    job.circuits_run_data[0].job_id = 5
+    submission = Submission(
+        submission_id=1,
+        host="https://host",
+        backend_name="spin",
+        backend_id=1,
+        number_of_shots=None,
+        raw_data_enabled=False,
+        circuits={1: JournaledCircuit(job_id=7), 2: JournaledCircuit(file_id=3, cqasm="version 3.0")},
+    )
+
+    # Act
+    job._restore_journaled_circuits(submission)
+
+    # Assert
+    assert [circuit_data.job_id for circuit_data in job.circuits_run_data] == [None, 7, None]
+    assert [circuit_data.cqasm for circuit_data in job.circuits_run_data] == [None, None, "version 3.0"]
+
+
+def test_get_submission_ids_reuses_journaled_ids(
+    mock_api_client: MagicMock,
+    mock_project_api: MagicMock,
+    mock_batchjob_api: MagicMock,
+    backend: MagicMock,
+    tmp_path: Path,
+) -> None:
+    # Arrange
+    journal = SubmissionJournal(tmp_path / "journal.sqlite")
+    submission_id = journal.begin("https://host", "spin", 1, [QuantumCircuit(1)], 100, False)
+    journal.record(submission_id, project_id=4)
+    job = QIJob(run_input=[QuantumCircuit(1)], backend=backend)
+    recorder = _SubmissionRecorder(journal, journal.get(submission_id))
+
+    # Act
+    ids = asyncio.run(job._get_submission_ids(MagicMock(), 1, recorder))
+
+    # Assert
+    assert ids == (4, 1)
+    mock_project_api.create_project_projects_post.assert_not_called()
+    mock_batchjob_api.create_batch_job_batch_jobs_post.assert_awaited_once()
+    assert journal.get(submission_id).batch_job_id == 1
+
+
+def test_get_circuit_commit_id_records_algorithm_first(
+    mock_api_client: MagicMock,
+    mock_algorithms_api: MagicMock,
+    mock_commits_api: MagicMock,
+    backend: MagicMock,
+    tmp_path: Path,
+) -> None:
+    # Arrange
+    journal = SubmissionJournal(tmp_path / "journal.sqlite")
+    submission_id = journal.begin("https://host", "spin", 1, [QuantumCircuit(1)], 100, False)
+    mock_algorithms_api.create_algorithm_algorithms_post.return_value.id = 4
+    mock_commits_api.create_commit_commits_post.side_effect = ConnectionError()
+    job = QIJob(run_input=[QuantumCircuit(1)], backend=backend)
+    recorder = _SubmissionRecorder(journal, journal.get(submission_id))
+
+    # Act
+    with pytest.raises(ConnectionError):
+        asyncio.run(job._get_circuit_commit_id(MagicMock(), 1, 0, recorder.circuit(0), recorder))
+
+    # Assert
+    assert journal.get(submission_id).circuits[0] == JournaledCircuit(algorithm_id=4)
+    assert asyncio.run(job._get_circuit_commit_id(MagicMock(), 1, 0, JournaledCircuit(commit_id=6), recorder)) == 6
+
+
+def test_resume_uploaded_circuit(backend: MagicMock) -> None:
+    # Arrange
+    job = QIJob(run_input=[QuantumCircuit(1), QuantumCircuit(2)], backend=backend)
+    for circuit_data in job.circuits_run_data:
+        circuit_data.cqasm = "version 3.0"
+    unrecorded_jobs = {3: [7]}
+    create_job = AsyncMock()
+
+    # Act
+    async def resume() -> None:
+        await job._resume_uploaded_circuit(0, 3, unrecorded_jobs, _SubmissionRecorder(), create_job)
+        await job._resume_uploaded_circuit(1, 4, unrecorded_jobs, _SubmissionRecorder(), create_job)
+
+    asyncio.run(resume())
+
+    # Assert
+    assert job.circuits_run_data[0].job_id == 7
+    create_job.assert_awaited_once_with(4)
+    assert [circuit_data.cqasm for circuit_data in job.circuits_run_data] == [None, None]
+
+
+def test_submit_retries_unavailable_platform(
+    mocker: MockerFixture,
+    mock_api_client: MagicMock,
+    mock_language_api: MagicMock,
+    mock_project_api: MagicMock,
+    mock_algorithms_api: MagicMock,
+    mock_commits_api: MagicMock,
+    mock_files_api: MagicMock,
+    mock_job_api: MagicMock,
+    mock_batchjob_api: MagicMock,
+    backend: MagicMock,
+) -> None:
+    # Arrange
+    sleep = mocker.patch("qiskit_quantuminspire.retry.asyncio.sleep", new_callable=AsyncMock)
+    create_job = mock_job_api.create_job_jobs_post
+    create_job.__name__ = "create_job_jobs_post"
+    create_job.side_effect = [ServiceException(status=503), MagicMock(id=1), MagicMock(id=2)]
+    job = QIJob(run_input=[QuantumCircuit(), QuantumCircuit()], backend=backend)
+
+    # Act
+    job.submit()
+
+    # Assert
+    assert create_job.call_count == 3
+    assert mock_files_api.create_file_files_post.call_count == 2
+    sleep.assert_awaited_once()
+    assert {circuit_data.job_id for circuit_data in job.circuits_run_data} == {1, 2}
+
+
+def test_check_backendtype_job_limits(backend: MagicMock) -> None:
+    run_input = [QuantumCircuit()] * 6
+    job = QIJob(run_input=run_input, backend=backend)
+    with pytest.raises(ValueError):
+        job.submit()
+
+
+def test_job_status(
+    mocker: MockerFixture,
+    mock_api_client: MagicMock,
+    mock_language_api: MagicMock,
+    mock_project_api: MagicMock,
+    mock_algorithms_api: MagicMock,
+    mock_commits_api: MagicMock,
+    mock_files_api: MagicMock,
+    mock_batchjob_api: MagicMock,
+    mock_job_api: MagicMock,
+    backend: MagicMock,
+) -> None:
+    qc = QuantumCircuit()
+    job = QIJob(run_input=qc, backend=backend)
+
+    status = job.status()
+
+    assert status == JobStatus.QUEUED
+
+
+def test_async_api(
+    mocker: MockerFixture,
+    mock_api_client: MagicMock,
+    mock_language_api: MagicMock,
+    mock_project_api: MagicMock,
+    mock_algorithms_api: MagicMock,
+    mock_commits_api: MagicMock,
+    mock_files_api: MagicMock,
+    mock_batchjob_api: MagicMock,
+    mock_job_api: MagicMock,
+    backend: MagicMock,
+) -> None:
+    run_async = mocker.patch("qiskit_quantuminspire.api_client_pool.run_async")
+    job = QIJob(run_input=QuantumCircuit(), backend=backend)
+    mocker.patch.object(job, "_fetch_job_results")
+    processed_result = MagicMock()
+    mocker.patch.object(job, "_process_results", return_value=processed_result)
+    statuses = iter([BatchJobStatus.QUEUED, BatchJobStatus.RUNNING, BatchJobStatus.FINISHED])
+    mocker.patch.object(job, "_fetch_batchjob_status", side_effect=lambda: MagicMock(status=next(statuses)))
+
+    async def run_job() -> Result:
+        await job.submit_async()
+        assert await job.status_async() == JobStatus.QUEUED
+        return await job.result_async(timeout=1.0, wait_for_results=True)
+
+    original_sleep = asyncio.sleep
+
+    async def sleep_briefly(delay: float) -> None:
+        await original_sleep(0)
+
+    sleep = mocker.patch("qiskit_quantuminspire.qi_jobs.asyncio.sleep", side_effect=sleep_briefly)
+    result = asyncio.run(run_job())
+
+    assert result is processed_result
+    assert job.batch_job_id == 1
+    assert sleep.call_count == 1
+    # once for the job limits on submission, once for the polling interval
+    assert backend.get_backend_type_async.await_count == 2
+    run_async.assert_not_called()
+
+
+def test_wait_for_final_state_backs_off(mocker: MockerFixture, backend: MagicMock) -> None:
+    # Arrange
+    job = QIJob(run_input=QuantumCircuit(), backend=backend)
+    job.poll_backoff = Backoff(initial=0.5, maximum=30.0, factor=2.0, jitter=0.0)
+    statuses = [JobStatus.QUEUED, JobStatus.QUEUED, JobStatus.QUEUED, JobStatus.RUNNING, JobStatus.DONE]
+    mocker.patch.object(job, "status", side_effect=statuses)
+    sleep = mocker.patch("qiskit_quantuminspire.qi_jobs.time.sleep")
+    callback = MagicMock()
+
+    # Act
+    job.wait_for_final_state(callback=callback)
+
+    # Assert
+    # the interval starts over once the job leaves the queue
+    assert [call.args[0] for call in sleep.call_args_list] == [0.5, 1.0, 2.0, 0.5]
+    assert [call.args[1] for call in callback.call_args_list] == statuses[:-1]
+
+
+def test_wait_for_final_state_interval_is_limited_by_execution_time_limit(
+    mocker: MockerFixture, backend: MagicMock
+) -> None:
+    # Arrange
+    backend.get_backend_type.return_value = create_backend_type().model_copy(update={"job_execution_time_limit": 20})
+    job = QIJob(run_input=QuantumCircuit(), backend=backend)
+    job.poll_backoff = Backoff(initial=1.0, maximum=30.0, factor=4.0, jitter=0.0)
+    mocker.patch.object(job, "status", side_effect=[JobStatus.QUEUED] * 3 + [JobStatus.DONE])
+    sleep = mocker.patch("qiskit_quantuminspire.qi_jobs.time.sleep")
+
+    # Act
+    job.wait_for_final_state()
+
+    # Assert
+    assert [call.args[0] for call in sleep.call_args_list] == [1.0, 2.0, 2.0]
+
+
+def test_wait_for_final_state_fixed_interval(mocker: MockerFixture, backend: MagicMock) -> None:
+    # Arrange
+    job = QIJob(run_input=QuantumCircuit(), backend=backend)
+    mocker.patch.object(job, "status", side_effect=[JobStatus.QUEUED, JobStatus.RUNNING, JobStatus.DONE])
+    sleep = mocker.patch("qiskit_quantuminspire.qi_jobs.time.sleep")
+
+    # Act
+    job.wait_for_final_state(wait=3.0)
+
+    # Assert
+    assert [call.args[0] for call in sleep.call_args_list] == [3.0, 3.0]
+    backend.get_backend_type.assert_not_called()
+
+
+def test_wait_for_final_state_timeout(mocker: MockerFixture, backend: MagicMock) -> None:
+    # Arrange
+    job = QIJob(run_input=QuantumCircuit(), backend=backend)
+    mocker.patch.object(job, "status", return_value=JobStatus.RUNNING)
+    sleep = mocker.patch("qiskit_quantuminspire.qi_jobs.time.sleep")
+
+    # Act / Assert
+    with pytest.raises(JobTimeoutError):
+        job.wait_for_final_state(timeout=0.0)
+    sleep.assert_not_called()
+
+
+def _streaming_job(mocker: MockerFixture, page_reader_mock: AsyncMock, backend: MagicMock) -> QIJob:
+    """A job of three circuits whose QI jobs finish one by one, the second one failing."""
+    mocker.patch("qiskit_quantuminspire.qi_jobs.JobsApi")
+    job = QIJob(run_input=[QuantumCircuit(1, 1, name=f"circuit_{idx}") for idx in range(3)], backend=backend)
+    job.batch_job_id = 1
+    for idx, circuit_data in enumerate(job.circuits_run_data):
+        circuit_data.job_id = 10 + idx
+
+    statuses = iter(
+        [
+            [QIJobStatus.RUNNING, QIJobStatus.PLANNED, QIJobStatus.COMPLETED],
+            [QIJobStatus.COMPLETED, QIJobStatus.FAILED, QIJobStatus.COMPLETED],
+        ]
+    )
+
+    def get_all(api_call: Any, **kwargs: Any) -> List[Any]:
+        if "batch_job_id" in kwargs:
+            return [
+                MagicMock(id=10 + idx, status=status, message="error", trace_id="trace")
+                for idx, status in enumerate(next(statuses))
+            ]
+        return [] if kwargs["job_id"] == 11 else [create_raw_job_result()]
+
+    page_reader_mock.get_all.side_effect = get_all
+    return job
+
+
+def test_iter_results(
+    mocker: MockerFixture, page_reader_mock: AsyncMock, mock_configs_apis: None, backend: MagicMock
+) -> None:
+    # Arrange
+    job = _streaming_job(mocker, page_reader_mock, backend)
+    sleep = mocker.patch("qiskit_quantuminspire.qi_jobs.time.sleep")
+    mocker.patch.object(job, "status", return_value=JobStatus.DONE)
+    mocker.patch.object(job, "_fetch_failed_jobs_message")
+
+    # Act
+    experiments = list(job.iter_results())
+    with pytest.warns(ExperimentFailedWarning):
+        result = job.result()
+
+    # Assert
+    assert [idx for idx, _ in experiments] == [2, 0, 1]
+    assert [experiment.success for _, experiment in experiments] == [True, True, False]
+    assert experiments[0][1].header["name"] == "circuit_2"
+    sleep.assert_called_once()
+    # 2 job listings and 3 result fetches, the full result needs no further requests
+    assert page_reader_mock.get_all.await_count == 5
+    assert result.system_messages == {"circuit_1": {"message": "error", "trace_id": "trace"}}
+
+
+def test_iter_results_async(
+    mocker: MockerFixture, page_reader_mock: AsyncMock, mock_configs_apis: None, backend: MagicMock
+) -> None:
+    # Arrange
+    job = _streaming_job(mocker, page_reader_mock, backend)
+    sleep = mocker.patch("qiskit_quantuminspire.qi_jobs.asyncio.sleep")
+
+    async def collect() -> List[int]:
+        return [idx async for idx, _ in job.iter_results_async()]
+
+    # Act
+    indices = asyncio.run(collect())
+
+    # Assert
+    assert indices == [2, 0, 1]
+    sleep.assert_awaited_once()
+
+
+def test_partial_result(
+    mocker: MockerFixture, page_reader_mock: AsyncMock, mock_configs_apis: None, backend: MagicMock
+) -> None:
+    # Arrange
+    job = _streaming_job(mocker, page_reader_mock, backend)
+
+    # Act
+    partial_result = job.partial_result()
+    with pytest.warns(ExperimentFailedWarning):
+        final_result = asyncio.run(job.partial_result_async())
+
+    # Assert
+    assert [experiment.header["name"] for experiment in partial_result.results] == ["circuit_2"]
+    assert not partial_result.success
+    assert partial_result.status == "Partial result: 1 of 3 experiments finished"
+    assert [experiment.header["name"] for experiment in final_result.results] == [f"circuit_{idx}" for idx in range(3)]
+    assert final_result.status == "Result failed"
+
+
+def test_streamed_results_are_cached(
+    mocker: MockerFixture, page_reader_mock: AsyncMock, mock_configs_apis: None, backend: MagicMock, tmp_path: Path
+) -> None:
+    # Arrange
+    mocker.patch("qiskit_quantuminspire.qi_jobs.config", return_value=MagicMock(host="https://host"))
+    result_cache = ResultCache(tmp_path / "results.sqlite")
+    backend.options.get = lambda name, default=None: result_cache if name == "result_cache" else default
+    job = _streaming_job(mocker, page_reader_mock, backend)
+
+    # Act
+    job.partial_result()
+    cached_after_first_poll = result_cache.get_many("https://host", 1, [10, 11, 12])
+    with pytest.warns(ExperimentFailedWarning):
+        job.partial_result()
+
+    # Assert
+    assert list(cached_after_first_poll) == [12]
+    cached = result_cache.get_many("https://host", 1, [10, 11, 12])
+    assert cached[10].result == job.circuits_run_data[0].results
+    assert cached[11].system_message == {"message": "error", "trace_id": "trace"}
+    assert cached[12].result is not None
+
+
+def test_streaming_results_requires_submitted_job(backend: MagicMock) -> None:
+    job = QIJob(run_input=QuantumCircuit(), backend=backend)
+
+    with pytest.raises(RuntimeError):
+        job.partial_result()
+    with pytest.raises(RuntimeError):
+        next(job.iter_results())
+
+
+def test_result_async_timeout(mocker: MockerFixture, backend: MagicMock) -> None:
+    job = QIJob(run_input=QuantumCircuit(), backend=backend)
+    mocker.patch.object(job, "status_async", return_value=JobStatus.RUNNING)
+
+    with pytest.raises(JobTimeoutError):
+        asyncio.run(job.result_async(timeout=0.0))
+
+
+def test_result_async_without_waiting(mocker: MockerFixture, backend: MagicMock) -> None:
+    job = QIJob(run_input=QuantumCircuit(), backend=backend)
+    mocker.patch.object(job, "status_async", return_value=JobStatus.QUEUED)
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(job.result_async(wait_for_results=False))
+
+
+def test_job_uses_api_client_pool(
+    mocker: MockerFixture,
+    mock_api_client: MagicMock,
+    mock_language_api: MagicMock,
+    mock_project_api: MagicMock,
+    mock_algorithms_api: MagicMock,
+    mock_commits_api: MagicMock,
+    mock_files_api: MagicMock,
+    mock_batchjob_api: MagicMock,
+    mock_job_api: MagicMock,
+    backend: MagicMock,
+) -> None:
+    pool = ApiClientPool(MagicMock(host="https://host"))
+    create_client = mocker.patch.object(pool, "_create_client", return_value=AsyncMock())
+    backend.api_client_pool = pool
+    job = QIJob(run_input=QuantumCircuit(), backend=backend)
+
+    with pool:
+        job.submit()
+        job.status()
+        job.status()
+
+    create_client.assert_called_once()
+    mock_api_client.assert_not_called()
+
+    # Once the pool is closed, every request gets its own client again
+    job.status()
+    mock_api_client.assert_called_once()
+
+
+def test_serialize_deserialize(backend: MagicMock) -> None:
+    # Arrange
+    qc1 = QuantumCircuit(3)
+    qc2 = QuantumCircuit(3)
+
+    qc2.h([0, 1])
+    qc2.measure_all()
+
+    qc1.x(0)
+    qc1.y(1)
+    qc1.z(2)
+    qc1.measure_all()
+
+    job = QIJob(run_input=[qc1, qc2], backend=backend)
+    job.circuits_run_data[0].job_id = 1
+    job.circuits_run_data[1].job_id = 2
+
+    # Act
+    with tempfile.TemporaryDirectory() as temp_dir:
+        out_file = temp_dir + "/test.qpy"
+        job.serialize(out_file)
+
+        loaded_job = QIJob.deserialize(SingleBackendProvider(backend), out_file)
+
+        # Assert
+        assert loaded_job.circuits_run_data == job.circuits_run_data
+        assert loaded_job.backend() == job.backend()
+        # the circuits of the user are not changed
+        assert qc1.metadata == {}
+
+
+def test_serialize_many_deserialize(mocker: MockerFixture, backend: MagicMock, tmp_path: Path) -> None:
+    # Arrange
+    jobs = []
+    for batch_job_id in (1, 2, 3):
+        job = QIJob(run_input=[QuantumCircuit(1, 1), QuantumCircuit(1, 1)], backend=backend)
+        job.batch_job_id = batch_job_id
+        for offset, circuit_data in enumerate(job.circuits_run_data):
+            circuit_data.job_id = 10 * batch_job_id + offset
+            circuit_data.results = create_raw_job_result(results={"0": batch_job_id})
+        jobs.append(job)
+    jobs[2].circuits_run_data[1].results = None
+    provider = SingleBackendProvider(backend)
+
+    # Act
+    QIJob.serialize_many(jobs, tmp_path / "jobs.zip")
+    loaded_job = QIJob.deserialize(provider, tmp_path / "jobs.zip", index=1)
+    loaded_jobs = list(QIJob.deserialize_many(provider, tmp_path / "jobs.zip"))
+
+    # Assert
+    assert loaded_job.circuits_run_data == jobs[1].circuits_run_data
+    assert [job.circuits_run_data for job in loaded_jobs] == [job.circuits_run_data for job in jobs]
+    # finished jobs come back with their results, and don't need the platform to return them
+    status = mocker.patch.object(QIJob, "status")
+    assert loaded_job.result().get_counts(0) == {"0": 2}
+    status.assert_not_called()
+    assert not loaded_jobs[2].circuits_run_data[1].finished
+
+
+def test_serialize_many_without_results(backend: MagicMock, tmp_path: Path) -> None:
+    # Arrange
+    job = QIJob(run_input=QuantumCircuit(1, 1), backend=backend)
+    job.circuits_run_data[0].results = create_raw_job_result()
+
+    # Act
+    QIJob.serialize_many([job], tmp_path / "jobs.zip", include_results=False)
+    loaded_job = QIJob.deserialize(SingleBackendProvider(backend), tmp_path / "jobs.zip")
+
+    # Assert
+    assert loaded_job.circuits_run_data[0].results is None
+
+
+def test_deserialize_raises_error_on_missing_metadata(backend: MagicMock) -> None:
+    # Arrange
+    qc = QuantumCircuit(3)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        out_file = temp_dir + "/test.qpy"
+
+        # Dump with qpy so that metadata normally added by QIJob.serialize is missing
+        with open(out_file, "wb") as f:
+            qpy.dump([qc], f)
+
+        # Act/Assert
+        with pytest.raises(ValueError):
+            QIJob.deserialize(SingleBackendProvider(backend), out_file)
+
+
+def test_serialize_on_empty_job_raises_error(backend: MagicMock) -> None:
+    # Arrange
+    job = QIJob(run_input=[], backend=backend)
+
+    # Act
+    with tempfile.TemporaryDirectory() as temp_dir:
+        out_file = temp_dir + "/test.qpy"
+
+        # Act/Assert
+        with pytest.raises(ValueError):
+            job.serialize(out_file)
+
+
+@pytest.fixture
+def sharded_job(mocker: MockerFixture, backend: MagicMock) -> QIShardedJob:
+    """Sharded job over 12 circuits, with shards of 5 circuits and at most 2 batch jobs in the queue."""
+    backend.get_backend_type.return_value = create_backend_type().model_copy(
+        update={"max_jobs_per_batch_job": 5, "batchjobs_per_queue_limit": 2}
+    )
+    backend.get_backend_type_async.return_value = backend.get_backend_type.return_value
+    next_batch_job_id = iter(range(100, 200))
+
+    async def submit_async(self: QIJob) -> None:
+        self.batch_job_id = next(next_batch_job_id)
+        for circuit_data in self.circuits_run_data:
+            circuit_data.job_id = circuit_data.circuit.num_qubits
+
+    mocker.patch.object(QIJob, "_submit_async", submit_async)
+    return QIShardedJob(run_input=[QuantumCircuit(n, n) for n in range(1, 13)], backend=backend)
+
+
+def test_sharded_job_submit_respects_queue_limit(sharded_job: QIShardedJob) -> None:
+    sharded_job.submit()
+
+    assert [len(job.circuits_run_data) for job in sharded_job.jobs] == [5, 5, 2]
+    assert sharded_job.batch_job_ids == [100, 101, None]
+    assert [circuit_data.job_id for circuit_data in sharded_job.circuits_run_data] == [n for n in range(1, 11)] + [
+        None,
+        None,
+    ]
+
+
+def test_sharded_job_submit_async(mocker: MockerFixture, sharded_job: QIShardedJob) -> None:
+    run_async = mocker.patch("qiskit_quantuminspire.api_client_pool.run_async")
+
+    asyncio.run(sharded_job.submit_async())
+
+    assert sharded_job.batch_job_ids == [100, 101, None]
+    run_async.assert_not_called()
+
+
+def test_sharded_job_status_submits_remaining_shards(mocker: MockerFixture, sharded_job: QIShardedJob) -> None:
+    sharded_job.submit()
+    batch_job_statuses = {100: BatchJobStatus.RUNNING, 101: BatchJobStatus.QUEUED}
+
+    async def fetch_batchjob_status(self: QIJob) -> MagicMock:
+        assert self.batch_job_id is not None
+        return MagicMock(status=batch_job_statuses[self.batch_job_id])
+
+    mocker.patch.object(QIJob, "_fetch_batchjob_status", fetch_batchjob_status)
+
+    assert sharded_job.status() == JobStatus.RUNNING
+    assert sharded_job.batch_job_ids == [100, 101, None]
+
+    batch_job_statuses[100] = BatchJobStatus.FINISHED
+    assert sharded_job.status() == JobStatus.QUEUED
+    assert sharded_job.batch_job_ids == [100, 101, 102]
+
+    batch_job_statuses.update({101: BatchJobStatus.FINISHED, 102: BatchJobStatus.FINISHED})
+    assert sharded_job.status() == JobStatus.DONE
+
+
+def test_sharded_job_status_raises_and_retries_failed_shard(mocker: MockerFixture, sharded_job: QIShardedJob) -> None:
+    sharded_job.submit()
+    mocker.patch.object(
+        QIJob, "_fetch_batchjob_status", AsyncMock(return_value=MagicMock(status=BatchJobStatus.FINISHED))
+    )
+    submit_async = QIJob._submit_async
+    mocker.patch.object(QIJob, "_submit_async", autospec=True, side_effect=[RuntimeError("enqueue failed"), None])
+
+    with pytest.raises(RuntimeError, match="enqueue failed"):
+        sharded_job.status()
+    assert sharded_job.batch_job_ids == [100, 101, None]
+
+    mocker.patch.object(QIJob, "_submit_async", submit_async)
+    assert sharded_job.status() == JobStatus.QUEUED
+    assert sharded_job.batch_job_ids == [100, 101, 102]
+
+
+def test_sharded_job_result_timeout_defaults_to_a_minute(mocker: MockerFixture, sharded_job: QIShardedJob) -> None:
+    fetch_result = mocker.patch.object(sharded_job, "_result")
+
+    sharded_job.result()
+
+    fetch_result.assert_called_once_with(True, 60.0)
+
+
+def test_sharded_job_result_keeps_circuit_order(mocker: MockerFixture, sharded_job: QIShardedJob) -> None:
+    sharded_job.submit()
+    sharded_job.jobs[2].batch_job_id = 102
+    mocker.patch.object(sharded_job, "wait_for_final_state", return_value=None)
+
+    async def fetch_job_results(self: QIJob) -> None:
+        for circuit_data in self.circuits_run_data:
+            circuit_data.results = create_raw_job_result(results={"1" * circuit_data.circuit.num_clbits: 100})
+
+    mocker.patch.object(QIJob, "_fetch_job_results", fetch_job_results)
+
+    result = sharded_job.result()
+
+    assert result.job_id == "100,101,102"
+    assert [experiment.header["memory_slots"] for experiment in result.results] == list(range(1, 13))
+    assert [result.get_counts(n) for n in range(12)] == [{"1" * n: 100} for n in range(1, 13)]
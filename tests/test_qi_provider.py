@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from typing import Any
 from unittest.mock import AsyncMock
@@ -5,16 +6,17 @@ from unittest.mock import AsyncMock
 import pytest
 from pytest_mock import MockerFixture
 
+from qiskit_quantuminspire.api_client_pool import ApiClientPool
 from qiskit_quantuminspire.qi_backend import QIBackend
 from qiskit_quantuminspire.qi_provider import QIProvider
+from qiskit_quantuminspire.retry import RetryPolicy
 from tests.helpers import create_backend_type
 
 
 @pytest.fixture
 def backend_repository(mocker: MockerFixture, mock_job_api: Any, page_reader_mock: AsyncMock) -> None:
-    mocker.patch("qiskit_quantuminspire.qi_provider.config")
-    mocker.patch("qiskit_quantuminspire.qi_provider.ApiClient")
-    mock_run_async = mocker.patch("qiskit_quantuminspire.qi_backend.run_async")
+    mocker.patch.object(ApiClientPool, "_create_client", return_value=AsyncMock())
+    mock_run_async = mocker.patch("qiskit_quantuminspire.api_client_pool.run_async")
     mock_run_async.return_value = create_backend_type()
     page_reader_mock.get_all.return_value = [
         create_backend_type(name="qi_backend_1", id=10),
@@ -31,6 +33,19 @@ def test_qi_provider_construct(backend_repository: None) -> None:
     assert all([isinstance(backend, QIBackend) for backend in provider.backends()])
 
 
+def test_qi_provider_retry_policy(backend_repository: None) -> None:
+    # Arrange
+    retry_policy = RetryPolicy(max_attempts=2)
+
+    # Act
+    provider = QIProvider(retry_policy=retry_policy)
+    provider_without_retries = QIProvider(retry_policy=None)
+
+    # Assert
+    assert all(backend.options.retry_policy is retry_policy for backend in provider.backends())
+    assert all(backend.options.retry_policy is None for backend in provider_without_retries.backends())
+
+
 def test_get_backend_by_name(backend_repository: None) -> None:
     # Arrange
     provider = QIProvider()
@@ -85,3 +100,37 @@ def test_get_backend_raises_value_error_if_not_found(name: str, id: int, backend
     # Act / Assert
     with pytest.raises(ValueError):
         provider.get_backend(name="not_existing")
+
+
+def test_refresh_all(backend_repository: None, page_reader_mock: AsyncMock) -> None:
+    # Arrange
+    provider = QIProvider()
+    page_reader_mock.get_all.return_value = [
+        create_backend_type(name="qi_backend_1", id=10, max_number_of_shots=10),
+        create_backend_type(name="spin", id=20, max_number_of_shots=20),
+        create_backend_type(name="new", id=30),
+    ]
+    spin = provider.get_backend(id=20)
+
+    # Act
+    provider.refresh_all()
+
+    # Assert
+    assert page_reader_mock.get_all.call_count == 2
+    assert [backend.id for backend in provider.backends()] == [10, 20, 30]
+    assert provider.get_backend(id=20) is spin
+    assert spin.get_backend_type().max_number_of_shots == 20
+
+
+def test_create_async(backend_repository: None) -> None:
+    # Arrange
+    async def create_provider() -> QIProvider:
+        async with await QIProvider.create_async() as provider:
+            return provider
+
+    # Act
+    provider = asyncio.run(create_provider())
+
+    # Assert
+    assert [backend.id for backend in provider.backends()] == [10, 20]
+    assert provider.api_client_pool.closed
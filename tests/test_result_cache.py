@@ -0,0 +1,88 @@
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from qiskit_quantuminspire.result_cache import CachedResult, ResultCache
+from tests.helpers import create_raw_job_result
+
+
+def test_put_and_get(tmp_path: Path) -> None:
+    # Arrange
+    cache = ResultCache(tmp_path / "results.sqlite")
+    result = create_raw_job_result(raw_data=["01", "10"])
+    message = {"message": "failed", "trace_id": "abc"}
+
+    # Act
+    cache.put_many("https://host", 1, {10: CachedResult(result=result), 11: CachedResult(system_message=message)})
+    found = cache.get_many("https://host", 1, [10, 11, 12])
+
+    # Assert
+    assert found == {10: CachedResult(result=result), 11: CachedResult(system_message=message)}
+    assert cache.get_many("https://other-host", 1, [10]) == {}
+    assert cache.get_many("https://host", 2, [10]) == {}
+    assert len(cache) == 2
+
+
+def test_persists_across_instances(tmp_path: Path) -> None:
+    # Arrange
+    path = tmp_path / "cache" / "results.sqlite"
+    ResultCache(path).put_many("https://host", 1, {10: CachedResult(result=create_raw_job_result())})
+
+    # Act
+    found = ResultCache(path).get_many("https://host", 1, [10])
+
+    # Assert
+    assert found[10].result == create_raw_job_result()
+
+
+def test_evicts_least_recently_used(tmp_path: Path) -> None:
+    # Arrange
+    cache = ResultCache(tmp_path / "results.sqlite")
+    outcome = CachedResult(result=create_raw_job_result())
+    cache.put_many("https://host", 1, {1: outcome})
+    entry_size = cache.size_bytes
+    cache.max_bytes = 2 * entry_size
+    cache.put_many("https://host", 1, {2: outcome})
+    cache.get_many("https://host", 1, [1])
+
+    # Act
+    cache.put_many("https://host", 1, {3: outcome})
+
+    # Assert
+    assert set(cache.get_many("https://host", 1, [1, 2, 3])) == {1, 3}
+    assert cache.size_bytes <= cache.max_bytes
+
+
+def test_invalidate(tmp_path: Path) -> None:
+    # Arrange
+    cache = ResultCache(tmp_path / "results.sqlite")
+    outcome = CachedResult(system_message={"message": "No Results"})
+    cache.put_many("https://host", 1, {1: outcome})
+    cache.put_many("https://host", 2, {2: outcome})
+    cache.put_many("https://other-host", 1, {1: outcome})
+
+    # Act / Assert
+    cache.invalidate("https://host", 1)
+    assert len(cache) == 2
+    cache.invalidate("https://host")
+    assert len(cache) == 1
+    cache.invalidate()
+    assert len(cache) == 0
+
+
+def test_corrupt_entry_is_missing(tmp_path: Path) -> None:
+    # Arrange
+    path = tmp_path / "results.sqlite"
+    cache = ResultCache(path)
+    cache.put_many("https://host", 1, {1: CachedResult(result=create_raw_job_result())})
+    with sqlite3.connect(path) as connection:
+        connection.execute("UPDATE results SET result = ?", (b"garbage",))
+
+    # Act / Assert
+    assert cache.get_many("https://host", 1, [1]) == {}
+
+
+def test_invalid_max_bytes(tmp_path: Path) -> None:
+    with pytest.raises(ValueError):
+        ResultCache(tmp_path / "results.sqlite", max_bytes=0)
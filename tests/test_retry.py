@@ -0,0 +1,122 @@
+import asyncio
+from typing import Any, List
+from unittest.mock import AsyncMock
+
+import aiohttp
+import pytest
+from compute_api_client.exceptions import ApiException, NotFoundException, ServiceException
+from pytest_mock import MockerFixture
+
+from qiskit_quantuminspire.retry import RetryPolicy
+from qiskit_quantuminspire.utils import Backoff
+
+
+@pytest.fixture
+def sleep(mocker: MockerFixture) -> AsyncMock:
+    return mocker.patch("qiskit_quantuminspire.retry.asyncio.sleep", new_callable=AsyncMock)
+
+
+def _api_method(name: str, side_effect: List[Any]) -> AsyncMock:
+    api_method = AsyncMock(side_effect=side_effect)
+    api_method.__name__ = name
+    return api_method
+
+
+def _service_exception(status: int, **headers: str) -> ApiException:
+    exc = ServiceException(status=status, reason="Unavailable")
+    exc.headers = {name.replace("_", "-"): value for name, value in headers.items()}
+    return exc
+
+
+def test_retries_unavailable_create(sleep: AsyncMock) -> None:
+    # Arrange
+    policy = RetryPolicy(backoff=Backoff(initial=1.0, maximum=4.0, factor=2.0, jitter=0.0))
+    create_job = _api_method("create_job_jobs_post", [_service_exception(503), _service_exception(429), "job"])
+
+    # Act
+    job = asyncio.run(policy.wrap(create_job)(obj="job_in"))
+
+    # Assert
+    assert job == "job"
+    assert create_job.await_count == 3
+    create_job.assert_awaited_with(obj="job_in")
+    assert [call.args[0] for call in sleep.await_args_list] == [1.0, 2.0]
+
+
+@pytest.mark.parametrize(
+    "exc",
+    [_service_exception(502), aiohttp.ServerDisconnectedError(), asyncio.TimeoutError()],
+)
+def test_retries_only_idempotent_requests_that_may_have_been_handled(sleep: AsyncMock, exc: Exception) -> None:
+    # Arrange
+    policy = RetryPolicy()
+    read_jobs = _api_method("read_jobs_jobs_get", [exc, "jobs"])
+    create_job = _api_method("create_job_jobs_post", [exc, "job"])
+
+    # Act / Assert
+    assert asyncio.run(policy.wrap(read_jobs)()) == "jobs"
+    with pytest.raises(type(exc)):
+        asyncio.run(policy.wrap(create_job)())
+    create_job.assert_awaited_once()
+
+
+def test_does_not_retry_client_errors(sleep: AsyncMock) -> None:
+    # Arrange
+    read_job = _api_method("read_job_jobs_id_get", [NotFoundException(status=404), "job"])
+
+    # Act / Assert
+    with pytest.raises(NotFoundException):
+        asyncio.run(RetryPolicy().wrap(read_job)(id=1))
+    sleep.assert_not_awaited()
+
+
+def test_honours_retry_after(sleep: AsyncMock) -> None:
+    # Arrange
+    policy = RetryPolicy(max_delay=30.0)
+    create_file = _api_method(
+        "create_file_files_post", [_service_exception(429, Retry_After="7"), _service_exception(429, Retry_After="60")]
+    )
+
+    # Act
+    with pytest.raises(ServiceException):
+        asyncio.run(policy.wrap(create_file)())
+
+    # Assert
+    # the second response asks to wait longer than the policy allows
+    assert create_file.await_count == 2
+    sleep.assert_awaited_once_with(7.0)
+
+
+def test_stops_after_max_attempts(sleep: AsyncMock) -> None:
+    # Arrange
+    read_results = _api_method("read_results_get", [_service_exception(503)] * 5)
+
+    # Act
+    with pytest.raises(ServiceException):
+        asyncio.run(RetryPolicy(max_attempts=3).wrap(read_results)())
+
+    # Assert
+    assert read_results.await_count == 3
+
+
+def test_budget_limits_retries(sleep: AsyncMock) -> None:
+    # Arrange
+    policy = RetryPolicy(budget=2, budget_ratio=0.0)
+    read_jobs = _api_method("read_jobs_jobs_get", [_service_exception(503)] * 10)
+
+    # Act
+    for _ in range(2):
+        with pytest.raises(ServiceException):
+            asyncio.run(policy.wrap(read_jobs)())
+
+    # Assert
+    # the first request used up the budget with two retries, the second request was made once
+    assert read_jobs.await_count == 4
+    assert sleep.await_count == 2
+
+
+def test_invalid_policy() -> None:
+    with pytest.raises(ValueError):
+        RetryPolicy(max_attempts=0)
+    with pytest.raises(ValueError):
+        RetryPolicy(budget=-1)
@@ -0,0 +1,110 @@
+from pathlib import Path
+from typing import List
+
+import pytest
+from qiskit import QuantumCircuit
+
+from qiskit_quantuminspire.submission_journal import JournaledCircuit, SubmissionJournal
+
+
+def _circuits() -> List[QuantumCircuit]:
+    circuit = QuantumCircuit(2, name="bell")
+    circuit.h(0)
+    circuit.cx(0, 1)
+    circuit.measure_all()
+    return [circuit, QuantumCircuit(1, name="empty")]
+
+
+def test_records_ids(tmp_path: Path) -> None:
+    # Arrange
+    journal = SubmissionJournal(tmp_path / "journal.sqlite")
+    submission_id = journal.begin("https://host", "spin", 1, _circuits(), 1024, False)
+
+    # Act
+    journal.record(submission_id, project_id=10, batch_job_id=20, algorithm_id=25)
+    journal.record_circuit(submission_id, 0, algorithm_id=30, commit_id=40)
+    journal.record_circuit(submission_id, 0, file_id=50)
+    journal.record_circuit(submission_id, 1, algorithm_id=31)
+
+    # Assert
+    submission = journal.get(submission_id)
+    assert (submission.host, submission.backend_name, submission.backend_id) == ("https://host", "spin", 1)
+    assert (submission.number_of_shots, submission.raw_data_enabled) == (1024, False)
+    assert (submission.project_id, submission.batch_job_id, submission.algorithm_id, submission.commit_id) == (
+        10,
+        20,
+        25,
+        None,
+    )
+    assert submission.circuits == {
+        0: JournaledCircuit(algorithm_id=30, commit_id=40, file_id=50),
+        1: JournaledCircuit(algorithm_id=31),
+    }
+    assert journal.circuits(submission_id) == _circuits()
+
+
+def test_persists_across_instances(tmp_path: Path) -> None:
+    # Arrange
+    path = tmp_path / "journal" / "journal.sqlite"
+    journal = SubmissionJournal(path)
+    submission_id = journal.begin("https://host", "spin", 1, _circuits(), None, True)
+    journal.record_circuit(submission_id, 1, job_id=60)
+
+    # Act
+    submission = SubmissionJournal(path).get(submission_id)
+
+    # Assert
+    assert submission.circuits == {1: JournaledCircuit(job_id=60)}
+    assert submission.raw_data_enabled
+
+
+def test_records_contents(tmp_path: Path) -> None:
+    # Arrange
+    journal = SubmissionJournal(tmp_path / "journal.sqlite")
+
+    # Act
+    submission_id = journal.begin(
+        "https://host", "spin", 1, _circuits(), 1024, False, ["version 3.0", None], [None, 100]
+    )
+    journal.record_circuit(submission_id, 0, file_id=50)
+
+    # Assert
+    assert journal.get(submission_id).circuits == {
+        0: JournaledCircuit(file_id=50, cqasm="version 3.0"),
+        1: JournaledCircuit(number_of_shots=100),
+    }
+
+
+def test_pending_finish_and_remove(tmp_path: Path) -> None:
+    # Arrange
+    journal = SubmissionJournal(tmp_path / "journal.sqlite")
+    first = journal.begin("https://host", "spin", 1, _circuits(), 1024, False)
+    second = journal.begin("https://host", "spin", 1, _circuits(), 1024, False)
+    journal.record_circuit(first, 0, job_id=1)
+
+    # Act / Assert
+    assert journal.pending() == [first, second]
+    journal.finish(first)
+    assert journal.pending() == [second]
+    assert journal.get(first).enqueued
+    journal.remove(first)
+    assert len(journal) == 1
+    with pytest.raises(KeyError):
+        journal.get(first)
+    with pytest.raises(KeyError):
+        journal.circuits(first)
+
+
+def test_close(tmp_path: Path) -> None:
+    # Arrange
+    path = tmp_path / "journal.sqlite"
+    with SubmissionJournal(path) as journal:
+        submission_id = journal.begin("https://host", "spin", 1, _circuits(), 1024, False)
+
+    # Act
+    journal.close()
+
+    # Assert
+    with pytest.raises(RuntimeError):
+        journal.get(submission_id)
+    assert SubmissionJournal(path).pending() == [submission_id]
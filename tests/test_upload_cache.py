@@ -0,0 +1,109 @@
+from pathlib import Path
+
+import pytest
+
+from qiskit_quantuminspire.upload_cache import UploadCache
+
+
+def test_key_depends_on_host_language_and_content() -> None:
+    keys = {
+        UploadCache.key("https://host", 1, "version 3.0"),
+        UploadCache.key("https://other", 1, "version 3.0"),
+        UploadCache.key("https://host", 2, "version 3.0"),
+        UploadCache.key("https://host", 1, "version 3.0\n"),
+    }
+
+    assert len(keys) == 4
+    assert UploadCache.key("https://host", 1, "version 3.0") in keys
+
+
+def test_get_and_put() -> None:
+    # Arrange
+    cache = UploadCache()
+
+    # Act
+    cache.put("a", 1)
+
+    # Assert
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+
+
+def test_least_recently_used_entry_is_evicted() -> None:
+    # Arrange
+    cache = UploadCache(max_entries=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+
+    # Act
+    cache.get("a")
+    cache.put("c", 3)
+
+    # Assert
+    assert len(cache) == 2
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_invalidate() -> None:
+    # Arrange
+    cache = UploadCache()
+    cache.put("a", 1)
+    cache.put("b", 2)
+
+    # Act / Assert
+    cache.invalidate("a")
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+
+    cache.invalidate()
+    assert len(cache) == 0
+
+
+def test_invalid_max_entries() -> None:
+    with pytest.raises(ValueError):
+        UploadCache(max_entries=0)
+
+
+def test_persistence(tmp_path: Path) -> None:
+    # Arrange
+    path = tmp_path / "cache" / "uploads.json"
+    cache = UploadCache(path=path)
+    cache.put("a", 1)
+    cache.put("b", 2)
+
+    # Act
+    cache.flush()
+    reloaded_cache = UploadCache(path=path, max_entries=1)
+
+    # Assert
+    assert reloaded_cache.get("a") is None
+    assert reloaded_cache.get("b") == 2
+
+
+def test_invalidate_is_persisted(tmp_path: Path) -> None:
+    # Arrange
+    path = tmp_path / "uploads.json"
+    cache = UploadCache(path=path)
+    cache.put("a", 1)
+    cache.flush()
+
+    # Act
+    cache.invalidate()
+
+    # Assert
+    assert len(UploadCache(path=path)) == 0
+
+
+@pytest.mark.parametrize("content", ["not json", '{"version": 0, "entries": [["a", 1]]}', "[]"])
+def test_unreadable_file_is_ignored(tmp_path: Path, content: str) -> None:
+    # Arrange
+    path = tmp_path / "uploads.json"
+    path.write_text(content)
+
+    # Act
+    cache = UploadCache(path=path)
+
+    # Assert
+    assert len(cache) == 0
@@ -1,7 +1,11 @@
+import itertools
+import random
+from typing import Any, Dict
+
 import pytest
 from qiskit.transpiler import CouplingMap
 
-from qiskit_quantuminspire.utils import is_coupling_map_complete
+from qiskit_quantuminspire.utils import Backoff, is_coupling_map_complete
 
 
 @pytest.mark.parametrize(
@@ -19,3 +23,35 @@ from qiskit_quantuminspire.utils import is_coupling_map_complete
 )
 def test_is_coupling_map_complete(coupling_map: CouplingMap, is_complete: bool) -> None:
     assert is_coupling_map_complete(coupling_map) == is_complete
+
+
+def test_backoff_delays_grow_up_to_maximum() -> None:
+    # Arrange
+    backoff = Backoff(initial=1.0, maximum=5.0, factor=2.0, jitter=0.0)
+
+    # Act
+    delays = list(itertools.islice(backoff.delays(), 5))
+
+    # Assert
+    assert delays == [1.0, 2.0, 4.0, 5.0, 5.0]
+
+
+def test_backoff_jitter() -> None:
+    # Arrange
+    backoff = Backoff(initial=1.0, maximum=10.0, factor=1.0, jitter=0.5)
+
+    # Act
+    delays = list(itertools.islice(backoff.delays(random.Random(1)), 100))
+
+    # Assert
+    assert all(0.5 <= delay <= 1.5 for delay in delays)
+    assert len(set(delays)) == 100
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"initial": 0.0}, {"initial": 2.0, "maximum": 1.0}, {"factor": 0.5}, {"jitter": 1.0}, {"jitter": -0.1}],
+)
+def test_backoff_invalid_arguments(kwargs: Dict[str, Any]) -> None:
+    with pytest.raises(ValueError):
+        Backoff(**kwargs)